@@ -1,9 +1,23 @@
+import importlib
 import streamlit as st
-import src.auth
-import src.ui
-import src.home
-import src.data_fetcher
-import src.movie_recommend
+
+# 페이지 모듈은 그 페이지를 처음 열 때 불러옵니다 (새 워커의 첫 화면이 다른 페이지 모듈을 기다리지 않도록).
+PAGES = {
+    "홈": ("src.home", "show_home_page"),
+    "영화 스타일 선택": ("src.ui", "show_profile_setup"),
+    "영화 검색": ("src.ui", "show_movie_search"),
+    "추천 생성": ("src.ui", "show_generated_recommendations"),
+}
+
+def render_page(page):
+    # 렌더링 중 발생한 외부 요청은 페이지에 귀속되어 집계되고, 요청 예산을 넘으면 경고가 출력됩니다.
+    # 목록 섹션은 페이지 지연 예산 안에서만 응답을 기다리고, 넘으면 마지막으로 받은 목록을 표시합니다.
+    # 계측·장애 대응 모듈(httpx 포함)도 헤더와 네비게이션을 그린 뒤 여기서 불러옵니다.
+    from src import metrics, resilience
+    with metrics.page_scope(page), resilience.latency_budget(page):
+        module_name, function_name = PAGES[page]
+        getattr(importlib.import_module(module_name), function_name)()
+    metrics.show_debug_panel(page)
 
 # ---------------- 페이지 설정 ----------------
 st.set_page_config(
@@ -50,14 +64,9 @@ if "selected_page" not in st.session_state:
     st.session_state["selected_page"] = "홈"
 
 # ---------------- 선택한 페이지 실행 ----------------
-if st.session_state["selected_page"] == "홈":
-    src.home.show_home_page()
-elif st.session_state["selected_page"] == "영화 스타일 선택":
-    src.ui.show_profile_setup()
-elif st.session_state["selected_page"] == "영화 검색":
-    src.ui.show_movie_search()
-elif st.session_state["selected_page"] == "추천 생성":
-    src.ui.show_generated_recommendations()
+selected_page = st.session_state["selected_page"]
+if selected_page in PAGES:
+    render_page(selected_page)
 
 # ---------------- 푸터 ----------------
 st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
@@ -0,0 +1,188 @@
+"""📌 장애 시나리오 벤치마크: 느린/죽은 업스트림에서 홈 화면 렌더 시간과 꼬리 지연
+
+    python -m bench.degraded_bench --out bench/degraded-report.json
+
+한 워커 프로세스(AppTest)에서 가짜 업스트림(bench/fake_upstream.py)의 /__config로 장애를 주입하며
+홈 화면을 렌더링합니다. 단계마다 메모리 응답 캐시를 비워 새 워커처럼 만들지만,
+디스크 스냅숏(src.resilience.snapshots)은 남겨 둡니다.
+1) healthy       정상 응답 (스냅숏 저장)
+2) slow          트렌딩·탐색 응답이 --slow-ms만큼 늦음 (지연 예산 적용)
+3) slow_no_budget  같은 상황에서 지연 예산을 끈 경우 (비교용)
+4) outage        모든 요청이 500 (재시도 후 회로 차단)
+5) recovered     장애 해제 후 회로 대기 시간이 지난 뒤
+마지막으로 일부 요청만 크게 늦추고(꼬리 지연) 상세 요청 지연의 p50/p99를 헤지 요청 유무로 비교합니다.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from bench.run_bench import APP_PATH, BENCH_PROFILE, _admin, percentile, start_upstream  # noqa: E402
+
+SLOW_ENDPOINTS = ("trending", "discover")
+STALE_CAPTION = "⏳"
+
+
+def _configure(upstream: str, **settings) -> None:
+    query = "&".join(f"{key}={value}" for key, value in settings.items())
+    _admin(upstream, f"/__config?{query}")
+
+
+def _render(at, upstream: str) -> Dict:
+    from src import resilience
+
+    served = resilience.snapshots.served
+    _admin(upstream, "/__reset")
+    started = time.perf_counter()
+    at.run()
+    wall_ms = (time.perf_counter() - started) * 1000
+    return {
+        "wall_ms": round(wall_ms, 1),
+        "stale_sections": sum(STALE_CAPTION in caption.value for caption in at.caption),
+        "snapshots_served": resilience.snapshots.served - served,
+        "requests": sum(_admin(upstream, "/__stats").values()),
+        "exceptions": len(at.exception),
+    }
+
+
+def tail_latency(upstream: str, count: int, hedging: bool) -> Dict:
+    """📌 꼬리 지연이 있는 상세 요청 count개의 지연 분포 (hedging=False면 헤지 요청을 끔)"""
+    from src import cache, resilience
+    from src.aio import gather_limited, run_sync
+    from src.data_fetcher import _details_request
+    from src.http_client import async_get
+
+    saved = resilience.HEDGE_MAX_RATIO, resilience.HEDGE_BURST
+    if not hedging:
+        resilience.HEDGE_MAX_RATIO, resilience.HEDGE_BURST = 0, 0
+    cache.response_cache.clear()
+    timings: List[float] = []
+
+    async def fetch(movie_id):
+        url, params = _details_request(movie_id)
+        started = time.perf_counter()
+        await async_get(url, params=params)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    offset = 100000 if hedging else 200000  # 두 측정이 같은 영화를 쓰지 않도록
+    try:
+        run_sync(gather_limited(fetch, range(offset, offset + count), 8))
+    finally:
+        resilience.HEDGE_MAX_RATIO, resilience.HEDGE_BURST = saved
+    return {
+        "requests": count,
+        "p50_ms": round(percentile(timings, 50), 1),
+        "p99_ms": round(percentile(timings, 99), 1),
+        "max_ms": round(max(timings), 1),
+    }
+
+
+def run_worker(upstream: str, slow_ms: float, tail_requests: int) -> Dict:
+    from streamlit.testing.v1 import AppTest
+    from src import cache, resilience
+
+    at = AppTest.from_file(APP_PATH, default_timeout=300)
+    at.secrets["MOVIEDB_API_KEY"] = "bench"
+    at.session_state["selected_page"] = "홈"
+    at.session_state["user_profile"] = BENCH_PROFILE
+
+    phases = {}
+    phases["healthy"] = _render(at, upstream)
+
+    for endpoint in SLOW_ENDPOINTS:
+        _configure(upstream, endpoint=endpoint, endpoint_latency_ms=slow_ms)
+    cache.response_cache.clear()
+    phases["slow"] = _render(at, upstream)
+    time.sleep(slow_ms / 1000)  # 예산을 넘긴 요청이 백그라운드에서 끝나 캐시·스냅숏을 갱신할 때까지
+    phases["slow_refreshed"] = _render(at, upstream)
+
+    cache.response_cache.clear()
+    resilience.LATENCY_BUDGETS_ENABLED = False
+    phases["slow_no_budget"] = _render(at, upstream)
+    resilience.LATENCY_BUDGETS_ENABLED = True
+    for endpoint in SLOW_ENDPOINTS:
+        _configure(upstream, endpoint=endpoint)
+
+    _configure(upstream, error_rate=1)
+    cache.response_cache.clear()
+    phases["outage"] = _render(at, upstream)
+    phases["outage_breaker_open"] = _render(at, upstream)
+    phases["outage_breakers"] = resilience.stats()["breakers"]
+
+    _configure(upstream, error_rate=0)
+    time.sleep(resilience.BREAKER_COOLDOWN)
+    cache.response_cache.clear()
+    phases["recovered"] = _render(at, upstream)
+    time.sleep(1)  # 회로가 닫힌 뒤 백그라운드 갱신이 끝나도록
+    phases["recovered_refreshed"] = _render(at, upstream)
+    phases["recovered_breakers"] = resilience.stats()["breakers"]
+
+    _configure(upstream, tail_rate=0.05, tail_ms=1500)
+    phases["tail_without_hedging"] = tail_latency(upstream, tail_requests, hedging=False)
+    phases["tail_with_hedging"] = tail_latency(upstream, tail_requests, hedging=True)
+    phases["hedges"] = resilience.stats()["hedges"]
+    return phases
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="MovieMind 장애 시나리오 벤치마크")
+    parser.add_argument("--latency-ms", type=float, default=30)
+    parser.add_argument("--slow-ms", type=float, default=4000, help="slow 단계에서 트렌딩·탐색 응답 지연")
+    parser.add_argument("--tail-requests", type=int, default=200)
+    parser.add_argument("--out", help="JSON 보고서 저장 경로")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--upstream", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(run_worker(args.upstream, args.slow_ms, args.tail_requests)))
+        return
+
+    upstream_args = argparse.Namespace(latency_ms=args.latency_ms, jitter_ms=0, error_rate=0, error_status=500,
+                                       endpoint_latency=[], recordings=None)
+    process, upstream = start_upstream(upstream_args)
+    workdir = tempfile.mkdtemp(prefix="moviemind-degraded-")
+    env = dict(
+        os.environ,
+        MOVIEMIND_TMDB_BASE_URL=f"{upstream}/3",
+        MOVIEMIND_TRANSLATE_URL=f"{upstream}/translate_a/single",
+        MOVIEMIND_IMAGE_BASE_URL=f"{upstream}/t/p",
+        MOVIEMIND_POSTER_DIR=os.path.join(workdir, "posters"),
+        MOVIEMIND_TRANSLATION_DB=os.path.join(workdir, "translations.sqlite3"),
+        MOVIEMIND_CATALOG_DB=os.path.join(workdir, "catalog.sqlite3"),
+        MOVIEMIND_SIMILARITY_DIR=os.path.join(workdir, "similarity"),
+        MOVIEMIND_SNAPSHOT_DIR=os.path.join(workdir, "snapshots"),
+        PYTHONPATH=os.pathsep.join(filter(None, [REPO_ROOT, os.environ.get("PYTHONPATH")])),
+    )
+    try:
+        command = [sys.executable, "-m", "bench.degraded_bench", "--worker", "--upstream", upstream,
+                   "--slow-ms", str(args.slow_ms), "--tail-requests", str(args.tail_requests)]
+        output = subprocess.run(command, cwd=workdir, env=env, capture_output=True, text=True, check=False)
+    finally:
+        process.terminate()
+    if output.returncode != 0:
+        raise RuntimeError(f"장애 시나리오 벤치마크 실패:\n{output.stderr}")
+    report = json.loads(output.stdout.strip().splitlines()[-1])
+
+    for phase, row in report.items():
+        if "wall_ms" in row:
+            print(f"[home] {phase:<20} {row['wall_ms']:>8.1f} ms, 스냅숏 섹션 {row['stale_sections']}, "
+                  f"스냅숏 응답 {row['snapshots_served']}, 업스트림 요청 {row['requests']}, 예외 {row['exceptions']}")
+        elif "p99_ms" in row:
+            print(f"[tail] {phase:<20} p50 {row['p50_ms']:>7.1f} ms, p99 {row['p99_ms']:>7.1f} ms, "
+                  f"max {row['max_ms']:>7.1f} ms ({row['requests']}건)")
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""📌 Redis 프로토콜(RESP2)을 흉내 내는 로컬 서버 (캐시 백엔드 벤치마크·점검용)
+
+    python -m bench.fake_redis --port 6399
+
+앱은 다음 환경 변수로 이 서버를 공유 캐시로 사용합니다.
+    MOVIEMIND_CACHE_BACKEND=redis
+    MOVIEMIND_REDIS_URL=redis://127.0.0.1:6399/0
+
+지원 명령: PING, SELECT, GET, SET(EX/PX), DEL, EXISTS, SCAN(MATCH/COUNT), DBSIZE, FLUSHDB, INFO
+"""
+import argparse
+import fnmatch
+import socketserver
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+class Store:
+    def __init__(self):
+        self.data: Dict[bytes, Tuple[bytes, Optional[float]]] = {}  # 키 → (값, 만료 시각)
+        self.lock = threading.Lock()
+        self.commands = 0
+
+    def _alive(self, key: bytes) -> Optional[bytes]:
+        item = self.data.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self.data[key]
+            return None
+        return value
+
+    def execute(self, args: List[bytes]):
+        name = args[0].upper()
+        with self.lock:
+            self.commands += 1
+            if name == b"PING":
+                return "+PONG"
+            if name == b"SELECT":
+                return "+OK"
+            if name == b"GET":
+                return self._alive(args[1])
+            if name == b"SET":
+                expires_at = None
+                options = [a.upper() for a in args[3:]]
+                for i, option in enumerate(options):
+                    if option == b"PX":
+                        expires_at = time.monotonic() + int(args[4 + i]) / 1000
+                    elif option == b"EX":
+                        expires_at = time.monotonic() + int(args[4 + i])
+                self.data[args[1]] = (args[2], expires_at)
+                return "+OK"
+            if name == b"DEL":
+                return sum(1 for key in args[1:] if self.data.pop(key, None) is not None)
+            if name == b"EXISTS":
+                return sum(1 for key in args[1:] if self._alive(key) is not None)
+            if name == b"SCAN":
+                pattern = b"*"
+                for i, option in enumerate(args):
+                    if option.upper() == b"MATCH":
+                        pattern = args[i + 1]
+                keys = [k for k in list(self.data) if self._alive(k) is not None
+                        and fnmatch.fnmatchcase(k.decode("utf-8", "replace"), pattern.decode("utf-8", "replace"))]
+                return [b"0", keys]  # 한 번에 모두 반환
+            if name == b"DBSIZE":
+                return len(self.data)
+            if name == b"FLUSHDB":
+                self.data.clear()
+                return "+OK"
+            if name == b"INFO":
+                return f"# Stats\r\ncommands:{self.commands}\r\nkeys:{len(self.data)}\r\n".encode()
+        return f"-ERR unknown command '{name.decode()}'"
+
+
+def _encode(value) -> bytes:
+    if value is None:
+        return b"$-1\r\n"
+    if isinstance(value, str):  # +OK / -ERR 같은 단순 응답
+        return value.encode() + b"\r\n"
+    if isinstance(value, int):
+        return b":%d\r\n" % value
+    if isinstance(value, bytes):
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+    return b"*%d\r\n" % len(value) + b"".join(_encode(item) for item in value)
+
+
+def make_handler(store: Store):
+    class Handler(socketserver.StreamRequestHandler):
+        def _read_command(self) -> Optional[List[bytes]]:
+            line = self.rfile.readline()
+            if not line:
+                return None
+            if not line.startswith(b"*"):  # 인라인 명령 (redis-cli 등)
+                return line.split()
+            args = []
+            for _ in range(int(line[1:-2])):
+                length = int(self.rfile.readline()[1:-2])
+                args.append(self.rfile.read(length + 2)[:-2])
+            return args
+
+        def handle(self):
+            while True:
+                try:
+                    args = self._read_command()
+                except (ConnectionError, ValueError):
+                    return
+                if not args:
+                    return
+                self.wfile.write(_encode(store.execute(args)))
+                self.wfile.flush()
+
+    return Handler
+
+
+def serve(port: int) -> socketserver.ThreadingTCPServer:
+    socketserver.ThreadingTCPServer.allow_reuse_address = True
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", port), make_handler(Store()))
+    server.daemon_threads = True
+    return server
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="로컬 RESP(Redis 프로토콜) 서버")
+    parser.add_argument("--port", type=int, default=6399)
+    args = parser.parse_args(argv)
+    server = serve(args.port)
+    print(f"fake redis listening on 127.0.0.1:{server.server_address[1]}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
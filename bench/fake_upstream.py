@@ -0,0 +1,285 @@
+"""📌 TMDb / Google 번역 / OpenWeatherMap을 흉내 내는 로컬 서버 (벤치마크·장애 주입용)
+
+    python -m bench.fake_upstream --port 8765 --latency-ms 80 --error-rate 0.05
+
+앱은 다음 환경 변수로 이 서버를 바라보게 합니다.
+    MOVIEMIND_TMDB_BASE_URL=http://127.0.0.1:8765/3
+    MOVIEMIND_TRANSLATE_URL=http://127.0.0.1:8765/translate_a/single
+    MOVIEMIND_WEATHER_URL=http://127.0.0.1:8765/data/2.5/weather
+    MOVIEMIND_IMAGE_BASE_URL=http://127.0.0.1:8765/t/p
+
+관리용 엔드포인트
+    GET /__stats   엔드포인트별 요청 수 (JSON)
+    GET /__reset   요청 수 초기화
+    GET /__config?latency_ms=..&jitter_ms=..&error_rate=..&error_status=..&endpoint=trending&endpoint_latency_ms=..
+    GET /__config?tail_rate=0.05&tail_ms=2000   요청의 일부만 크게 늦춤 (꼬리 지연)
+"""
+import argparse
+import json
+import random
+import re
+import struct
+import sys
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+SECRET_PARAMS = {"api_key", "appid"}
+GENRE_IDS = [28, 12, 16, 35, 80, 99, 18, 10751, 14, 36, 27, 10402, 9648, 10749, 878, 10770, 53, 10752, 37]
+TITLE_WORDS = ["스파이더맨", "어벤져스", "기생충", "인터스텔라", "라라랜드", "올드보이", "범죄도시", "명량", "극한직업", "부산행"]
+
+# (정규식, 엔드포인트 이름) — 요청 수 집계와 엔드포인트별 지연 설정에 사용
+ENDPOINTS = [
+    (re.compile(r"^/3/trending/"), "trending"),
+    (re.compile(r"^/3/movie/popular$"), "popular"),
+    (re.compile(r"^/3/discover/movie$"), "discover"),
+    (re.compile(r"^/3/search/movie$"), "search_movie"),
+    (re.compile(r"^/3/search/keyword$"), "search_keyword"),
+    (re.compile(r"^/3/search/person$"), "search_person"),
+    (re.compile(r"^/3/movie/\d+/similar$"), "similar"),
+    (re.compile(r"^/3/movie/\d+/translations$"), "translations"),
+    (re.compile(r"^/3/movie/\d+$"), "details"),
+    (re.compile(r"^/3/person/\d+/movie_credits$"), "person_credits"),
+    (re.compile(r"^/3/authentication/"), "auth"),
+    (re.compile(r"^/translate_a/single$"), "translate"),
+    (re.compile(r"^/data/2\.5/weather$"), "weather"),
+    (re.compile(r"^/t/p/w\d+/"), "poster"),
+]
+
+
+def endpoint_name(path: str) -> str:
+    for pattern, name in ENDPOINTS:
+        if pattern.search(path):
+            return name
+    return "other"
+
+
+class Config:
+    def __init__(self, latency_ms: float = 0, jitter_ms: float = 0, error_rate: float = 0, error_status: int = 500):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.tail_rate = 0.0     # 이 비율의 요청에 tail_ms를 더함
+        self.tail_ms = 0.0
+        self.endpoint_latency_ms: Dict[str, float] = {}
+
+
+# ---------------- 합성 응답 ----------------
+def _rng(*parts) -> random.Random:
+    return random.Random(zlib.crc32("|".join(map(str, parts)).encode()))
+
+
+def _movie(movie_id: int) -> Dict:
+    rng = _rng("movie", movie_id)
+    return {
+        "id": movie_id,
+        "title": f"{rng.choice(TITLE_WORDS)} {movie_id}",
+        "original_title": f"Movie {movie_id}",
+        "overview": "합성 줄거리입니다. " * rng.randint(3, 12),
+        "poster_path": f"/poster{movie_id}.jpg",
+        "release_date": f"{rng.randint(1970, 2025)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        "popularity": round(rng.uniform(1, 500), 3),
+        "vote_average": round(rng.uniform(3, 9.5), 1),
+        "vote_count": rng.randint(10, 20000),
+        "genre_ids": rng.sample(GENRE_IDS, 3),
+    }
+
+
+def _movie_list(*seed) -> Dict:
+    rng = _rng("list", *seed)
+    return {"page": 1, "results": [_movie(rng.randint(1, 50000)) for _ in range(20)], "total_pages": 10}
+
+
+def _details(movie_id: int) -> Dict:
+    rng = _rng("credits", movie_id)
+    movie = _movie(movie_id)
+    movie["genres"] = [{"id": g, "name": str(g)} for g in movie.pop("genre_ids")]
+    movie["credits"] = {
+        "cast": [{"id": rng.randint(1, 90000), "name": f"Actor {rng.randint(1, 3000)}"} for _ in range(15)],
+        "crew": [{"id": rng.randint(1, 90000), "name": f"Director {rng.randint(1, 800)}", "job": "Director"}],
+    }
+    movie["translations"] = {
+        "translations": [{"iso_639_1": "ko", "data": {"title": movie["title"], "overview": movie["overview"]}}]
+    }
+    return movie
+
+
+def _poster(path: str) -> bytes:
+    """📌 요청한 너비(w92 … w780)의 2:3 단색 PNG (색은 경로마다 다름)"""
+    width = int(path.split("/")[3][1:])
+    height = width * 3 // 2
+    raw = (b"\x00" + _rng("poster", path).randbytes(3) * width) * height
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(raw, 1)) + chunk(b"IEND", b"")
+
+
+def synthesize(path: str, query: Dict[str, str]):
+    """📌 녹화본이 없을 때 TMDb 형식의 결정적 합성 응답을 만듭니다."""
+    name = endpoint_name(path)
+    if name in ("trending", "popular", "discover", "search_movie", "similar"):
+        return _movie_list(path, sorted(query.items()))
+    if name == "details":
+        return _details(int(path.rsplit("/", 1)[1]))
+    if name == "translations":
+        return _details(int(path.split("/")[3]))["translations"]
+    if name == "search_keyword":
+        return {"results": [{"id": zlib.crc32(query.get("query", "").encode()) % 10000, "name": query.get("query", "")}]}
+    if name == "search_person":
+        rng = _rng("person", query.get("query", ""))
+        return {"results": [{"id": rng.randint(1, 90000), "name": query.get("query", ""), "popularity": rng.uniform(1, 50)}]}
+    if name == "person_credits":
+        person_id = int(path.split("/")[3])
+        rng = _rng("filmography", person_id)
+        return {"cast": [_movie(rng.randint(1, 50000)) for _ in range(rng.randint(5, 30))], "crew": []}
+    if name == "auth":
+        return {"success": True, "guest_session_id": "bench-guest"}
+    if name == "translate":
+        lines = query.get("q", "").split("\n")
+        return [[[f"번역 {line}" + ("\n" if i < len(lines) - 1 else ""), line] for i, line in enumerate(lines)]]
+    if name == "poster":
+        return _poster(path)
+    if name == "weather":
+        return {"weather": [{"main": "Rain" if _rng("weather", query.get("q", "")).random() < 0.5 else "Clear"}]}
+    return None
+
+
+# ---------------- 서버 ----------------
+class FakeUpstream:
+    def __init__(self, config: Config, recordings: Optional[Dict[str, object]] = None):
+        self.config = config
+        self.recordings = recordings or {}
+        self.counts: Dict[str, int] = {}
+        self.lock = threading.Lock()
+
+    def record_key(self, path: str, query: Dict[str, str]) -> str:
+        params = "&".join(f"{k}={v}" for k, v in sorted(query.items()) if k not in SECRET_PARAMS)
+        return f"{path}?{params}" if params else path
+
+    def handler(self):
+        upstream = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status: int, body, headers: Optional[Dict[str, str]] = None):
+                if isinstance(body, bytes):
+                    payload, content_type = body, "image/png"
+                else:
+                    payload, content_type = json.dumps(body, ensure_ascii=False).encode("utf-8"), "application/json; charset=utf-8"
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                query = dict(parse_qsl(parts.query))
+                if parts.path.startswith("/__"):
+                    return self._admin(parts.path, query)
+
+                name = endpoint_name(parts.path)
+                with upstream.lock:
+                    upstream.counts[name] = upstream.counts.get(name, 0) + 1
+                config = upstream.config
+                latency = config.endpoint_latency_ms.get(name, config.latency_ms)
+                latency += random.uniform(-config.jitter_ms, config.jitter_ms) if config.jitter_ms else 0
+                latency += config.tail_ms if config.tail_rate and random.random() < config.tail_rate else 0
+                if latency > 0:
+                    time.sleep(latency / 1000)
+                if config.error_rate and random.random() < config.error_rate:
+                    headers = {"Retry-After": "0"} if config.error_status == 429 else None
+                    return self._send(config.error_status, {"status_message": "injected error"}, headers)
+
+                body = upstream.recordings.get(upstream.record_key(parts.path, query))
+                if body is None:
+                    body = upstream.recordings.get(parts.path)
+                if body is None:
+                    body = synthesize(parts.path, query)
+                if body is None:
+                    return self._send(404, {"status_message": "not found"})
+                self._send(200, body)
+
+            def _admin(self, path: str, query: Dict[str, str]):
+                if path == "/__stats":
+                    with upstream.lock:
+                        return self._send(200, dict(upstream.counts))
+                if path == "/__reset":
+                    with upstream.lock:
+                        upstream.counts.clear()
+                    return self._send(200, {"ok": True})
+                if path == "/__config":
+                    config = upstream.config
+                    for field in ("latency_ms", "jitter_ms", "error_rate", "tail_rate", "tail_ms"):
+                        if field in query:
+                            setattr(config, field, float(query[field]))
+                    if "error_status" in query:
+                        config.error_status = int(query["error_status"])
+                    if "endpoint" in query:
+                        if "endpoint_latency_ms" in query:
+                            config.endpoint_latency_ms[query["endpoint"]] = float(query["endpoint_latency_ms"])
+                        else:
+                            config.endpoint_latency_ms.pop(query["endpoint"], None)
+                    return self._send(200, vars(config))
+                self._send(404, {"status_message": "unknown admin endpoint"})
+
+        return Handler
+
+
+class _Server(ThreadingHTTPServer):
+    def handle_error(self, request, client_address):
+        if isinstance(sys.exc_info()[1], (BrokenPipeError, ConnectionResetError)):
+            return  # 헤지 요청 취소나 워커 종료로 클라이언트가 먼저 연결을 끊은 경우
+        super().handle_error(request, client_address)
+
+
+def serve(port: int, config: Config, recordings: Optional[Dict] = None) -> ThreadingHTTPServer:
+    server = _Server(("127.0.0.1", port), FakeUpstream(config, recordings).handler())
+    server.daemon_threads = True
+    return server
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="로컬 가짜 TMDb/번역/날씨 서버")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--endpoint-latency", action="append", default=[], metavar="NAME=MS",
+                        help="엔드포인트별 지연 (예: trending=1500)")
+    parser.add_argument("--recordings", help='{"/3/trending/movie/week?language=ko-KR": {...}} 형식의 녹화 파일')
+    args = parser.parse_args(argv)
+
+    config = Config(args.latency_ms, args.jitter_ms, args.error_rate, args.error_status)
+    for item in args.endpoint_latency:
+        name, ms = item.split("=", 1)
+        config.endpoint_latency_ms[name] = float(ms)
+    recordings = None
+    if args.recordings:
+        with open(args.recordings, encoding="utf-8") as f:
+            recordings = json.load(f)
+
+    server = serve(args.port, config, recordings)
+    print(f"fake upstream listening on http://127.0.0.1:{server.server_port}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
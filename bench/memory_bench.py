@@ -0,0 +1,124 @@
+"""📌 세션당 영화 목록 메모리 벤치마크: TMDb 원본 dict vs 공유 Movie 레코드
+
+    python -m bench.memory_bench --sessions 300 --out bench/memory-report.json
+
+세션마다 홈 화면이 쥐고 있는 영화 목록(섹션 5개 × 20편)을 만들고 tracemalloc으로 메모리를 잽니다.
+- dict: 공유 캐시(sqlite/redis) 응답을 디코딩할 때처럼 세션마다 원본 JSON dict 사본을 보관
+- movie: 같은 응답을 to_movies()로 바꿔 세션은 공유 레코드의 참조만 보관
+응답 목록은 가짜 업스트림(bench/fake_upstream.py)과 같은 합성 데이터에
+실제 TMDb 목록 응답에 있는 필드(adult, backdrop_path 등)를 더해 만듭니다.
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from bench.fake_upstream import _movie_list  # noqa: E402
+from src.models import MovieBatch, interned_count, to_movies  # noqa: E402
+
+SECTIONS = 5
+# 홈 화면 섹션이 쓰는 목록 (트렌딩은 여러 섹션이 공유, 맞춤 추천은 프로필마다 다름)
+SHARED_LISTS = ("trending", "popular", "latest", "realtime")
+PROFILES = 12
+
+
+def _tmdb_payload(*seed) -> bytes:
+    """📌 실제 TMDb 목록 응답과 같은 모양의 JSON 바이트"""
+    data = _movie_list(*seed)
+    for movie in data["results"]:
+        movie.update({
+            "adult": False,
+            "backdrop_path": f"/backdrop{movie['id']}.jpg",
+            "original_language": "en",
+            "video": False,
+            "media_type": "movie",
+        })
+    return json.dumps(data, ensure_ascii=False).encode()
+
+
+def _session_payloads(session: int, payloads: Dict[str, bytes]) -> List[bytes]:
+    return [payloads[name] for name in SHARED_LISTS] + [payloads[f"profile{session % PROFILES}"]]
+
+
+def hold_dicts(session: int, payloads: Dict[str, bytes]) -> List:
+    return [json.loads(payload)["results"] for payload in _session_payloads(session, payloads)]
+
+
+def hold_movies(session: int, payloads: Dict[str, bytes]) -> List:
+    return [to_movies(json.loads(payload)["results"]) for payload in _session_payloads(session, payloads)]
+
+
+def measure(builder: Callable, sessions: int, payloads: Dict[str, bytes]) -> Dict:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    held = [builder(session, payloads) for session in range(sessions)]
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    total = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    movies = sum(len(movie_list) for session in held for movie_list in session)
+    result = {
+        "sessions": sessions,
+        "total_bytes": total,
+        "bytes_per_session": round(total / sessions),
+        "bytes_per_movie_ref": round(total / movies),
+        "build_ms_per_session": round(elapsed / sessions * 1000, 3),
+        "interned_records": interned_count(),
+    }
+    del held
+    return result
+
+
+def measure_batch(payloads: Dict[str, bytes]) -> Dict:
+    """📌 한 섹션 목록을 MovieBatch로 만들었을 때의 열 배열 크기와 정렬/상위 N 시간"""
+    movies = to_movies(json.loads(payloads["trending"])["results"] * 50)
+    batch = MovieBatch(movies)
+    started = time.perf_counter()
+    for _ in range(100):
+        batch.unique().top(20, "vote_average")
+    elapsed = time.perf_counter() - started
+    array_bytes = sum(getattr(batch, name).nbytes for name in ("ids", "vote_average", "popularity", "release_ordinal"))
+    return {"rows": len(batch), "array_bytes": array_bytes, "unique_top20_us": round(elapsed / 100 * 1e6, 1)}
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="세션당 영화 목록 메모리 벤치마크")
+    parser.add_argument("--sessions", type=int, default=300)
+    parser.add_argument("--out", default=None, help="결과 JSON 파일 경로")
+    args = parser.parse_args(argv)
+
+    payloads = {name: _tmdb_payload(name) for name in SHARED_LISTS}
+    payloads.update({f"profile{i}": _tmdb_payload("profile", i) for i in range(PROFILES)})
+
+    report = {
+        "dict": measure(hold_dicts, args.sessions, payloads),
+        "movie": measure(hold_movies, args.sessions, payloads),
+        "batch": measure_batch(payloads),
+    }
+    report["reduction"] = round(1 - report["movie"]["bytes_per_session"] / report["dict"]["bytes_per_session"], 3)
+
+    print(f"세션 {args.sessions}개, 세션당 섹션 {SECTIONS}개")
+    for name in ("dict", "movie"):
+        row = report[name]
+        print(f"  {name:<6} 세션당 {row['bytes_per_session'] / 1024:8.1f} KiB  "
+              f"(영화 참조당 {row['bytes_per_movie_ref']} B, 생성 {row['build_ms_per_session']} ms/세션)")
+    print(f"  감소율 {report['reduction'] * 100:.1f}%, 공유 레코드 {report['movie']['interned_records']}개")
+    print(f"  MovieBatch {report['batch']['rows']}행: 배열 {report['batch']['array_bytes']} B, "
+          f"unique+top20 {report['batch']['unique_top20_us']} µs")
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
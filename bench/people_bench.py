@@ -0,0 +1,117 @@
+"""📌 인물 기반 추천 벤치마크: 이름 N개 → 추천 목록까지의 대기 시간
+
+    python -m bench.people_bench --people 10 --latency-ms 100 --out bench/people-report.json
+
+가짜 업스트림(bench/fake_upstream.py)에 고정 지연을 주고 다음을 비교합니다.
+- serial: 기존 search_person → fetch_movies_by_person을 한 명씩 차례로 호출
+- parallel: recommend_by_people (이름 검색·필모그래피를 인물별로 이어서, 인물끼리는 동시에)
+- warm: 같은 이름으로 다시 호출 (인물 → 영화 색인 사용)
+시간은 지연(왕복 한 번)의 몇 배인지로도 표시합니다. 매 회차마다 처음 보는 이름을 씁니다.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from bench.run_bench import start_upstream  # noqa: E402
+
+
+def _names(round_number: int, count: int, mode: str) -> List[str]:
+    return [f"{mode} 배우 {round_number}-{i}" for i in range(count)]
+
+
+def run_worker(people: int, rounds: int, latency_ms: float) -> Dict:
+    from src.movie_recommend import fetch_movies_by_person, search_person
+    from src.person_recs import rank_films, recommend_by_people
+
+    timings = {"serial": [], "parallel": [], "warm": [], "rank": []}
+    movies, pages = 0, 0
+    for round_number in range(rounds):
+        started = time.perf_counter()
+        for name in _names(round_number, people, "serial"):
+            results = search_person(name)
+            if results:
+                fetch_movies_by_person(results[0]["id"])
+        timings["serial"].append(time.perf_counter() - started)
+
+        names = _names(round_number, people, "parallel")
+        started = time.perf_counter()
+        result = recommend_by_people(names)
+        timings["parallel"].append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        result = recommend_by_people(names)
+        pages = sum(1 for _ in result.pages())
+        timings["warm"].append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        rank_films(result._films, [1.0] * len(result._films))
+        timings["rank"].append(time.perf_counter() - started)
+        movies = len(result)
+
+    report = {"people": people, "latency_ms": latency_ms, "movies": movies, "pages": pages}
+    for mode, values in timings.items():
+        median_ms = statistics.median(values) * 1000
+        report[f"{mode}_ms"] = round(median_ms, 2)
+        if mode != "rank":
+            report[f"{mode}_round_trips"] = round(median_ms / latency_ms, 2)
+    return report
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="인물 기반 추천 벤치마크")
+    parser.add_argument("--people", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--latency-ms", type=float, default=100)
+    parser.add_argument("--out", help="JSON 보고서 저장 경로")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(run_worker(args.people, args.rounds, args.latency_ms)))
+        return
+
+    upstream_args = argparse.Namespace(latency_ms=args.latency_ms, jitter_ms=0, error_rate=0, error_status=500,
+                                       endpoint_latency=[], recordings=None)
+    process, upstream = start_upstream(upstream_args)
+    workdir = tempfile.mkdtemp(prefix="moviemind-people-")
+    env = dict(
+        os.environ,
+        MOVIEMIND_TMDB_BASE_URL=f"{upstream}/3",
+        MOVIEMIND_SNAPSHOT_DIR=os.path.join(workdir, "snapshots"),
+        PYTHONPATH=os.pathsep.join(filter(None, [REPO_ROOT, os.environ.get("PYTHONPATH")])),
+    )
+    command = [sys.executable, "-m", "bench.people_bench", "--worker", "--people", str(args.people),
+               "--rounds", str(args.rounds), "--latency-ms", str(args.latency_ms)]
+    # st.secrets 대신 쓸 API 키 (워커는 Streamlit 앱이 아니라 모듈을 직접 호출)
+    os.makedirs(os.path.join(workdir, ".streamlit"), exist_ok=True)
+    with open(os.path.join(workdir, ".streamlit", "secrets.toml"), "w", encoding="utf-8") as f:
+        f.write('MOVIEDB_API_KEY = "bench"\n')
+    try:
+        output = subprocess.run(command, cwd=workdir, env=env, capture_output=True, text=True, check=False)
+    finally:
+        process.terminate()
+    if output.returncode != 0:
+        raise RuntimeError(f"인물 기반 추천 벤치마크 실패:\n{output.stderr}")
+    report = json.loads(output.stdout.strip().splitlines()[-1])
+
+    print(f"인물 {report['people']}명, 왕복 지연 {report['latency_ms']} ms, 추천 {report['movies']}편 ({report['pages']}페이지)")
+    for mode in ("serial", "parallel", "warm"):
+        print(f"  {mode:<9} {report[f'{mode}_ms']:>9.1f} ms ({report[f'{mode}_round_trips']}회 왕복)")
+    print(f"  순위 계산 {report['rank_ms']:>7.2f} ms")
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
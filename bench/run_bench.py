@@ -0,0 +1,257 @@
+"""📌 오프라인 페이지 벤치마크: 가짜 업스트림 서버 + Streamlit AppTest
+
+    python -m bench.run_bench --iterations 10 --latency-ms 80 --out bench/report.json
+    python -m bench.run_bench --baseline bench/report-old.json --out bench/report.json
+
+페이지마다 새 프로세스에서 실행하므로 첫 렌더는 캐시가 비어 있는 상태(cold)이고,
+이후 렌더는 같은 프로세스의 캐시를 사용하는 상태(warm)입니다.
+보고서(JSON)에는 렌더별 소요 시간, p50/p95, 엔드포인트별 외부 요청 수, 최대 RSS가 담깁니다.
+"""
+import argparse
+import json
+import os
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from typing import Dict, List, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(REPO_ROOT, "app.py")
+
+PAGES = ("home", "search", "recommendations")
+SEARCH_QUERIES = ["스파이더맨", "기생충", "인터", "어벤져스", "라라", "부산행", "올드", "명량"]
+BENCH_PROFILE = {"preferred_genres": [28, 35, 878]}
+
+
+# ---------------- 통계 ----------------
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """📌 최근접 순위 방식 백분위수"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, int(round(q / 100 * len(ordered) + 0.5)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(wall_ms: List[float]) -> Dict:
+    warm = wall_ms[1:]
+    return {
+        "cold_ms": round(wall_ms[0], 1) if wall_ms else None,
+        "p50_ms": round(percentile(wall_ms, 50), 1) if wall_ms else None,
+        "p95_ms": round(percentile(wall_ms, 95), 1) if wall_ms else None,
+        "warm_p50_ms": round(percentile(warm, 50), 1) if warm else None,
+        "warm_p95_ms": round(percentile(warm, 95), 1) if warm else None,
+        "total_ms": round(sum(wall_ms), 1),
+    }
+
+
+# ---------------- 가짜 업스트림 ----------------
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _admin(base: str, path: str) -> Dict:
+    with urllib.request.urlopen(f"{base}{path}", timeout=5) as response:
+        return json.loads(response.read())
+
+
+def start_upstream(args) -> (subprocess.Popen, str):
+    port = _free_port()
+    command = [
+        sys.executable, "-m", "bench.fake_upstream", "--port", str(port),
+        "--latency-ms", str(args.latency_ms), "--jitter-ms", str(args.jitter_ms),
+        "--error-rate", str(args.error_rate), "--error-status", str(args.error_status),
+    ]
+    for item in args.endpoint_latency:
+        command += ["--endpoint-latency", item]
+    if args.recordings:
+        command += ["--recordings", args.recordings]
+    process = subprocess.Popen(command, cwd=REPO_ROOT, stdout=subprocess.DEVNULL)
+    base = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            _admin(base, "/__stats")
+            return process, base
+        except OSError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError("가짜 업스트림 서버가 시작되지 않았습니다.")
+
+
+def start_redis() -> (subprocess.Popen, str):
+    """📌 공유 캐시 백엔드 점검용 RESP 서버(bench.fake_redis)를 띄웁니다."""
+    port = _free_port()
+    process = subprocess.Popen([sys.executable, "-m", "bench.fake_redis", "--port", str(port)],
+                               cwd=REPO_ROOT, stdout=subprocess.DEVNULL)
+    for _ in range(100):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return process, f"redis://127.0.0.1:{port}/0"
+        except OSError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError("가짜 Redis 서버가 시작되지 않았습니다.")
+
+
+# ---------------- 페이지 실행 (워커 프로세스) ----------------
+def _click(at, label: str):
+    for button in at.button:
+        if button.label == label:
+            return button.click()
+    raise LookupError(f"버튼을 찾을 수 없습니다: {label}")
+
+
+def run_worker(page: str, iterations: int, upstream: str) -> Dict:
+    """📌 한 페이지를 AppTest로 반복 렌더링하며 측정합니다 (이 프로세스 안에서만 캐시 공유)."""
+    sys.path.insert(0, REPO_ROOT)
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP_PATH, default_timeout=300)
+    at.secrets["MOVIEDB_API_KEY"] = "bench"
+    at.secrets["WEATHER_API_KEY"] = "bench"
+    at.session_state["selected_page"] = {"home": "홈", "search": "영화 검색", "recommendations": "추천 생성"}[page]
+    if page == "recommendations":
+        at.session_state["user_profile"] = BENCH_PROFILE
+    if page == "search":
+        at.run()  # 검색 페이지 자체의 첫 렌더는 측정에서 제외 (검색 버튼 클릭만 측정)
+
+    wall_ms, requests_per_render, exceptions = [], [], 0
+    for i in range(iterations):
+        _admin(upstream, "/__reset")
+        if page == "search":
+            at.text_input[0].input(SEARCH_QUERIES[i % len(SEARCH_QUERIES)])
+            _click(at, "검색")
+        started = time.perf_counter()
+        at.run()
+        wall_ms.append((time.perf_counter() - started) * 1000)
+        requests_per_render.append(_admin(upstream, "/__stats"))
+        exceptions += len(at.exception)
+
+    endpoints = sorted({name for counts in requests_per_render for name in counts})
+    return {
+        "iterations": iterations,
+        "wall_ms": [round(ms, 1) for ms in wall_ms],
+        **summarize(wall_ms),
+        "requests_cold": requests_per_render[0] if requests_per_render else {},
+        "requests_per_render": {
+            name: round(sum(c.get(name, 0) for c in requests_per_render) / len(requests_per_render), 2)
+            for name in endpoints
+        },
+        "requests_total": sum(sum(c.values()) for c in requests_per_render),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "exceptions": exceptions,
+    }
+
+
+def run_page(page: str, args, upstream: str, redis_url: Optional[str] = None) -> Dict:
+    """📌 페이지 하나를 새 프로세스에서 실행합니다 (캐시·메모리 격리)."""
+    workdir = tempfile.mkdtemp(prefix="moviemind-bench-")
+    env = dict(
+        os.environ,
+        MOVIEMIND_TMDB_BASE_URL=f"{upstream}/3",
+        MOVIEMIND_TRANSLATE_URL=f"{upstream}/translate_a/single",
+        MOVIEMIND_WEATHER_URL=f"{upstream}/data/2.5/weather",
+        MOVIEMIND_IMAGE_BASE_URL=f"{upstream}/t/p",
+        MOVIEMIND_POSTER_DIR=os.path.join(workdir, "posters"),
+        MOVIEMIND_TRANSLATION_DB=os.path.join(workdir, "translations.sqlite3"),
+        MOVIEMIND_CATALOG_DB=args.catalog or os.path.join(workdir, "catalog.sqlite3"),
+        MOVIEMIND_CACHE_BACKEND=args.cache_backend,
+        MOVIEMIND_CACHE_DB=os.path.join(workdir, "responses.sqlite3"),
+        MOVIEMIND_REDIS_URL=redis_url or "",
+        MOVIEMIND_SIMILARITY_DIR=os.path.join(workdir, "similarity"),
+        PYTHONPATH=os.pathsep.join(filter(None, [REPO_ROOT, os.environ.get("PYTHONPATH")])),
+    )
+    command = [sys.executable, "-m", "bench.run_bench", "--worker", page,
+               "--iterations", str(args.iterations), "--upstream", upstream]
+    output = subprocess.run(command, cwd=workdir, env=env, capture_output=True, text=True, check=False)
+    if output.returncode != 0:
+        raise RuntimeError(f"{page} 벤치마크 실패:\n{output.stderr}")
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+# ---------------- 기준선 비교 ----------------
+def compare(report: Dict, baseline: Dict) -> List[str]:
+    lines = [f"{'page':<16}{'metric':<16}{'baseline':>12}{'current':>12}{'change':>10}"]
+    for page, current in report["pages"].items():
+        before = baseline.get("pages", {}).get(page)
+        if not before:
+            continue
+        for metric in ("cold_ms", "p50_ms", "p95_ms", "requests_total", "peak_rss_mb"):
+            old, new = before.get(metric), current.get(metric)
+            if old is None or new is None:
+                continue
+            change = f"{(new - old) / old * 100:+.1f}%" if old else "n/a"
+            lines.append(f"{page:<16}{metric:<16}{old:>12}{new:>12}{change:>10}")
+    return lines
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="MovieMind 오프라인 페이지 벤치마크")
+    parser.add_argument("--pages", nargs="+", choices=PAGES, default=list(PAGES))
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--jitter-ms", type=float, default=10)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--endpoint-latency", action="append", default=[], metavar="NAME=MS")
+    parser.add_argument("--recordings", help="가짜 서버가 재생할 녹화 응답 파일")
+    parser.add_argument("--catalog", help="로컬 카탈로그 DB (없으면 빈 카탈로그)")
+    parser.add_argument("--cache-backend", choices=("memory", "sqlite", "redis"), default="memory",
+                        help="응답 캐시 백엔드 (redis면 bench.fake_redis를 함께 띄움)")
+    parser.add_argument("--out", help="JSON 보고서 저장 경로")
+    parser.add_argument("--baseline", help="비교할 이전 JSON 보고서")
+    parser.add_argument("--worker", choices=PAGES, help=argparse.SUPPRESS)
+    parser.add_argument("--upstream", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.iterations, args.upstream)))
+        return
+
+    process, upstream = start_upstream(args)
+    redis_process, redis_url = start_redis() if args.cache_backend == "redis" else (None, None)
+    try:
+        report = {
+            "meta": {
+                "git_revision": _git_revision(),
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "iterations": args.iterations,
+                "latency_ms": args.latency_ms,
+                "jitter_ms": args.jitter_ms,
+                "error_rate": args.error_rate,
+                "endpoint_latency": args.endpoint_latency,
+                "cache_backend": args.cache_backend,
+            },
+            "pages": {page: run_page(page, args, upstream, redis_url) for page in args.pages},
+        }
+    finally:
+        process.terminate()
+        if redis_process is not None:
+            redis_process.terminate()
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            print("\n".join(compare(report, json.load(f))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""📌 입력 중 검색 벤치마크: 키 입력마다 제목 트라이에서 후보를 찾는 시간
+
+    python -m bench.search_bench --movies 3000 --out bench/search-report.json
+
+가짜 업스트림(bench/fake_upstream.py)과 같은 합성 영화로 색인을 채운 뒤,
+한글을 실제로 입력할 때 화면에 나타나는 중간 상태("ㅅ" → "스" → "스ㅍ" → "스파" …)를
+한 글자씩 넣으며 suggest() 지연 시간의 p50/p95/p99와 5ms 초과 비율을 잽니다.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from bench.fake_upstream import TITLE_WORDS, _movie  # noqa: E402
+from bench.run_bench import percentile  # noqa: E402
+from src.search_trie import MAX_MOVIES, TitleTrie  # noqa: E402
+
+BUDGET_MS = 5.0
+QUERIES = TITLE_WORDS + ["spider", "movie 12", "노 웨이", "라라 랜드"]
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+
+
+def keystrokes(text: str) -> List[str]:
+    """📌 두벌식으로 입력할 때의 중간 상태들 (음절마다 초성 → 초성+중성 → 완성)"""
+    states, typed = [], ""
+    for char in text:
+        code = ord(char) - 0xAC00
+        if 0 <= code < 11172:
+            states.append(typed + _CHOSEONG[code // 588])
+            if code % 28:
+                states.append(typed + chr(0xAC00 + code - code % 28))
+        typed += char
+        states.append(typed)
+    return states
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="입력 중 검색(제목 트라이) 벤치마크")
+    parser.add_argument("--movies", type=int, default=3000)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--out", default=None, help="결과 JSON 파일 경로")
+    args = parser.parse_args(argv)
+
+    movies = [_movie(movie_id) for movie_id in range(1, min(args.movies, MAX_MOVIES) + 1)]
+    trie = TitleTrie()
+    tracemalloc.start()
+    started = time.perf_counter()
+    trie.add(movies)
+    build_ms = (time.perf_counter() - started) * 1000
+    trie_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    timings, empty = [], 0
+    states = [state for query in QUERIES for state in keystrokes(query)]
+    for _ in range(args.rounds):
+        for state in states:
+            started = time.perf_counter()
+            results = trie.suggest(state)
+            timings.append((time.perf_counter() - started) * 1000)
+            empty += not results
+
+    report = {
+        "movies": len(trie),
+        "build_ms": round(build_ms, 1),
+        "trie_bytes": trie_bytes,
+        "keystrokes": len(timings),
+        "empty_ratio": round(empty / len(timings), 3),
+        "p50_ms": round(percentile(timings, 50), 4),
+        "p95_ms": round(percentile(timings, 95), 4),
+        "p99_ms": round(percentile(timings, 99), 4),
+        "over_budget_ratio": round(sum(ms > BUDGET_MS for ms in timings) / len(timings), 4),
+    }
+    print(f"영화 {report['movies']}편, 색인 구성 {report['build_ms']} ms, {report['trie_bytes'] / 1024 / 1024:.1f} MiB")
+    print(f"키 입력 {report['keystrokes']}회: p50 {report['p50_ms']} ms, p95 {report['p95_ms']} ms, "
+          f"p99 {report['p99_ms']} ms, {BUDGET_MS}ms 초과 {report['over_budget_ratio'] * 100:.2f}%")
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""📌 시작 시간 벤치마크: 모듈별 import 시간과 새 워커의 첫 렌더 시간
+
+    python -m bench.startup_bench --rounds 5 --out bench/startup-report.json
+
+1) python -X importtime으로 페이지마다 불러오는 모듈과 그 누적 import 시간(ms)을 잽니다.
+2) 새 프로세스에서 AppTest로 페이지를 처음 렌더링할 때까지의 시간(프로세스 시작 포함)과,
+   그중 app.py가 페이지를 그리는 구간(src.metrics.page_scope, 페이지 모듈 import 포함)의 시간을 잽니다.
+   외부 요청은 가짜 업스트림(bench/fake_upstream.py)으로 보냅니다.
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from bench.run_bench import APP_PATH, start_upstream  # noqa: E402
+
+# 페이지를 렌더링할 때 app.py가 불러오는 모듈 (app: 페이지를 고르기 전, 헤더·네비게이션까지는 streamlit만)
+PAGE_MODULES = {
+    "app": [],
+    "home": ["src.metrics", "src.resilience", "src.home"],
+    "search": ["src.metrics", "src.resilience", "src.ui"],
+}
+THIRD_PARTY = ("streamlit", "numpy", "requests", "httpx")
+_IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+PAGE_NAMES = {"home": "홈", "search": "영화 검색"}
+
+
+def _env(extra: Dict[str, str] = None) -> Dict[str, str]:
+    return dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [REPO_ROOT, os.environ.get("PYTHONPATH")])),
+                **(extra or {}))
+
+
+# ---------------- 모듈별 import 시간 ----------------
+def import_profile(modules: List[str]) -> Dict:
+    """📌 streamlit을 먼저 불러온 뒤 modules를 불러오는 데 걸린 시간과 모듈별 누적 시간(ms)"""
+    code = "import streamlit\n" + "".join(f"import {name}\n" for name in modules)
+    output = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=tempfile.gettempdir(),
+                            env=_env(), capture_output=True, text=True, check=True)
+    cumulative = {}
+    for match in _IMPORT_LINE.finditer(output.stderr):
+        name = match.group(4)
+        if name.startswith("src.") or name in THIRD_PARTY:
+            cumulative[name] = round(int(match.group(2)) / 1000, 2)
+    streamlit_ms = cumulative.get("streamlit", 0.0)
+    top_level = [name for name in modules if name in cumulative]
+    return {
+        "modules_ms": dict(sorted(cumulative.items(), key=lambda item: -item[1])),
+        "total_ms": round(sum(cumulative[name] for name in top_level), 2),
+        "streamlit_ms": streamlit_ms,
+        "loaded": sorted(name for name in cumulative if name.startswith("src.")),
+        "heavy_loaded": sorted(name for name in cumulative if name in THIRD_PARTY[1:]),
+    }
+
+
+# ---------------- 첫 렌더 시간 (워커 프로세스) ----------------
+def run_worker(page: str) -> Dict:
+    started = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP_PATH, default_timeout=120)
+    at.secrets["MOVIEDB_API_KEY"] = "bench"
+    at.session_state["selected_page"] = PAGE_NAMES[page]
+    imported = time.perf_counter()
+    at.run()
+    finished = time.perf_counter()
+    from src import metrics  # AppTest가 같은 프로세스에서 실행했으므로 앱이 기록한 렌더 정보를 읽을 수 있음
+
+    render = metrics.registry.last_renders.get(PAGE_NAMES[page])
+    return {
+        "harness_ms": round((imported - started) * 1000, 1),
+        "first_render_ms": round((finished - imported) * 1000, 1),
+        "page_ms": round(render.elapsed * 1000, 1) if render else None,
+        "exceptions": len(at.exception),
+    }
+
+
+def first_render(page: str, upstream: str) -> Dict:
+    workdir = tempfile.mkdtemp(prefix="moviemind-startup-")
+    env = _env({
+        "MOVIEMIND_TMDB_BASE_URL": f"{upstream}/3",
+        "MOVIEMIND_TRANSLATE_URL": f"{upstream}/translate_a/single",
+        "MOVIEMIND_IMAGE_BASE_URL": f"{upstream}/t/p",
+        "MOVIEMIND_POSTER_DIR": os.path.join(workdir, "posters"),
+        "MOVIEMIND_TRANSLATION_DB": os.path.join(workdir, "translations.sqlite3"),
+        "MOVIEMIND_CATALOG_DB": os.path.join(workdir, "catalog.sqlite3"),
+    })
+    started = time.perf_counter()
+    output = subprocess.run([sys.executable, "-m", "bench.startup_bench", "--worker", page],
+                            cwd=workdir, env=env, capture_output=True, text=True, check=False)
+    wall_ms = (time.perf_counter() - started) * 1000
+    if output.returncode != 0:
+        raise RuntimeError(f"{page} 첫 렌더 측정 실패:\n{output.stderr}")
+    result = json.loads(output.stdout.strip().splitlines()[-1])
+    result["process_ms"] = round(wall_ms, 1)
+    return result
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="MovieMind 시작 시간 벤치마크")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--pages", nargs="+", choices=PAGE_NAMES, default=list(PAGE_NAMES))
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--out", help="JSON 보고서 저장 경로")
+    parser.add_argument("--worker", choices=PAGE_NAMES, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker)))
+        return
+
+    report = {"imports": {}, "first_render": {}}
+    for name, modules in PAGE_MODULES.items():
+        runs = [import_profile(modules) for _ in range(args.rounds)]
+        best = min(runs, key=lambda run: run["total_ms"])
+        best["total_ms_median"] = round(statistics.median(run["total_ms"] for run in runs), 2)
+        report["imports"][name] = best
+
+    upstream_args = argparse.Namespace(latency_ms=args.latency_ms, jitter_ms=0, error_rate=0, error_status=500,
+                                       endpoint_latency=[], recordings=None)
+    process, upstream = start_upstream(upstream_args)
+    try:
+        for page in args.pages:
+            runs = [first_render(page, upstream) for _ in range(args.rounds)]
+            report["first_render"][page] = {
+                metric: round(statistics.median(run[metric] for run in runs), 1)
+                for metric in ("process_ms", "harness_ms", "first_render_ms", "page_ms")
+            }
+            report["first_render"][page]["exceptions"] = sum(run["exceptions"] for run in runs)
+    finally:
+        process.terminate()
+
+    for name, profile in report["imports"].items():
+        print(f"[import] {name:<8} src 모듈 {profile['total_ms_median']:>8.1f} ms (streamlit 제외), "
+              f"무거운 의존성: {', '.join(profile['heavy_loaded']) or '없음'}")
+    for page, row in report["first_render"].items():
+        print(f"[render] {page:<8} 프로세스 {row['process_ms']:>8.1f} ms, 첫 렌더 {row['first_render_ms']:>8.1f} ms "
+              f"(그중 페이지 모듈 import+실행 {row['page_ms']:>7.1f} ms)")
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Coroutine, Iterable, List, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# ---------------- 백그라운드 이벤트 루프 ----------------
+# Streamlit 스크립트 스레드는 세션마다 다르므로, 프로세스에 하나뿐인 루프를 별도 스레드에서 돌리고
+# 모든 비동기 요청(과 풀링된 비동기 HTTP 클라이언트)이 이 루프를 공유합니다.
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_loop_lock = threading.Lock()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """📌 프로세스 공용 이벤트 루프를 반환합니다 (처음 호출 시 시작)."""
+    global _loop, _loop_thread
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            _loop_thread = threading.Thread(target=_loop.run_forever, name="moviemind-aio", daemon=True)
+            _loop_thread.start()
+        return _loop
+
+
+async def _run_in_context(coro: Coroutine[Any, Any, T], context: contextvars.Context) -> T:
+    # 태스크는 생성 시점의 컨텍스트를 복사하므로, 호출한 스레드의 컨텍스트 안에서 태스크를 만듭니다.
+    return await context.run(asyncio.ensure_future, coro)
+
+
+def submit(coro: Coroutine[Any, Any, T]) -> "Future[T]":
+    """📌 코루틴을 공용 루프에 넘기고 기다리지 않습니다 (백그라운드 프리페치용).
+
+    넘기는 시점에 호출한 스레드의 contextvars를 복사하므로, 코루틴이 나중에 실행되어도
+    요청은 그 시점의 페이지/섹션에 집계됩니다.
+    """
+    return asyncio.run_coroutine_threadsafe(_run_in_context(coro, contextvars.copy_context()), get_loop())
+
+
+def run_sync(coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+    """📌 동기 코드(Streamlit 페이지)에서 코루틴을 공용 루프에 실행하고 결과를 기다립니다.
+
+    호출한 스레드의 contextvars(페이지/섹션 계측 정보 등)가 코루틴에 그대로 전달됩니다.
+    """
+    if threading.current_thread() is _loop_thread:
+        coro.close()
+        raise RuntimeError("run_sync는 이벤트 루프 스레드 안에서 호출할 수 없습니다. await를 사용하세요.")
+    return submit(coro).result(timeout)
+
+
+async def gather_limited(func: Callable[[T], Awaitable[R]], items: Iterable[T], concurrency: int) -> List[R]:
+    """📌 items 각각에 func를 최대 concurrency개까지 동시에 실행하고, 입력 순서대로 결과를 반환합니다."""
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(item: T) -> R:
+        async with semaphore:
+            return await func(item)
+
+    return list(await asyncio.gather(*(run(item) for item in items)))
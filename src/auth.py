@@ -1,19 +1,36 @@
-import requests
 import streamlit as st
-import webbrowser
-
-BASE_URL = "https://api.themoviedb.org/3"
-API_KEY = st.secrets["MOVIEDB_API_KEY"]
+from src import config, http_client
+from src.config import BASE_URL
 
 # ---------------- 사용자 인증 및 프로필 관리 ----------------
+# 즐겨찾기·시청 기록은 세션 상태에 영화 ID 목록으로 보관하고, 맞춤 추천 프로필에 함께 넘깁니다.
+FAVORITES_KEY = "favorite_movie_ids"
+WATCHED_KEY = "watched_movie_ids"
+
 def load_user_preferences():
-    """📌 사용자의 선호 장르 및 설정을 로드합니다."""
-    return st.session_state.get("user_profile", {})
+    """📌 사용자의 선호 장르 및 설정을 로드합니다 (즐겨찾기·시청 기록이 있으면 함께 담음)."""
+    profile = st.session_state.get("user_profile", {})
+    history = {key: list(st.session_state[key]) for key in (FAVORITES_KEY, WATCHED_KEY) if st.session_state.get(key)}
+    return {**profile, **history} if profile and history else profile
+
+def remember_movie(key, movie_id):
+    """📌 즐겨찾기(FAVORITES_KEY) 또는 시청 기록(WATCHED_KEY)에 영화를 추가합니다."""
+    movie_ids = st.session_state.setdefault(key, [])
+    if movie_id not in movie_ids:
+        movie_ids.append(movie_id)
+
+def show_history_buttons(movie_id, key):
+    """📌 "즐겨찾기"·"봤어요" 버튼 (누른 영화는 다음 맞춤 추천의 프로필에 반영되고 추천에서 빠짐)"""
+    favorite, watched = st.columns(2)
+    if favorite.button("⭐ 즐겨찾기", key=f"favorite_{key}"):
+        remember_movie(FAVORITES_KEY, movie_id)
+    if watched.button("✅ 봤어요", key=f"watched_{key}"):
+        remember_movie(WATCHED_KEY, movie_id)
 
 def create_guest_session():
     """📌 TMDb에서 로그인 없이 영화 추천을 받을 수 있도록 게스트 세션 생성."""
-    url = f"{BASE_URL}/authentication/guest_session/new?api_key={API_KEY}"
-    response = requests.get(url)
+    url = f"{BASE_URL}/authentication/guest_session/new"
+    response = http_client.get(url, params={"api_key": config.tmdb_api_key()})
     data = response.json()
     
     if response.status_code == 200 and data.get("success"):
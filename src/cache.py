@@ -0,0 +1,116 @@
+import asyncio
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import httpx
+
+from src import http_client, metrics, resilience
+from src.aio import get_loop
+from src.cache_backend import create_backend
+from src.singleflight import SingleFlight
+
+# ---------------- 캐시 설정 ----------------
+SECRET_PARAMS = {"api_key", "appid"}  # 캐시 키에서 제외할 인증 파라미터
+
+# 엔드포인트 종류별 TTL(초) — 경로에 먼저 포함되는 규칙이 적용됩니다.
+TTL_RULES = [
+    ("/trending/", 60 * 60),        # 트렌딩: 1시간
+    ("/movie/popular", 60 * 60),    # 인기 영화: 1시간
+    ("/discover/", 60 * 60),        # 장르/키워드 탐색: 1시간
+    ("/search/", 5 * 60),           # 검색: 5분
+    ("/person/", 24 * 60 * 60),     # 인물 필모그래피: 1일
+    ("/movie/", 24 * 60 * 60),      # 상세/크레딧/번역/유사 영화: 1일
+]
+DEFAULT_TTL = 10 * 60
+
+
+def ttl_for(url: str) -> int:
+    """📌 URL 경로에 맞는 TTL을 반환합니다."""
+    path = urlsplit(url).path
+    for prefix, ttl in TTL_RULES:
+        if prefix in path:
+            return ttl
+    return DEFAULT_TTL
+
+
+def make_cache_key(url: str, params: Optional[Dict] = None) -> str:
+    """📌 엔드포인트 + 정규화된 파라미터(API 키 제외)로 캐시 키를 만듭니다."""
+    parts = urlsplit(url)
+    merged = dict(parse_qsl(parts.query))
+    merged.update(params or {})
+    normalized = sorted(
+        (str(k), str(v).strip())
+        for k, v in merged.items()
+        if k not in SECRET_PARAMS and v is not None
+    )
+    return f"{parts.scheme}://{parts.netloc}{parts.path}?{urlencode(normalized)}"
+
+
+# 모든 Streamlit 세션이 공유하는 캐시. MOVIEMIND_CACHE_BACKEND로 memory(기본) / sqlite / redis를 고릅니다.
+# sqlite와 redis는 여러 워커 프로세스가 함께 쓰고, 재시작 후에도 데이터가 남습니다.
+response_cache = create_backend()
+# 세션과 무관하게 동일 키로 진행 중인 네트워크 요청을 하나로 합칩니다 (실행/합쳐진 횟수는 엔드포인트별로 계측).
+request_flight = SingleFlight(on_call=metrics.record_flight)
+
+
+def invalidate(url: str, params: Optional[Dict] = None) -> None:
+    """📌 해당 요청의 캐시 항목을 지웁니다 (공유 백엔드면 모든 워커에서 지워짐)."""
+    response_cache.delete(make_cache_key(url, params))
+
+
+def peek_cached(url: str, params: Optional[Dict] = None) -> Optional[Any]:
+    """📌 네트워크 요청 없이 캐시에 있는 값만 반환합니다 (stale 값 포함, 없으면 None)."""
+    value, _ = response_cache.get(make_cache_key(url, params))
+    return value
+
+
+# ---------------- 비동기 조회 ----------------
+async def _fetch_async(key: str, url: str, params: Optional[Dict], ttl: int) -> Optional[Any]:
+    try:
+        response = await http_client.async_get(url, params=params)
+        if response.status_code != 200:
+            return None
+        data = response.json()
+    except (httpx.HTTPError, ValueError) as e:
+        print(f"요청 오류 ({url}): {e}")
+        return None
+    await response_cache.aset(key, data, len(response.content), ttl)
+    if resilience.snapshot_enabled(url):
+        await asyncio.to_thread(resilience.snapshots.put, key, data)
+    return data
+
+
+def _revalidate_in_background(key: str, url: str, params: Optional[Dict], ttl: int) -> None:
+    """📌 stale 값을 반환한 뒤 공용 루프에서 새로 받아 캐시를 갱신합니다 (같은 키의 진행 중인 요청과 합쳐짐)."""
+    asyncio.run_coroutine_threadsafe(
+        request_flight.do_async(key, lambda: _fetch_async(key, url, params, ttl)), get_loop()
+    )
+
+
+async def async_cached_get(url: str, params: Optional[Dict] = None, ttl: Optional[int] = None,
+                           refresh: bool = False) -> Optional[Any]:
+    """📌 캐시를 거쳐 GET 요청의 JSON 응답을 반환합니다. 실패 시 None.
+
+    만료되었지만 stale 구간에 있는 값은 즉시 반환하고, 백그라운드에서 갱신합니다.
+    refresh=True면 캐시를 건너뛰고 새로 받아 캐시를 갱신합니다 (백그라운드 갱신 작업용).
+    트렌딩·인기·탐색·상세 요청은 페이지 지연 예산 안에서만 기다리고, 넘거나 실패하면
+    디스크에 남은 마지막 성공 응답을 대신 반환합니다 (src.resilience.fetch_within_budget).
+    """
+    ttl = ttl if ttl is not None else ttl_for(url)
+    key = make_cache_key(url, params)
+    value, stale = (None, False) if refresh else await response_cache.aget(key)
+    if value is not None:
+        metrics.record_cache(url, "stale" if stale else "hit")
+        if stale:
+            _revalidate_in_background(key, url, params, ttl)
+        return value
+
+    async def load() -> Optional[Any]:
+        return await request_flight.do_async(key, lambda: _fetch_async(key, url, params, ttl))
+
+    if refresh:
+        return await load()
+    metrics.record_cache(url, "miss")
+    if resilience.snapshot_enabled(url):
+        return await resilience.fetch_within_budget(key, url, load)
+    return await load()
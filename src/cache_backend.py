@@ -0,0 +1,439 @@
+import asyncio
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+try:
+    import msgpack
+except ImportError:  # msgpack이 없으면 JSON으로 직렬화
+    msgpack = None
+
+# ---------------- 캐시 백엔드 설정 ----------------
+BACKEND = os.environ.get("MOVIEMIND_CACHE_BACKEND", "memory")      # memory | sqlite | redis
+SQLITE_PATH = os.environ.get("MOVIEMIND_CACHE_DB", os.path.join(".cache", "responses.sqlite3"))
+REDIS_URL = os.environ.get("MOVIEMIND_REDIS_URL", "redis://127.0.0.1:6379/0")
+KEY_PREFIX = "moviemind:"           # Redis 키 이름공간 (clear()는 이 접두사만 지움)
+MAX_BYTES = 64 * 1024 * 1024        # 백엔드별 저장 상한 (memory: 객체 크기, sqlite: 직렬화 크기)
+STALE_FACTOR = 1.0                  # 만료 후 TTL * STALE_FACTOR 동안은 오래된 값을 반환하며 갱신
+COMPRESS_MIN_BYTES = 1024           # 이보다 큰 값만 zlib 압축
+TOUCH_INTERVAL = 60                 # sqlite: 마지막 사용 시각 갱신 최소 간격(초) — 읽기마다 쓰지 않도록
+
+
+# ---------------- 직렬화 ----------------
+# 첫 바이트: 형식(m=msgpack, j=json), 둘째 바이트: 압축 여부(z=zlib, -=없음)
+def encode(value: Any) -> bytes:
+    """📌 값을 작은 바이트열로 직렬화합니다 (msgpack 또는 JSON, 크면 zlib 압축)."""
+    if msgpack is not None:
+        fmt, body = b"m", msgpack.packb(value, use_bin_type=True)
+    else:
+        fmt, body = b"j", json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if len(body) >= COMPRESS_MIN_BYTES:
+        return fmt + b"z" + zlib.compress(body, 6)
+    return fmt + b"-" + body
+
+
+def decode(data: bytes) -> Any:
+    fmt, compressed, body = data[:1], data[1:2], data[2:]
+    if compressed == b"z":
+        body = zlib.decompress(body)
+    if fmt == b"m":
+        if msgpack is None:
+            raise ValueError("msgpack으로 저장된 값이지만 msgpack이 설치되어 있지 않습니다.")
+        return msgpack.unpackb(body, raw=False)
+    return json.loads(body)
+
+
+# ---------------- 공통 인터페이스 ----------------
+class CacheBackend:
+    """📌 응답 캐시 백엔드 인터페이스
+
+    get()은 (값, stale 여부)를 반환합니다. 신선 구간(TTL)이 지나도 TTL * STALE_FACTOR 동안은
+    stale=True로 값을 돌려주며, 그 뒤에는 없는 것으로 봅니다. 모든 백엔드가 같은 규칙을 따릅니다.
+    aget()/aset()은 이벤트 루프에서 쓰는 비동기 버전으로, 기본 구현은 파일·네트워크 입출력이
+    공유 루프를 막지 않도록 별도 스레드에서 get()/set()을 실행합니다.
+    """
+
+    name = "base"
+
+    def __init__(self):
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Tuple[Optional[Any], bool]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, size: int, ttl: int) -> None:
+        raise NotImplementedError
+
+    async def aget(self, key: str) -> Tuple[Optional[Any], bool]:
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: Any, size: int, ttl: int) -> None:
+        await asyncio.to_thread(self.set, key, value, size, ttl)
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def _count(self, value: Optional[Any], stale: bool) -> Tuple[Optional[Any], bool]:
+        if value is None:
+            self.misses += 1
+        elif stale:
+            self.stale_hits += 1
+        else:
+            self.hits += 1
+        return value, stale
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": self.name, "hits": self.hits, "stale_hits": self.stale_hits, "misses": self.misses}
+
+
+# ---------------- 메모리 (프로세스 내부) ----------------
+class _Entry:
+    __slots__ = ("value", "size", "fresh_until", "stale_until")
+
+    def __init__(self, value: Any, size: int, fresh_until: float, stale_until: float):
+        self.value = value
+        self.size = size
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+
+
+class MemoryBackend(CacheBackend):
+    """📌 바이트 크기로 제한되는 스레드 안전 LRU 캐시 (직렬화 없이 객체를 그대로 보관)"""
+
+    name = "memory"
+
+    def __init__(self, max_bytes: int = MAX_BYTES):
+        super().__init__()
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Tuple[Optional[Any], bool]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now >= entry.stale_until:
+                if entry is not None:
+                    self._remove(key)
+                return self._count(None, False)
+            self._entries.move_to_end(key)
+            return self._count(entry.value, now >= entry.fresh_until)
+
+    def set(self, key: str, value: Any, size: int, ttl: int) -> None:
+        """📌 값을 저장하고 용량을 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다."""
+        if size > self.max_bytes:
+            return
+        now = time.monotonic()
+        entry = _Entry(value, size, now + ttl, now + ttl * (1 + STALE_FACTOR))
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    # 메모리 조회·저장은 입출력이 없으므로 스레드로 넘기지 않고 바로 실행합니다.
+    async def aget(self, key: str) -> Tuple[Optional[Any], bool]:
+        return self.get(key)
+
+    async def aset(self, key: str, value: Any, size: int, ttl: int) -> None:
+        self.set(key, value, size, ttl)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**super().stats(), "entries": len(self._entries), "bytes": self._bytes}
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+
+# ---------------- SQLite (같은 호스트의 프로세스끼리 공유) ----------------
+class SqliteBackend(CacheBackend):
+    """📌 같은 파일을 여러 프로세스가 함께 쓰는 캐시 (WAL 모드 + 메모리 매핑 읽기)
+
+    만료 시각은 벽시계 기준으로 저장하므로 재시작 후에도 그대로 유효하며,
+    전체 크기가 상한을 넘으면 마지막 사용 시각이 오래된 항목부터 지웁니다.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str = SQLITE_PATH, max_bytes: int = MAX_BYTES):
+        super().__init__()
+        self.path = path
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._writes = 0
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA mmap_size={self.max_bytes * 2}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL,"
+                " fresh_until REAL NOT NULL, stale_until REAL NOT NULL, last_used REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Tuple[Optional[Any], bool]:
+        now = time.time()
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value, fresh_until, stale_until, last_used FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now >= row[2]:
+                return self._count(None, False)
+            if now - row[3] >= TOUCH_INTERVAL:
+                conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+            return self._count(decode(row[0]), now >= row[1])
+        except (sqlite3.Error, ValueError, zlib.error) as e:
+            print(f"캐시 조회 오류 ({self.name}): {e}")
+            return self._count(None, False)
+
+    def set(self, key: str, value: Any, size: int, ttl: int) -> None:
+        data = encode(value)
+        if len(data) > self.max_bytes:
+            return
+        now = time.time()
+        try:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, fresh_until, stale_until, last_used)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, data, len(data), now + ttl, now + ttl * (1 + STALE_FACTOR), now),
+            )
+            with self._lock:
+                self._writes += 1
+                check = self._writes % 64 == 1
+            if check:
+                self._evict(conn, now)
+        except sqlite3.Error as e:
+            print(f"캐시 저장 오류 ({self.name}): {e}")
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """📌 완전히 만료된 항목을 지우고, 그래도 상한을 넘으면 오래 쓰지 않은 항목부터 지웁니다."""
+        conn.execute("DELETE FROM responses WHERE stale_until <= ?", (now,))
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        excess = total - int(self.max_bytes * 0.9)  # 매번 지우지 않도록 여유를 두고 정리
+        rows = conn.execute("SELECT key, size FROM responses ORDER BY last_used").fetchall()
+        victims = []
+        for key, size in rows:
+            if excess <= 0:
+                break
+            victims.append((key,))
+            excess -= size
+        conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+
+    def delete(self, key: str) -> None:
+        try:
+            self._connect().execute("DELETE FROM responses WHERE key = ?", (key,))
+        except sqlite3.Error as e:
+            print(f"캐시 삭제 오류 ({self.name}): {e}")
+
+    def clear(self) -> None:
+        try:
+            self._connect().execute("DELETE FROM responses")
+        except sqlite3.Error as e:
+            print(f"캐시 삭제 오류 ({self.name}): {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        try:
+            entries, total = self._connect().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+            stats.update(entries=entries, bytes=total)
+        except sqlite3.Error:
+            pass
+        return stats
+
+
+# ---------------- Redis 프로토콜 (여러 호스트의 프로세스끼리 공유) ----------------
+class RespError(Exception):
+    pass
+
+
+class BackendUnavailable(ConnectionError):
+    """📌 최근에 연결이 실패해 재연결을 미루는 중 (이때는 조용히 캐시 미스로 처리)"""
+
+
+class _RespConnection:
+    """📌 RESP2 프로토콜 최소 구현 (GET/SET/DEL/SCAN 등 명령 하나씩 주고받기)"""
+
+    def __init__(self, host: str, port: int, db: int, timeout: float):
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.reader = self.sock.makefile("rb")
+        if db:
+            self.command("SELECT", db)
+
+    def command(self, *args) -> Any:
+        parts = [f"*{len(args)}\r\n".encode()]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode("utf-8")
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        self.sock.sendall(b"".join(parts))
+        return self._read()
+
+    def _read(self) -> Any:
+        line = self.reader.readline()
+        if not line:
+            raise ConnectionError("Redis 연결이 끊어졌습니다.")
+        kind, rest = line[:1], line[1:-2]
+        if kind == b"+":
+            return rest.decode()
+        if kind == b"-":
+            raise RespError(rest.decode())
+        if kind == b":":
+            return int(rest)
+        if kind == b"$":
+            length = int(rest)
+            if length < 0:
+                return None
+            data = self.reader.read(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            length = int(rest)
+            return None if length < 0 else [self._read() for _ in range(length)]
+        raise RespError(f"알 수 없는 응답: {line!r}")
+
+    def close(self) -> None:
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+
+
+class RedisBackend(CacheBackend):
+    """📌 Redis(또는 RESP 호환 서버)에 저장하는 캐시. 여러 호스트의 복제본이 같은 캐시를 씁니다.
+
+    값 앞에 신선/유지 만료 시각(벽시계)을 붙여 저장하고, 키 만료(PX)는 유지 구간 끝으로 설정합니다.
+    서버에 연결할 수 없으면 캐시가 없는 것처럼 동작합니다.
+    """
+
+    name = "redis"
+    RETRY_CONNECT_AFTER = 5.0  # 연결 실패 후 다시 시도하기까지 기다리는 시간(초)
+
+    def __init__(self, url: str = REDIS_URL, timeout: float = 0.5):
+        super().__init__()
+        parts = urlsplit(url)
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 6379
+        self.db = int(parts.path.strip("/") or 0)
+        self.timeout = timeout
+        self._local = threading.local()
+        self._down_until = 0.0
+
+    def _command(self, *args) -> Any:
+        if time.monotonic() < self._down_until:
+            raise BackendUnavailable()
+        conn = getattr(self._local, "conn", None)
+        try:
+            if conn is None:
+                conn = self._local.conn = _RespConnection(self.host, self.port, self.db, self.timeout)
+            return conn.command(*args)
+        except (OSError, ConnectionError):
+            if conn is not None:
+                conn.close()
+            self._local.conn = None
+            self._down_until = time.monotonic() + self.RETRY_CONNECT_AFTER
+            raise
+
+    def get(self, key: str) -> Tuple[Optional[Any], bool]:
+        try:
+            data = self._command("GET", KEY_PREFIX + key)
+            if data is None:
+                return self._count(None, False)
+            fresh_until, stale_until, payload = data.split(b"|", 2)
+            now = time.time()
+            if now >= float(stale_until):
+                return self._count(None, False)
+            return self._count(decode(payload), now >= float(fresh_until))
+        except BackendUnavailable:
+            return self._count(None, False)
+        except (OSError, ConnectionError, RespError, ValueError, zlib.error) as e:
+            print(f"캐시 조회 오류 ({self.name}): {e}")
+            return self._count(None, False)
+
+    def set(self, key: str, value: Any, size: int, ttl: int) -> None:
+        now = time.time()
+        stale_ttl = ttl * (1 + STALE_FACTOR)
+        header = f"{now + ttl:.3f}|{now + stale_ttl:.3f}|".encode()
+        try:
+            self._command("SET", KEY_PREFIX + key, header + encode(value), "PX", int(stale_ttl * 1000))
+        except BackendUnavailable:
+            pass
+        except (OSError, ConnectionError, RespError) as e:
+            print(f"캐시 저장 오류 ({self.name}): {e}")
+
+    def delete(self, key: str) -> None:
+        try:
+            self._command("DEL", KEY_PREFIX + key)
+        except (OSError, ConnectionError, RespError) as e:
+            print(f"캐시 삭제 오류 ({self.name}): {e}")
+
+    def _scan(self, pattern: str) -> List[bytes]:
+        keys, cursor = [], b"0"
+        while True:
+            cursor, batch = self._command("SCAN", cursor, "MATCH", pattern, "COUNT", 500)
+            keys += batch
+            if cursor in (b"0", 0, "0"):
+                return keys
+
+    def clear(self) -> None:
+        try:
+            keys = self._scan(KEY_PREFIX + "*")
+            for start in range(0, len(keys), 500):
+                self._command("DEL", *keys[start:start + 500])
+        except (OSError, ConnectionError, RespError) as e:
+            print(f"캐시 삭제 오류 ({self.name}): {e}")
+
+
+BACKENDS = {
+    "memory": MemoryBackend,
+    "sqlite": SqliteBackend,
+    "redis": RedisBackend,
+}
+
+
+def create_backend(name: str = BACKEND) -> CacheBackend:
+    """📌 이름(MOVIEMIND_CACHE_BACKEND)에 맞는 캐시 백엔드를 만듭니다."""
+    try:
+        return BACKENDS[name]()
+    except KeyError:
+        raise ValueError(f"알 수 없는 캐시 백엔드: {name} (사용 가능: {', '.join(BACKENDS)})") from None
@@ -0,0 +1,258 @@
+import argparse
+import json
+import os
+import re
+import sqlite3
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from src.models import Movie, to_movies
+
+# ---------------- 로컬 영화 카탈로그 설정 ----------------
+CATALOG_PATH = os.environ.get("MOVIEMIND_CATALOG_DB", os.path.join("data", "catalog.sqlite3"))
+INGEST_BATCH_SIZE = 5000
+NGRAM = 2  # 한글 부분 일치를 위해 글자 2-gram 사용
+
+COLUMNS = (
+    "id", "title", "original_title", "overview", "poster_path", "release_date",
+    "popularity", "vote_average", "vote_count", "genre_ids", "keyword_ids", "cast_ids",
+)
+LIST_COLUMNS = ("genre_ids", "keyword_ids", "cast_ids")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS movies (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    original_title TEXT,
+    overview TEXT,
+    poster_path TEXT,
+    release_date TEXT,
+    popularity REAL DEFAULT 0,
+    vote_average REAL DEFAULT 0,
+    vote_count INTEGER DEFAULT 0,
+    genre_ids TEXT,
+    keyword_ids TEXT,
+    cast_ids TEXT
+)
+"""
+
+
+def connect(path: str = CATALOG_PATH) -> sqlite3.Connection:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(SCHEMA)
+    return conn
+
+
+# ---------------- 대량 적재 ----------------
+def _ids(items) -> str:
+    """📌 [id, ...] 또는 [{"id": ...}, ...]를 "1,2,3" 형태로 압축합니다."""
+    ids = []
+    for item in items or []:
+        value = item.get("id") if isinstance(item, dict) else item
+        if value is not None:
+            ids.append(str(int(value)))
+    return ",".join(ids)
+
+
+def normalize_record(raw: Dict) -> Optional[tuple]:
+    """📌 TMDb 형식의 영화 JSON을 카탈로그 행으로 변환합니다. 필수 값이 없으면 None."""
+    if raw.get("id") is None or not (raw.get("title") or raw.get("original_title")):
+        return None
+    keywords = raw.get("keywords", [])
+    if isinstance(keywords, dict):  # append_to_response=keywords 형식
+        keywords = keywords.get("keywords", [])
+    credits = raw.get("credits") or {}
+    return (
+        int(raw["id"]),
+        raw.get("title") or raw.get("original_title"),
+        raw.get("original_title"),
+        raw.get("overview", ""),
+        raw.get("poster_path"),
+        raw.get("release_date", ""),
+        float(raw.get("popularity") or 0),
+        float(raw.get("vote_average") or 0),
+        int(raw.get("vote_count") or 0),
+        _ids(raw.get("genre_ids") or raw.get("genres")),
+        _ids(keywords),
+        _ids(raw.get("cast_ids") or credits.get("cast", [])[:20]),
+    )
+
+
+def ingest_records(records: Iterable[Dict], path: str = CATALOG_PATH) -> int:
+    """📌 영화 레코드를 카탈로그에 일괄 저장(같은 ID는 덮어쓰기)하고 저장한 개수를 반환합니다."""
+    conn = connect(path)
+    placeholders = ",".join("?" * len(COLUMNS))
+    sql = f"INSERT OR REPLACE INTO movies ({','.join(COLUMNS)}) VALUES ({placeholders})"
+    count = 0
+    batch = []
+    try:
+        for raw in records:
+            row = normalize_record(raw)
+            if row is None:
+                continue
+            batch.append(row)
+            if len(batch) >= INGEST_BATCH_SIZE:
+                with conn:
+                    conn.executemany(sql, batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            with conn:
+                conn.executemany(sql, batch)
+            count += len(batch)
+    finally:
+        conn.close()
+    return count
+
+
+def _read_jsonl(file_path: str) -> Iterator[Dict]:
+    with open(file_path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                print(f"{file_path}:{line_no} 건너뜀: {e}")
+
+
+def ingest_jsonl(file_path: str, path: str = CATALOG_PATH) -> int:
+    """📌 TMDb 형식의 JSON-lines 파일을 카탈로그로 적재합니다."""
+    return ingest_records(_read_jsonl(file_path), path)
+
+
+def _decode_row(row: tuple) -> Dict:
+    movie = dict(zip(COLUMNS, row))
+    for column in LIST_COLUMNS:
+        movie[column] = [int(v) for v in movie[column].split(",")] if movie[column] else []
+    return movie
+
+
+def iter_movies(path: str = CATALOG_PATH) -> Iterator[Dict]:
+    """📌 카탈로그의 모든 영화를 ID 순서로 반환합니다."""
+    if not os.path.exists(path):
+        return
+    conn = connect(path)
+    try:
+        for row in conn.execute(f"SELECT {','.join(COLUMNS)} FROM movies ORDER BY id"):
+            yield _decode_row(row)
+    finally:
+        conn.close()
+
+
+def get_movies(movie_ids: List[int], path: str = CATALOG_PATH) -> List[Dict]:
+    """📌 ID 목록에 해당하는 영화를 요청한 순서대로 반환합니다 (카탈로그에 없는 ID는 제외)."""
+    if not movie_ids or not os.path.exists(path):
+        return []
+    conn = connect(path)
+    try:
+        placeholders = ",".join("?" * len(movie_ids))
+        rows = conn.execute(
+            f"SELECT {','.join(COLUMNS)} FROM movies WHERE id IN ({placeholders})",
+            [int(movie_id) for movie_id in movie_ids],
+        ).fetchall()
+    finally:
+        conn.close()
+    by_id = {row[0]: _decode_row(row) for row in rows}
+    return [by_id[int(movie_id)] for movie_id in movie_ids if int(movie_id) in by_id]
+
+
+# ---------------- 제목 n-gram 역색인 ----------------
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def normalize_title(text: str) -> str:
+    """📌 소문자화하고 공백·구두점을 제거합니다 ("스파이더맨: 노 웨이 홈" → "스파이더맨노웨이홈")."""
+    return _NON_WORD.sub("", (text or "").lower())
+
+
+def ngrams(text: str, n: int = NGRAM) -> set:
+    if len(text) < n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class TitleIndex:
+    """📌 한국어 제목과 원제에 대한 글자 n-gram 역색인 (인기순 정렬)
+
+    카탈로그 파일의 수정 시각이 바뀌면 (다른 프로세스에서 적재한 경우 포함) 다음 조회 때 다시 만듭니다.
+    """
+
+    def __init__(self, path: str = CATALOG_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._movies: Optional[List[Movie]] = None
+        self._mtime: Optional[float] = None
+        self._titles: List[str] = []
+        self._postings: Dict[str, List[int]] = {}
+
+    def _ensure_built(self) -> List[Movie]:
+        mtime = os.path.getmtime(self.path) if os.path.exists(self.path) else None
+        with self._lock:
+            if self._movies is not None and mtime == self._mtime:
+                return self._movies
+            # 인기순으로 정렬해 두면 게시 목록도 인기순이 되어 상위 결과만 바로 잘라낼 수 있습니다.
+            movies = sorted(iter_movies(self.path), key=lambda m: -m["popularity"])
+            titles, postings = [], {}
+            for doc_id, movie in enumerate(movies):
+                text = normalize_title(movie["title"]) + "|" + normalize_title(movie["original_title"])
+                titles.append(text)
+                grams = set()
+                for part in text.split("|"):
+                    grams |= ngrams(part) | set(part)
+                for gram in grams:
+                    postings.setdefault(gram, []).append(doc_id)
+            self._titles, self._postings, self._movies = titles, postings, to_movies(movies)
+            self._mtime = mtime
+            return self._movies
+
+    def __len__(self) -> int:
+        return len(self._ensure_built())
+
+    def search(self, query: str, limit: int = 20) -> List[Movie]:
+        movies = self._ensure_built()
+        needle = normalize_title(query)
+        if not needle or not movies:
+            return []
+        grams = ngrams(needle) if len(needle) >= NGRAM else {needle}
+        lists = sorted((self._postings.get(g, []) for g in grams), key=len)
+        if not lists or not lists[0]:
+            return []
+        candidates = set(lists[0]).intersection(*lists[1:]) if len(lists) > 1 else lists[0]
+        # n-gram이 모두 있어도 순서가 다를 수 있으므로 부분 문자열로 최종 확인
+        matches = sorted(doc_id for doc_id in candidates if needle in self._titles[doc_id])
+        return [movies[doc_id] for doc_id in matches[:limit]]
+
+
+title_index = TitleIndex()
+
+
+def search_catalog(query: str, limit: int = 20) -> List[Movie]:
+    """📌 로컬 카탈로그에서 제목으로 검색합니다 (카탈로그가 없으면 빈 목록)."""
+    if not os.path.exists(title_index.path):
+        return []
+    return title_index.search(query, limit)
+
+
+# ---------------- 명령줄 도구 ----------------
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="MovieMind 로컬 영화 카탈로그 관리")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    ingest = subparsers.add_parser("ingest", help="TMDb 형식 JSON-lines 파일 적재")
+    ingest.add_argument("files", nargs="+")
+    ingest.add_argument("--db", default=CATALOG_PATH)
+    args = parser.parse_args(argv)
+
+    if args.command == "ingest":
+        for file_path in args.files:
+            count = ingest_jsonl(file_path, args.db)
+            print(f"{file_path}: {count}편 적재 완료 → {args.db}")
+
+
+if __name__ == "__main__":
+    main()
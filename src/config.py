@@ -0,0 +1,50 @@
+import os
+import threading
+from typing import Any, Dict, Optional
+
+import streamlit as st
+
+# ---------------- TMDb API 주소 ----------------
+# 모든 TMDb 요청이 이 주소를 씁니다 (벤치마크는 MOVIEMIND_TMDB_BASE_URL로 가짜 업스트림을 지정).
+BASE_URL = os.environ.get("MOVIEMIND_TMDB_BASE_URL", "https://api.themoviedb.org/3")
+
+
+# ---------------- 비밀 값(API 키) ----------------
+# 모듈을 불러올 때가 아니라 처음 사용할 때 st.secrets를 읽고, 이후에는 프로세스 안에서 재사용합니다.
+_MISSING = object()
+_secrets: Dict[str, Any] = {}
+_secrets_lock = threading.Lock()
+
+
+def secret(name: str, default: Any = _MISSING) -> Any:
+    """📌 st.secrets[name]을 한 번만 읽어 보관합니다.
+
+    default가 없으면 값이 없을 때 st.secrets와 같은 예외를 올리고 (다음 호출에서 다시 읽음),
+    default가 있으면 값이 없다는 사실도 보관해 기본값을 반환합니다.
+    """
+    value = _secrets.get(name, _MISSING)
+    if value is not _MISSING:
+        return value
+    with _secrets_lock:
+        if name not in _secrets:
+            try:
+                _secrets[name] = st.secrets[name]
+            except (KeyError, FileNotFoundError):
+                if default is _MISSING:
+                    raise
+                _secrets[name] = default
+        return _secrets[name]
+
+
+def tmdb_api_key() -> str:
+    return secret("MOVIEDB_API_KEY")
+
+
+def weather_api_key() -> Optional[str]:
+    return secret("WEATHER_API_KEY", None)
+
+
+def reset() -> None:
+    """📌 보관한 값을 비웁니다 (secrets.toml을 바꾼 뒤 다시 읽을 때)."""
+    with _secrets_lock:
+        _secrets.clear()
@@ -0,0 +1,258 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from src import config, http_client, resilience
+from src.aio import gather_limited, run_sync
+from src.cache import async_cached_get, make_cache_key
+from src.config import BASE_URL
+from src.models import Movie, to_movies
+
+# ---------------- 상황별 추천 설정 ----------------
+WEATHER_URL = os.environ.get("MOVIEMIND_WEATHER_URL", "http://api.openweathermap.org/data/2.5/weather")
+
+REFRESH_INTERVAL = 45 * 60     # 추천 목록 갱신 주기(초) — 탐색 응답 TTL(1시간)보다 먼저 갱신
+WEATHER_TTL = 10 * 60          # 도시별 날씨 유지 시간(초)
+CITY_IDLE_TTL = 60 * 60        # 이 시간 동안 조회되지 않은 도시는 백그라운드 갱신 대상에서 제외
+MAX_CITIES = 256
+SCHEDULER_TICK = 30            # 스케줄러가 갱신할 항목을 확인하는 간격(초)
+REFRESH_CONCURRENCY = 8
+
+TRENDING = "trending"          # 특정 장르가 없는 시간대에 쓰는 버킷
+
+# (시작 시, 끝 시, 장르) — 먼저 일치하는 구간이 적용됩니다.
+TIME_GENRES = [
+    (18, 23, "18"),            # 드라마
+    (7, 9, "35"),              # 코미디
+    (17, 19, "35"),            # 코미디
+    (0, 3, "27"),              # 공포
+]
+RAINY_WEATHER = {"Rain", "Drizzle", "Thunderstorm"}
+WEATHER_GENRES = {
+    "rain": "18,10749",        # 드라마, 로맨스
+    "clear": "35,28",          # 코미디, 액션
+}
+MOOD_TO_GENRE = {
+    "행복한": [35, 10751],  # 코미디, 가족
+    "슬픈": [18, 10749],    # 드라마, 로맨스
+    "신나는": [28, 12],     # 액션, 모험
+    "로맨틱한": [10749, 35],# 로맨스, 코미디
+    "무서운": [27, 53],     # 공포, 스릴러
+    "미스터리한": [9648, 80],# 미스터리, 범죄
+    "판타지한": [14, 12],   # 판타지, 모험
+    "편안한": [99, 10770],   # 다큐멘터리, TV 영화
+    "추억을 떠올리는": [10752, 36], # 전쟁, 역사
+    "SF 같은": [878, 28]    # SF, 액션
+}
+
+
+def time_bucket(hour: int) -> str:
+    """📌 시각(0~23)에 해당하는 버킷 (장르 ID 문자열 또는 TRENDING)"""
+    for start, end, genres in TIME_GENRES:
+        if start <= hour <= end:
+            return genres
+    return TRENDING
+
+
+def mood_bucket(mood: str) -> Optional[str]:
+    genres = MOOD_TO_GENRE.get(mood)
+    return ",".join(map(str, genres)) if genres else None
+
+
+def all_buckets() -> List[str]:
+    """📌 미리 계산해 둘 모든 버킷 (시간대·날씨·무드가 같은 장르 조합이면 하나로 합쳐짐)"""
+    buckets = [TRENDING]
+    buckets += [genres for _, _, genres in TIME_GENRES]
+    buckets += list(WEATHER_GENRES.values())
+    buckets += [mood_bucket(mood) for mood in MOOD_TO_GENRE]
+    return list(dict.fromkeys(buckets))
+
+
+# ---------------- 버킷 적재 ----------------
+def _bucket_request(bucket: str) -> Tuple[str, Dict]:
+    if bucket == TRENDING:
+        return f"{BASE_URL}/trending/movie/week", {"api_key": config.tmdb_api_key(), "language": "ko-KR"}
+    return f"{BASE_URL}/discover/movie", {"api_key": config.tmdb_api_key(), "with_genres": bucket, "language": "ko-KR"}
+
+
+async def _load_bucket(bucket: str) -> Optional[List[Movie]]:
+    """📌 버킷 하나를 새로 받아옵니다 (같은 요청을 쓰는 fetch_movies_by_genre 캐시도 함께 갱신)."""
+    url, params = _bucket_request(bucket)
+    data = await async_cached_get(url, params, refresh=True)
+    return to_movies(data.get("results")) if data else None
+
+
+async def _fetch_weather(city: str) -> Optional[str]:
+    """📌 도시의 날씨를 "rain" 또는 "clear"로 반환합니다. 실패 시 None."""
+    try:
+        response = await http_client.async_get(WEATHER_URL, params={"q": city, "appid": config.weather_api_key(), "units": "metric"})
+        if response.status_code != 200:
+            return None
+        weather = response.json().get("weather", [{}])[0].get("main", "Clear")
+    except (httpx.HTTPError, ValueError, IndexError, AttributeError) as e:
+        print(f"날씨 조회 오류 ({city}): {e}")
+        return None
+    return "rain" if weather in RAINY_WEATHER else "clear"
+
+
+class _City:
+    __slots__ = ("condition", "expires_at", "last_used")
+
+    def __init__(self, condition: Optional[str], expires_at: float, last_used: float):
+        self.condition = condition
+        self.expires_at = expires_at
+        self.last_used = last_used
+
+
+# ---------------- 미리 계산한 추천 테이블 ----------------
+class ContextRecommendations:
+    """📌 시간대·날씨·무드별 추천 목록을 메모리 테이블로 보관하고 백그라운드에서 갱신합니다.
+
+    조회는 딕셔너리 조회 한 번이며, 네트워크 요청은 스케줄러 스레드에서만 일어납니다.
+    (최초 적재 전에는 디스크 스냅숏의 마지막 목록을, 그것도 없으면 빈 목록을 반환합니다. 처음 보는 도시는
+    스케줄러에 맡기고 날씨를 받아 올 때까지 None을 반환합니다.)
+    버킷을 하나도 받지 못한 갱신은 완료로 치지 않으므로, 스케줄러는 SCHEDULER_TICK마다 다시 시도합니다.
+    """
+
+    def __init__(self):
+        self._table: Dict[str, List[Movie]] = {}
+        self._cities: "OrderedDict[str, _City]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._ready = threading.Event()       # 버킷을 하나 이상 적재함
+        self._wake = threading.Event()        # 새 도시가 들어오면 다음 확인 시각을 기다리지 않고 깨움
+        self._started = False
+        self.refreshed_at = 0.0
+
+    # ---- 갱신 ----
+    async def _refresh_buckets(self) -> int:
+        """📌 모든 버킷을 다시 받아 테이블을 갱신하고, 새로 받은 버킷 수를 반환합니다."""
+        buckets = all_buckets()
+        results = await gather_limited(_load_bucket, buckets, REFRESH_CONCURRENCY)
+        with self._lock:
+            table = dict(self._table)
+            for bucket, movies in zip(buckets, results):
+                if movies is not None:  # 실패한 버킷은 이전 목록을 유지
+                    table[bucket] = movies
+            self._table = table
+        return sum(movies is not None for movies in results)
+
+    async def _refresh_weather(self, cities: List[str]) -> None:
+        conditions = await gather_limited(_fetch_weather, cities, REFRESH_CONCURRENCY)
+        now = time.monotonic()
+        with self._lock:
+            for city, condition in zip(cities, conditions):
+                entry = self._cities.get(city)
+                if entry is not None and condition is not None:
+                    entry.condition = condition
+                    entry.expires_at = now + WEATHER_TTL
+
+    def _due_cities(self, now: float) -> List[str]:
+        """📌 다음 확인 전에 만료되는 도시 (오래 조회되지 않은 도시는 목록에서 제거)"""
+        with self._lock:
+            for city in [c for c, e in self._cities.items() if now - e.last_used > CITY_IDLE_TTL]:
+                del self._cities[city]
+            return [c for c, e in self._cities.items() if e.expires_at - now <= SCHEDULER_TICK * 2]
+
+    def refresh(self) -> bool:
+        """📌 버킷을 하나 이상 받았을 때만 준비 완료·갱신 시각을 기록합니다 (모두 실패하면 False)."""
+        loaded = run_sync(self._refresh_buckets())
+        if not loaded:
+            print("상황별 추천 갱신 실패: 받아온 버킷이 없습니다.")
+            return False
+        self.refreshed_at = time.monotonic()
+        self._ready.set()
+        return True
+
+    def _run_scheduler(self) -> None:
+        while True:
+            now = time.monotonic()
+            try:
+                if now - self.refreshed_at >= REFRESH_INTERVAL or not self._ready.is_set():
+                    self.refresh()
+                cities = self._due_cities(now) if config.weather_api_key() else []
+                if cities:
+                    run_sync(self._refresh_weather(cities))
+            except Exception as e:
+                print(f"상황별 추천 갱신 오류: {e}")
+            self._wake.wait(SCHEDULER_TICK)
+            self._wake.clear()
+
+    def start(self) -> None:
+        """📌 프로세스당 한 번, 백그라운드 갱신 스레드를 시작합니다."""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        threading.Thread(target=self._run_scheduler, name="moviemind-context-recs", daemon=True).start()
+
+    # ---- 조회 ----
+    def _from_snapshot(self, bucket: str) -> List[Movie]:
+        """📌 최초 적재 전: 같은 요청의 디스크 스냅숏으로 버킷을 채웁니다 (없으면 빈 목록, 디스크는 버킷당 한 번만 읽음)."""
+        snapshot = resilience.snapshots.get(make_cache_key(*_bucket_request(bucket)))
+        movies = to_movies(snapshot[0].get("results")) if snapshot else []
+        with self._lock:
+            return self._table.setdefault(bucket, movies)
+
+    def lookup(self, bucket: Optional[str]) -> List[Movie]:
+        """📌 기다리지 않습니다. 스케줄러가 아직 돌지 않았으면 시작만 하고 지금 있는 목록을 반환합니다."""
+        if bucket is None:
+            return []
+        if not self._ready.is_set():
+            self.start()
+            movies = self._table.get(bucket)
+            return self._from_snapshot(bucket) if movies is None else movies
+        return self._table.get(bucket, [])
+
+    def weather_condition(self, city: str) -> Optional[str]:
+        """📌 도시의 날씨 버킷. 캐시에 있으면 (만료 직후라도) 그대로 쓰고, 조회와 갱신은 스케줄러가 맡습니다.
+
+        처음 보는 도시는 스케줄러 대기열에 넣고 바로 None을 반환합니다 (다음 조회부터 날씨 버킷 사용).
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._cities.get(city)
+            if entry is not None:
+                entry.last_used = now
+                self._cities.move_to_end(city)
+                return entry.condition
+            self._cities[city] = _City(None, 0.0, now)  # 만료된 것으로 두어 다음 확인 때 바로 조회
+            while len(self._cities) > MAX_CITIES:
+                self._cities.popitem(last=False)
+        self.start()
+        self._wake.set()
+        return None
+
+
+context_recommendations = ContextRecommendations()
+
+
+# ---------------- 공개 함수 ----------------
+def start_context_refresh() -> None:
+    """📌 상황별 추천 스케줄러를 시작합니다 (첫 조회 전에 테이블이 채워지도록 앱 시작 시 호출)."""
+    context_recommendations.start()
+
+
+def get_time_based_recommendations(now: Optional[datetime] = None) -> List[Movie]:
+    """📌 현재 시간대에 따라 영화 추천 (해당 장르가 없는 시간대에는 트렌딩 영화)"""
+    hour = (now or datetime.now()).hour
+    return context_recommendations.lookup(time_bucket(hour))
+
+
+def get_weather_based_recommendations(city: str) -> List[Movie]:
+    """📌 사용자의 지역 날씨를 기반으로 적절한 영화를 추천"""
+    if not config.weather_api_key():
+        return []
+    condition = context_recommendations.weather_condition(city)
+    if condition is None:
+        return []
+    return context_recommendations.lookup(WEATHER_GENRES[condition])
+
+
+def get_mood_based_recommendations(mood: str) -> List[Movie]:
+    """📌 감정(무드)과 매핑된 장르 조합의 추천 목록 (알 수 없는 무드면 빈 목록)"""
+    return context_recommendations.lookup(mood_bucket(mood))
@@ -1,176 +1,268 @@
-import requests
-import streamlit as st
-from typing import List, Dict
-from datetime import datetime
-from deep_translator import GoogleTranslator
+import asyncio
+import threading
+from typing import List, Dict, Optional
+from src import config, context_recs
+from src.aio import gather_limited, run_sync, submit
+from src.cache import async_cached_get, peek_cached
+from src.catalog import search_catalog
+from src.config import BASE_URL
+from src.models import Movie, to_movies
+from src.movie_recommend import get_trending_movies, fetch_popular_movies
+from src.translation import translate_many
 
 # ---------------- TMDb API 설정 ----------------
-API_KEY = st.secrets["MOVIEDB_API_KEY"]
-BASE_URL = "https://api.themoviedb.org/3"
-WEATHER_API_KEY = st.secrets.get("WEATHER_API_KEY", None)
-WEATHER_URL = "http://api.openweathermap.org/data/2.5/weather"
-
-# ---------------- 번역 기능 ----------------
-def translate_text(text: str, source_lang: str = "auto", target_lang: str = "ko") -> str:
-    """📌 Google Translator를 사용하여 텍스트 번역"""
-    try:
-        return GoogleTranslator(source=source_lang, target=target_lang).translate(text)
-    except Exception as e:
-        print(f"번역 오류: {e}")
-        return text  # 번역 실패 시 원본 반환
-    
-def translate_text(text: str, target_lang: str = "ko") -> str:
-    """📌 Google Translate API를 직접 호출하여 텍스트 번역"""
-    url = "https://translate.googleapis.com/translate_a/single"
-    params = {
-        "client": "gtx",
-        "sl": "auto",  # 원본 언어 자동 감지
-        "tl": target_lang,
-        "dt": "t",
-        "q": text,
-    }
-    
-    try:
-        response = requests.get(url, params=params)
-        translated_text = response.json()[0][0][0]
-        return translated_text
-    except Exception as e:
-        print(f"번역 오류: {e}")
-        return text  # 번역 실패 시 원본 반환    
+FETCH_CONCURRENCY = 8  # 한 번에 동시에 보낼 최대 TMDb 요청 수
 
 # ---------------- 영화 번역 ----------------
-def fetch_movie_translations(movie_id):
-    """ 특정 영화의 한국어 번역 데이터 가져오기 """
-    url = f"{BASE_URL}/movie/{movie_id}/translations?api_key={API_KEY}"
+def _korean_translation(details: Dict):
+    """ 상세 정보에 포함된 번역 목록에서 한국어 제목/줄거리를 찾습니다. """
+    for t in details.get("translations", {}).get("translations", []):
+        if t.get("iso_639_1") == "ko":  # 한국어 데이터 찾기
+            return t["data"].get("title", ""), t["data"].get("overview", "")
+    return None, None  # 번역 데이터가 없을 경우
+
+async def async_fetch_movie_translations(movie_id):
+    """ 특정 영화의 한국어 번역 데이터 가져오기 (상세 정보 요청에 함께 포함됨) """
     try:
-        response = requests.get(url)
-        translations = response.json().get("translations", []) if response.status_code == 200 else []
-        for t in translations:
-            if t["iso_639_1"] == "ko":  # 한국어 데이터 찾기
-                return t["data"].get("title", ""), t["data"].get("overview", "")
+        return _korean_translation(await async_fetch_movie_details(movie_id))
     except Exception as e:
         print(f"Error fetching movie translations: {e}")
-    return None, None  # 번역 데이터가 없을 경우
+    return None, None
 
-def translate_movie(movie):
-    """ 영화 정보를 한국어로 변환 (번역이 없을 경우 원본 유지) """
-    title_ko, overview_ko = fetch_movie_translations(movie.get("id", 0))
+def fetch_movie_translations(movie_id):
+    return run_sync(async_fetch_movie_translations(movie_id))
+
+async def async_translate_movie(movie) -> Movie:
+    """ 영화 정보를 한국어로 변환한 새 레코드를 반환 (번역이 없을 경우 원본 유지, 원본은 변경하지 않음) """
+    title_ko, overview_ko = await async_fetch_movie_translations(movie.get("id", 0))
+    changes = {}
     if title_ko:
-        movie["title"] = title_ko
+        changes["title"] = title_ko
     if overview_ko:
-        movie["overview"] = overview_ko
+        changes["overview"] = overview_ko
     
     # 감독 및 출연진 번역
-    movie["directors"] = [translate_text(director) for director in movie.get("directors", [])]
-    movie["cast"] = [translate_text(actor) for actor in movie.get("cast", [])]
+    directors = list(movie.get("directors", []))
+    cast = list(movie.get("cast", []))
+    translated = await asyncio.to_thread(translate_many, directors + cast)
+    changes["directors"] = translated[:len(directors)]
+    changes["cast"] = translated[len(directors):]
     
-    return movie
+    return to_movies([movie])[0].replace(**changes)
+
+def translate_movie(movie):
+    return run_sync(async_translate_movie(movie))
 
 # ---------------- 영화 검색 ----------------
-def search_movie(query: str) -> List[Dict]:
-    """📌 영화 제목으로 TMDb에서 검색"""
-    url = f"{BASE_URL}/search/movie?api_key={API_KEY}&query={query}&language=ko-KR"
-    response = requests.get(url)
-    return response.json().get("results", []) if response.status_code == 200 else []
+async def async_search_movie(query: str, use_catalog: bool = True) -> List[Movie]:
+    """📌 영화 제목으로 검색 (로컬 카탈로그에서 먼저 찾고, 없으면 TMDb API 호출)"""
+    if use_catalog:
+        results = await asyncio.to_thread(search_catalog, query)
+        if results:
+            return results
+    url = f"{BASE_URL}/search/movie"
+    data = await async_cached_get(url, {"api_key": config.tmdb_api_key(), "query": query, "language": "ko-KR"})
+    return to_movies(data.get("results")) if data else []
+
+def search_movie(query: str, use_catalog: bool = True) -> List[Movie]:
+    return run_sync(async_search_movie(query, use_catalog))
 
 # ---------------- 장르별 영화 가져오기 ----------------
-def fetch_movies_by_genre(genre_id: int) -> List[Dict]:
+async def async_fetch_movies_by_genre(genre_id: int) -> List[Movie]:
     """📌 특정 장르에 해당하는 영화 추천"""
-    url = f"{BASE_URL}/discover/movie?api_key={API_KEY}&with_genres={genre_id}&language=ko-KR"
-    response = requests.get(url)
-    return response.json().get("results", []) if response.status_code == 200 else []
+    url = f"{BASE_URL}/discover/movie"
+    data = await async_cached_get(url, {"api_key": config.tmdb_api_key(), "with_genres": genre_id, "language": "ko-KR"})
+    return to_movies(data.get("results")) if data else []
+
+def fetch_movies_by_genre(genre_id: int) -> List[Movie]:
+    return run_sync(async_fetch_movies_by_genre(genre_id))
 
 # ---------------- 영화 세부 정보 가져오기 ----------------
+DETAIL_APPEND = "credits,translations"  # 상세·크레딧·번역을 한 번의 요청(같은 캐시 항목)으로 가져옵니다.
+
+def _details_request(movie_id: int):
+    url = f"{BASE_URL}/movie/{movie_id}"
+    return url, {"api_key": config.tmdb_api_key(), "language": "ko-KR", "append_to_response": DETAIL_APPEND}
+
+async def async_fetch_movie_details(movie_id: int) -> Dict:
+    """📌 특정 영화의 세부 정보를 가져옴 (크레딧과 번역 포함)"""
+    url, params = _details_request(movie_id)
+    data = await async_cached_get(url, params)
+    return data or {}
+
 def fetch_movie_details(movie_id: int) -> Dict:
-    """📌 특정 영화의 세부 정보를 가져옴"""
-    url = f"{BASE_URL}/movie/{movie_id}?api_key={API_KEY}&language=ko-KR&append_to_response=credits"
-    response = requests.get(url)
-    return response.json() if response.status_code == 200 else {}
+    return run_sync(async_fetch_movie_details(movie_id))
+
+async def gather_details(movie_ids: List[int], concurrency: int = FETCH_CONCURRENCY) -> Dict[int, Dict]:
+    """📌 여러 영화의 세부 정보를 중복 제거 후 최대 concurrency개씩 동시에 가져옵니다."""
+    unique_ids = list(dict.fromkeys(movie_id for movie_id in movie_ids if movie_id))
+    details_list = await gather_limited(async_fetch_movie_details, unique_ids, concurrency)
+    return dict(zip(unique_ids, details_list))
+
+# ---------------- 영화 정보 일괄 수집 ----------------
+HYDRATE_FIELDS = ("details", "credits", "translations")
+RECORD_FIELDS = ("id", "title", "original_title", "overview", "release_date", "vote_average", "popularity", "poster_path")
+CARD_CAST_LIMIT = 10   # 카드/상세 보기에 표시하는 최대 출연진 수
+
+def normalize_movie(details: Dict, fields=HYDRATE_FIELDS, cast_limit: Optional[int] = CARD_CAST_LIMIT) -> Dict:
+    """📌 상세 응답에서 화면에 쓰는 필드만 골라 레코드로 정리합니다 (이름은 번역 전 원문)."""
+    record = {key: details.get(key) for key in RECORD_FIELDS}
+    record["genre_ids"] = [genre["id"] for genre in details.get("genres", [])]
+    if "translations" in fields:
+        title_ko, overview_ko = _korean_translation(details)
+        if title_ko:
+            record["title"] = title_ko
+        if overview_ko:
+            record["overview"] = overview_ko
+    if "credits" in fields:
+        credits = details.get("credits", {})
+        record["directors"] = [m["name"] for m in credits.get("crew", []) if m.get("job") == "Director"]
+        record["cast"] = [m["name"] for m in credits.get("cast", [])[:cast_limit]]
+    return record
+
+def _record_names(records: Dict[int, Dict]) -> List[str]:
+    """📌 레코드들의 감독/출연진 이름을 중복 없이 모읍니다 (한 번에 번역하기 위해)."""
+    return list(dict.fromkeys(
+        name for record in records.values() for name in record["directors"] + record["cast"]
+    ))
+
+def _apply_translated_names(records: Dict[int, Dict], names: List[str], translated: List[str]) -> None:
+    mapping = dict(zip(names, translated))
+    for record in records.values():
+        record["directors"] = [mapping[name] for name in record["directors"]]
+        record["cast"] = [mapping[name] for name in record["cast"]]
+
+async def async_hydrate_movies(movie_ids: List[int], fields=HYDRATE_FIELDS, concurrency: int = FETCH_CONCURRENCY,
+                               cast_limit: Optional[int] = CARD_CAST_LIMIT) -> Dict[int, Dict]:
+    """📌 영화마다 상세·크레딧·번역을 append_to_response 요청 한 번으로 동시에 가져와 정규화합니다.
+
+    fields는 반환 레코드에 담을 항목만 정합니다 (요청은 항상 같은 캐시 항목을 사용).
+    감독/출연진 이름은 모든 영화를 모아 한 번에 번역합니다.
+    반환값은 {영화 ID: 레코드}이며, 가져오지 못한 영화는 빠집니다.
+    """
+    details_by_id = await gather_details(movie_ids, concurrency)
+    records = {
+        movie_id: normalize_movie(details, fields, cast_limit)
+        for movie_id, details in details_by_id.items() if details
+    }
+    if "credits" in fields and records:
+        names = _record_names(records)
+        _apply_translated_names(records, names, await asyncio.to_thread(translate_many, names))
+    return records
+
+def hydrate_movies(movie_ids: List[int], fields=HYDRATE_FIELDS, concurrency: int = FETCH_CONCURRENCY,
+                   cast_limit: Optional[int] = CARD_CAST_LIMIT) -> Dict[int, Dict]:
+    return run_sync(async_hydrate_movies(movie_ids, fields, concurrency, cast_limit))
+
+def peek_hydrated_movies(movie_ids: List[int], fields=HYDRATE_FIELDS,
+                         cast_limit: Optional[int] = CARD_CAST_LIMIT) -> Dict[int, Dict]:
+    """📌 hydrate_movies()와 같은 레코드를 네트워크 요청 없이 캐시에 있는 영화만으로 만듭니다.
+
+    아직 번역되지 않은 이름은 원문 그대로 둡니다. 화면을 그리는 동안 기다리지 않기 위한 용도입니다.
+    """
+    records = {}
+    for movie_id in dict.fromkeys(movie_id for movie_id in movie_ids if movie_id):
+        details = peek_cached(*_details_request(movie_id))
+        if details:
+            records[movie_id] = normalize_movie(details, fields, cast_limit)
+    if "credits" in fields and records:
+        names = _record_names(records)
+        _apply_translated_names(records, names, translate_many(names, cached_only=True))
+    return records
+
+def prefetch_movies(movie_ids: List[int]) -> None:
+    """📌 영화 정보를 백그라운드에서 미리 가져와 캐시에 채웁니다 (기다리지 않음, 요청은 호출한 페이지에 집계)."""
+    movie_ids = [movie_id for movie_id in movie_ids if movie_id]
+    if movie_ids:
+        submit(async_hydrate_movies(movie_ids))
 
 # ---------------- 감독 및 출연진 정보 가져오기 ----------------
-def get_movie_director_and_cast(movie_id: int) -> Dict:
+async def async_get_movie_director_and_cast(movie_id: int) -> Dict:
     """📌 특정 영화의 감독 및 출연진 정보를 가져와 한국어로 변환"""
-    movie_details = fetch_movie_details(movie_id)
-    credits = movie_details.get("credits", {})
-    
-    directors = [translate_text(member["name"]) for member in credits.get("crew", []) if member.get("job") == "Director"]
-    cast = [translate_text(member["name"]) for member in credits.get("cast", [])]
-    
-    return {"directors": directors, "cast": cast}
+    records = await async_hydrate_movies([movie_id], fields=("credits",), cast_limit=None)
+    record = records.get(movie_id, {})
+    return {"directors": record.get("directors", []), "cast": record.get("cast", [])}
 
-# ---------------- 시간대 기반 추천 ----------------
-def get_time_based_recommendations() -> List[Dict]:
-    """📌 현재 시간대에 따라 영화 추천"""
-    current_hour = datetime.now().hour
-    
-    if 18 <= current_hour <= 23:
-        genre_id = 18  # 드라마
-    elif 7 <= current_hour <= 9 or 17 <= current_hour <= 19:
-        genre_id = 35  # 코미디
-    elif 0 <= current_hour <= 3:
-        genre_id = 27  # 공포
-    else:
-        genre_id = None
-    
-    return fetch_movies_by_genre(genre_id) if genre_id else []
+def get_movie_director_and_cast(movie_id: int) -> Dict:
+    return run_sync(async_get_movie_director_and_cast(movie_id))
 
-# ---------------- 날씨 기반 추천 ----------------
-def get_weather_based_recommendations(city: str) -> List[Dict]:
-    """📌 사용자의 지역 날씨를 기반으로 적절한 영화를 추천"""
-    if not WEATHER_API_KEY:
-        return []
-    
-    weather_response = requests.get(f"{WEATHER_URL}?q={city}&appid={WEATHER_API_KEY}&units=metric")
-    if weather_response.status_code != 200:
-        return []
-    
-    weather = weather_response.json().get("weather", [{}])[0].get("main", "Clear")
-    if weather in ["Rain", "Drizzle", "Thunderstorm"]:
-        genre_id = "18,10749"  # 드라마, 로맨스
-    else:
-        genre_id = "35,28"  # 코미디, 액션
-    
-    return fetch_movies_by_genre(genre_id)
+# ---------------- 번역 캐시 예열 ----------------
+_warm_up_started = False
+
+def warm_up_translations() -> None:
+    """📌 트렌딩/인기 영화의 감독·출연진 이름을 미리 번역해 캐시에 채웁니다."""
+    # 홈 화면 첫 렌더와 같은 프로세스에서 돌므로 MovieBatch(NumPy) 대신 레코드를 그대로 순회
+    movie_ids = dict.fromkeys(movie.id for movie in get_trending_movies() + fetch_popular_movies() if movie.id)
+    hydrate_movies(list(movie_ids))
+
+def start_translation_warm_up() -> None:
+    """📌 프로세스당 한 번, 백그라운드에서 번역 캐시 예열을 시작합니다."""
+    global _warm_up_started
+    if _warm_up_started:
+        return
+    _warm_up_started = True
+    threading.Thread(target=warm_up_translations, daemon=True).start()
+
+# ---------------- 시간대·날씨 기반 추천 ----------------
+# 미리 계산해 둔 상황별 추천 테이블에서 바로 조회합니다 (src/context_recs.py).
+get_time_based_recommendations = context_recs.get_time_based_recommendations
+get_weather_based_recommendations = context_recs.get_weather_based_recommendations
 
 # ---------------- 키워드 관련 함수 ----------------
-def search_keyword_movies(query):
+async def async_search_keyword_movies(query):
     """키워드로 영화를 검색합니다."""
-    url = f"{BASE_URL}/search/keyword?api_key={API_KEY}&query={query}"
+    url = f"{BASE_URL}/search/keyword"
     try:
-        response = requests.get(url)
-        return response.json().get("results", []) if response.status_code == 200 else []
+        data = await async_cached_get(url, {"api_key": config.tmdb_api_key(), "query": query})
+        return data.get("results", []) if data else []
     except Exception as e:
         print(f"Error searching for keyword: {e}")
         return []
 
-def fetch_movies_by_keyword(keyword_id):
+def search_keyword_movies(query):
+    return run_sync(async_search_keyword_movies(query))
+
+async def async_fetch_movies_by_keyword(keyword_id, concurrency=FETCH_CONCURRENCY):
     """특정 키워드에 해당하는 영화 목록을 가져옵니다."""
-    url = f"{BASE_URL}/discover/movie?api_key={API_KEY}&with_keywords={keyword_id}&language=ko-KR"
+    url = f"{BASE_URL}/discover/movie"
     try:
-        response = requests.get(url)
-        movies = response.json().get("results", []) if response.status_code == 200 else []
-        return [translate_movie(movie) for movie in movies]
+        data = await async_cached_get(url, {"api_key": config.tmdb_api_key(), "with_keywords": keyword_id, "language": "ko-KR"})
+        movies = data.get("results", []) if data else []
+        records = await async_hydrate_movies([movie.get("id") for movie in movies], concurrency=concurrency)
+        return to_movies(
+            {**movie, **{k: v for k, v in records.get(movie.get("id"), {}).items() if v is not None}}
+            for movie in movies
+        )
     except Exception as e:
         print(f"Error fetching movies by keyword: {e}")
         return []
 
-def fetch_similar_movies(movie_id, page=1, language="ko-KR"):
+def fetch_movies_by_keyword(keyword_id):
+    return run_sync(async_fetch_movies_by_keyword(keyword_id))
+
+async def async_fetch_similar_movies(movie_id, page=1, language="ko-KR"):
     """
     특정 영화와 유사한 영화 목록을 가져옵니다.
+    미리 계산한 로컬 유사도 색인에 있는 영화면 네트워크 없이 바로 반환합니다.
     """
+    from src.similarity import similar_movies  # NumPy 색인은 이 기능을 처음 쓸 때 불러옴
+    local_results = await asyncio.to_thread(similar_movies, movie_id, page)
+    if local_results is not None:
+        return to_movies(local_results)
+
     url = f"{BASE_URL}/movie/{movie_id}/similar"
     params = {
-        "api_key": API_KEY,
+        "api_key": config.tmdb_api_key(),
         "language": language,
         "page": page
     }
     try:
-        response = requests.get(url, params=params)
-        if response.status_code == 200:
-            data = response.json()
-            return data.get("results", [])
-        return []
+        data = await async_cached_get(url, params)
+        return to_movies(data.get("results")) if data else []
     except Exception as e:
         print(f"Error fetching similar movies: {e}")
         return []
+
+def fetch_similar_movies(movie_id, page=1, language="ko-KR"):
+    return run_sync(async_fetch_similar_movies(movie_id, page, language))
     
\ No newline at end of file
@@ -1,11 +1,15 @@
 import streamlit as st
 import random
+import threading
+import time
+from collections import OrderedDict
 from src.movie_recommend import get_trending_movies, get_personalized_recommendations
-from src.auth import load_user_preferences
-from src.data_fetcher import get_movie_director_and_cast, fetch_movie_details
-
-# ---------------- 전역 변수 ----------------
-displayed_movie_ids = set()
+from src.auth import load_user_preferences, show_history_buttons
+from src.context_recs import start_context_refresh
+from src.data_fetcher import hydrate_movies, peek_hydrated_movies, prefetch_movies, start_translation_warm_up
+from src.metrics import section_scope
+from src.posters import load_posters, prefetch_posters
+from src.resilience import stale_scope
 
 # ---------------- 새로운 함수 추가 ----------------
 def get_latest_popular_movies():
@@ -17,26 +21,65 @@ def get_current_popular_movies():
 def get_realtime_popular_movies():
     return get_trending_movies()
 
-def show_full_movie_details(movie):
+SECTION_SIZE = 5  # 섹션당 표시할 영화 수
+POSTER_WIDTH = 250  # 카드 포스터 표시 너비(px)
+DETAIL_MEMO_SIZE = 512        # 메모해 둘 상세 정보 레코드 수 (프로세스 전체)
+DETAIL_MEMO_TTL = 60 * 60     # 메모한 상세 정보 유지 시간(초)
+
+# 스트림릿 1.37 미만에는 fragment가 없으므로, 그때는 버튼 클릭 시 페이지 전체가 다시 실행됩니다.
+_fragment = getattr(st, "fragment", lambda func: func)
+
+def pick_section_movies(movies):
+    """📌 섹션에 표시할 영화를 무작위로 고릅니다."""
+    return random.sample(movies, min(SECTION_SIZE, len(movies))) if movies else []
+
+# ---------------- 상세 정보 (열었을 때만 조회) ----------------
+_detail_memo: "OrderedDict[int, tuple]" = OrderedDict()
+_detail_memo_lock = threading.Lock()
+
+def load_movie_record(movie_id):
+    """📌 상세 보기용 레코드를 영화별로 메모해 두고 재사용합니다 (실패한 조회는 메모하지 않음)."""
+    now = time.monotonic()
+    with _detail_memo_lock:
+        cached = _detail_memo.get(movie_id)
+        if cached and cached[0] > now:
+            _detail_memo.move_to_end(movie_id)
+            return cached[1]
+    record = hydrate_movies([movie_id]).get(movie_id)
+    if record:
+        with _detail_memo_lock:
+            _detail_memo[movie_id] = (now + DETAIL_MEMO_TTL, record)
+            _detail_memo.move_to_end(movie_id)
+            while len(_detail_memo) > DETAIL_MEMO_SIZE:
+                _detail_memo.popitem(last=False)
+    return record
+
+@_fragment
+def show_detail_panel(movie, key):
+    """📌 "자세히 보기"를 켠 카드만 상세 정보를 조회합니다 (fragment라 이 영역만 다시 그림)."""
+    if st.toggle("자세히 보기", key=f"details_{key}"):
+        with st.spinner("상세 정보를 불러오는 중..."):
+            show_full_movie_details(movie)
+
+def show_full_movie_details(movie, record=None):
     movie_id = movie.get("id")
     if not movie_id:
         st.write("상세 정보가 없습니다.")
         return
     
-    details = fetch_movie_details(movie_id)
-    if not details:
+    if record is None:
+        record = load_movie_record(movie_id)
+    if not record:
         st.write("상세 정보가 없습니다.")
         return
     
-    title = details.get("title", "제목 없음")
-    release_date = details.get("release_date", "정보 없음")
-    vote_average = details.get("vote_average", "정보 없음")
-    overview = details.get("overview", "줄거리 없음")
+    title = record.get("title", "제목 없음")
+    release_date = record.get("release_date", "정보 없음")
+    vote_average = record.get("vote_average", "정보 없음")
+    overview = record.get("overview", "줄거리 없음")
     
-    # 감독 및 출연진 정보 가져오기
-    credits = get_movie_director_and_cast(movie_id)
-    directors = credits.get("directors", [])
-    cast = credits.get("cast", [])
+    directors = record.get("directors", [])
+    cast = record.get("cast", [])
     
     st.markdown(f"### {title}")
     st.write(f"**개봉일:** {release_date}")
@@ -46,29 +89,50 @@ def show_full_movie_details(movie):
         st.write(f"**감독:** {', '.join(directors)}")
     if cast:
         st.write(f"**출연진:** {', '.join(cast[:10])}")
+    show_history_buttons(movie_id, f"details_{movie_id}")
+
+def format_age(saved_at):
+    """📌 저장 시각을 "3분 전" 형식으로 바꿉니다."""
+    seconds = max(0, time.time() - saved_at)
+    if seconds < 60 * 60:
+        return f"{max(1, int(seconds // 60))}분 전"
+    if seconds < 24 * 60 * 60:
+        return f"{int(seconds // 3600)}시간 전"
+    return f"{int(seconds // 86400)}일 전"
+
+def show_movie_section(title, movies, hydrated=None, posters=None, stale_since=None):
+    """📌 섹션을 렌더링합니다. movies는 pick_section_movies로 고른 목록입니다.
 
-def show_movie_section(title, movies):
+    카드에는 캐시에 이미 있는 감독/출연진만 표시하고, 상세 정보는 "자세히 보기"를 눌렀을 때 조회합니다.
+    hydrated/posters가 없으면 이 섹션의 영화만 조회합니다.
+    stale_since가 있으면 응답이 늦어 그 시각에 저장해 둔 목록을 표시한다고 알립니다.
+    """
     st.markdown(f"<h2 class='sub-header'>{title}</h2>", unsafe_allow_html=True)
+    section_title = title  # 아래 반복문에서 title을 영화 제목으로 다시 쓰므로 보관
+    if stale_since is not None:
+        st.caption(f"⏳ 응답이 늦어 {format_age(stale_since)}에 받아 둔 목록을 표시합니다. 새 목록은 다음에 열 때 반영됩니다.")
     
     if movies:
-        selected_movies = random.sample(movies, min(5, len(movies)))
-        cols = st.columns(5)
+        selected_movies = movies[:SECTION_SIZE]
+        if hydrated is None:
+            hydrated = peek_hydrated_movies([movie.get("id") for movie in selected_movies])
+        if posters is None:
+            posters = load_posters([movie.get("poster_path") for movie in selected_movies], POSTER_WIDTH)
+        cols = st.columns(SECTION_SIZE)
 
         for idx, movie in enumerate(selected_movies):
             with cols[idx]:
-                poster_path = movie.get("poster_path")
-                poster_url = f"https://image.tmdb.org/t/p/w500{poster_path}" if poster_path else "https://via.placeholder.com/500x750?text=No+Image"
                 title = movie.get("title", "제목 없음")
                 rating = movie.get("vote_average", "N/A")
                 release_date = movie.get("release_date", "정보 없음")
                 
-                credits = get_movie_director_and_cast(movie.get("id", None))
-                directors = credits.get("directors", [])
-                cast = credits.get("cast", [])
+                record = hydrated.get(movie.get("id"))
+                directors = record.get("directors", []) if record else []
+                cast = record.get("cast", []) if record else []
                 
                 overview = movie.get("overview", "줄거리 없음")[:100] + "..."
                 
-                st.image(poster_url, width=250, use_container_width=False)
+                st.image(posters[movie.get("poster_path")], width=POSTER_WIDTH, use_container_width=False)
                 st.markdown(f"""
                 <div class='movie-card'>
                     <p class='movie-title'>{title}</p>
@@ -80,17 +144,39 @@ def show_movie_section(title, movies):
                 </div>
                 """, unsafe_allow_html=True)
                 
-                with st.expander("자세히 보기"):
-                    show_full_movie_details(movie)
+                show_detail_panel(movie, f"{section_title}_{movie.get('id')}")
     else:
-        st.warning(f"{title}를 불러오는 데 문제가 발생했습니다. 잠시 후 다시 시도해주세요.")
+        st.warning(f"{section_title}를 불러오는 데 문제가 발생했습니다. 잠시 후 다시 시도해주세요.")
 
 def show_home_page():
-    show_movie_section("🔝 트렌드 영화", get_trending_movies())
-    show_movie_section("🚀 최신 인기 영화", get_latest_popular_movies())
-    show_movie_section("🎥 현재 인기 영화", get_current_popular_movies())
-    show_movie_section("📈 실시간 인기 영화", get_realtime_popular_movies())
-    
     user_profile = load_user_preferences()
-    recommended_movies = get_personalized_recommendations(user_profile) if user_profile else []
-    show_movie_section("🍿 오늘의 추천 영화", recommended_movies)
+    loaders = [
+        ("🔝 트렌드 영화", get_trending_movies),
+        ("🚀 최신 인기 영화", get_latest_popular_movies),
+        ("🎥 현재 인기 영화", get_current_popular_movies),
+        ("📈 실시간 인기 영화", get_realtime_popular_movies),
+        ("🍿 오늘의 추천 영화", lambda: get_personalized_recommendations(user_profile) if user_profile else []),
+    ]
+    sections, stale = [], {}
+    for title, loader in loaders:
+        # 요청 계측을 섹션별로 나눠 집계하고, 지연 예산을 넘겨 스냅숏으로 대신한 섹션을 표시
+        with section_scope(title), stale_scope() as mark:
+            sections.append((title, loader()))
+        stale[title] = mark.saved_at
+    
+    # 섹션마다 표시할 카드를 고른 뒤, 페이지 전체 카드의 정보를 한 번에 모아 렌더링
+    selections = [(title, pick_section_movies(movies)) for title, movies in sections]
+    with section_scope("🎬 카드 상세 정보"):
+        # 카드 그리드는 상세 정보를 기다리지 않습니다: 캐시에 있는 것만 쓰고 나머지는 백그라운드에서 채웁니다.
+        card_ids = [movie.get("id") for _, picked in selections for movie in picked]
+        hydrated = peek_hydrated_movies(card_ids)
+        prefetch_movies([movie_id for movie_id in card_ids if movie_id not in hydrated])
+    with section_scope("🖼 포스터"):
+        posters = load_posters([movie.get("poster_path") for _, picked in selections for movie in picked], POSTER_WIDTH)
+        # 다음 렌더링에서 새로 뽑힐 수 있는 나머지 영화의 포스터는 백그라운드에서 미리 받아 둡니다.
+        prefetch_posters([movie.get("poster_path") for _, movies in sections for movie in movies], POSTER_WIDTH)
+    for title, picked in selections:
+        show_movie_section(title, picked, hydrated, posters, stale[title])
+    # 번역 캐시 예열과 상황별 추천 적재는 첫 화면을 다 그린 뒤에 시작합니다 (새 워커의 첫 렌더와 네트워크·CPU를 다투지 않도록).
+    start_translation_warm_up()
+    start_context_refresh()
@@ -0,0 +1,222 @@
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+if TYPE_CHECKING:
+    import requests
+
+from src import config, metrics, resilience
+
+# ---------------- HTTP 클라이언트 설정 ----------------
+POOL_SIZE = 32                 # 호스트당 유지할 keep-alive 연결 수
+MAX_RETRIES = 3
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+BACKOFF_BASE = 0.5             # 지수 백오프 시작 지연(초)
+BACKOFF_MAX = 8.0
+RETRY_AFTER_MAX = 30.0         # Retry-After 헤더를 따르되 이 이상 기다리지 않음
+
+# TMDb 호스트와 경로는 config.BASE_URL에서 가져옵니다 (가짜 업스트림을 지정해도 같은 규칙·한도가 적용되도록).
+_TMDB = urlsplit(config.BASE_URL)
+TMDB_HOST = _TMDB.netloc
+TMDB_PREFIX = TMDB_HOST + _TMDB.path.rstrip("/")
+
+# (URL에 포함된 문자열, (연결 타임아웃, 읽기 타임아웃)) — 먼저 일치하는 규칙이 적용됩니다.
+TIMEOUT_RULES = [
+    (f"{TMDB_PREFIX}/search/", (3.05, 5)),
+    (f"{TMDB_PREFIX}/authentication/", (3.05, 5)),
+    (TMDB_HOST, (3.05, 10)),
+    ("translate.googleapis.com", (3.05, 5)),
+    ("api.openweathermap.org", (3.05, 5)),
+]
+DEFAULT_TIMEOUT = (3.05, 10)
+
+
+# ---------------- 토큰 버킷 ----------------
+class TokenBucket:
+    """📌 초당 rate개의 토큰을 채우는 스레드 안전 토큰 버킷 (최대 capacity개)"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """📌 토큰 하나를 예약하고, 사용 전까지 기다려야 하는 시간(초)을 반환합니다."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+# 프로세스 내 모든 세션이 공유하는 호스트별 요청 한도 (TMDb: 초당 약 50회 제한)
+RATE_LIMITS: Dict[str, TokenBucket] = {
+    TMDB_HOST: TokenBucket(rate=40, capacity=40),
+}
+
+# requests는 동기 요청(번역·게스트 세션)에만 쓰므로, 첫 동기 요청 때 불러옵니다.
+_sessions: Dict[str, "requests.Session"] = {}
+_sessions_lock = threading.Lock()
+
+
+def _session_for(host: str) -> "requests.Session":
+    """📌 호스트별 keep-alive 연결 풀을 가진 세션을 반환합니다 (처음 요청할 때 생성)."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    with _sessions_lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE, max_retries=0)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _sessions[host] = session
+        return session
+
+
+def timeout_for(url: str) -> Tuple[float, float]:
+    for pattern, timeout in TIMEOUT_RULES:
+        if pattern in url:
+            return timeout
+    return DEFAULT_TIMEOUT
+
+
+def backoff_delay(attempt: int) -> float:
+    """📌 지수 백오프에 full jitter를 적용한 지연 시간"""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
+
+def retry_after_delay(response) -> Optional[float]:
+    """📌 Retry-After 헤더(초 또는 HTTP 날짜)를 해석합니다."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(delay, 0.0), RETRY_AFTER_MAX)
+
+
+def get(url: str, params: Optional[Dict] = None, timeout: Optional[Tuple[float, float]] = None) -> "requests.Response":
+    """📌 풀링된 세션으로 GET 요청을 보냅니다.
+
+    429/5xx 응답과 연결 오류는 백오프 후 재시도하며, 마지막 시도의 응답을 반환하거나 예외를 올립니다.
+    재시도를 포함한 전체 소요 시간·상태 코드·응답 크기는 src.metrics에 기록됩니다.
+    시도마다 성공/실패를 호스트 회로 차단기에 알리고, 회로가 열려 있으면 요청(과 남은 재시도)을 보내지 않습니다.
+    """
+    import requests
+
+    host = urlsplit(url).netloc
+    breaker = resilience.breaker_for(host)
+    if not breaker.allow():
+        raise resilience.CircuitOpenError(f"회로가 열려 요청을 보내지 않음: {host}")
+    session = _session_for(host)
+    bucket = RATE_LIMITS.get(host)
+    timeout = timeout or timeout_for(url)
+
+    started = time.perf_counter()
+    status, size, attempt = "error", 0, 0
+    try:
+        for attempt in range(MAX_RETRIES + 1):
+            if bucket is not None:
+                bucket.acquire()
+            try:
+                response = session.get(url, params=params, timeout=timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                breaker.record(False)
+                if attempt == MAX_RETRIES or not breaker.available():
+                    raise
+                delay = backoff_delay(attempt)
+            else:
+                ok = response.status_code not in RETRY_STATUSES
+                breaker.record(ok)
+                if ok or attempt == MAX_RETRIES or not breaker.available():
+                    status, size = response.status_code, len(response.content)
+                    return response
+                delay = retry_after_delay(response)
+                if delay is None:
+                    delay = backoff_delay(attempt)
+            time.sleep(delay)
+    finally:
+        metrics.record_request(url, status, time.perf_counter() - started, size, attempt)
+
+
+# ---------------- 비동기 클라이언트 ----------------
+_async_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """📌 공용 이벤트 루프(src.aio)에서 사용하는 풀링된 비동기 클라이언트"""
+    global _async_client
+    if _async_client is None:
+        limits = httpx.Limits(max_connections=POOL_SIZE * 4, max_keepalive_connections=POOL_SIZE)
+        _async_client = httpx.AsyncClient(limits=limits)
+    return _async_client
+
+
+async def async_get(url: str, params: Optional[Dict] = None, timeout: Optional[Tuple[float, float]] = None) -> httpx.Response:
+    """📌 get()의 비동기 버전. 같은 토큰 버킷·타임아웃·재시도·회로 차단 규칙을 따릅니다.
+
+    시도마다 응답이 이 호스트의 평소 꼬리 지연(p95)보다 늦으면 같은 요청을 하나 더 보냅니다 (src.resilience.hedged).
+    """
+    client = _get_async_client()
+    host = urlsplit(url).netloc
+    breaker = resilience.breaker_for(host)
+    if not breaker.allow():
+        raise resilience.CircuitOpenError(f"회로가 열려 요청을 보내지 않음: {host}")
+    bucket = RATE_LIMITS.get(host)
+    connect_timeout, read_timeout = timeout or timeout_for(url)
+    httpx_timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+
+    async def send() -> httpx.Response:
+        if bucket is not None:
+            await bucket.acquire_async()
+        return await client.get(url, params=params, timeout=httpx_timeout)
+
+    started = time.perf_counter()
+    status, size, attempt = "error", 0, 0
+    try:
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                response = await resilience.hedged(host, send)
+            except httpx.TransportError:
+                breaker.record(False)
+                if attempt == MAX_RETRIES or not breaker.available():
+                    raise
+                delay = backoff_delay(attempt)
+            else:
+                ok = response.status_code not in RETRY_STATUSES
+                breaker.record(ok)
+                if ok or attempt == MAX_RETRIES or not breaker.available():
+                    status, size = response.status_code, len(response.content)
+                    return response
+                delay = retry_after_delay(response)
+                if delay is None:
+                    delay = backoff_delay(attempt)
+            await asyncio.sleep(delay)
+    finally:
+        metrics.record_request(url, status, time.perf_counter() - started, size, attempt)
@@ -0,0 +1,351 @@
+import contextvars
+import os
+import re
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+# ---------------- 계측 설정 ----------------
+# 요청 지연 히스토그램 경계(초) — Prometheus 기본 버킷과 같은 간격
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRICS_FILE = os.environ.get("MOVIEMIND_METRICS_FILE")   # 설정하면 Prometheus 텍스트 형식으로 기록
+METRICS_WRITE_INTERVAL = 10.0                              # 파일 기록 최소 간격(초)
+DEBUG_PANEL = os.environ.get("MOVIEMIND_DEBUG") == "1"     # 사이드바 계측 패널 표시 여부
+
+# 페이지 한 번 렌더링에 허용하는 외부 HTTP 요청 수 — 넘으면 경고를 출력합니다.
+DEFAULT_REQUEST_BUDGET = int(os.environ.get("MOVIEMIND_REQUEST_BUDGET", "40"))
+PAGE_REQUEST_BUDGETS: Dict[str, int] = {
+    "홈": 40,
+    "영화 스타일 선택": 0,
+    "영화 검색": 10,
+    "추천 생성": 30,   # 맞춤 추천 + 인물 10명의 이름 검색·필모그래피
+}
+
+_NUMERIC_SEGMENT = re.compile(r"(?!^)/\d+(?=/|$)")  # 맨 앞의 API 버전(/3)은 그대로 둡니다.
+_FILE_SEGMENT = re.compile(r"/[^/]+\.(?:jpg|jpeg|png|webp|svg)$")  # 포스터 파일 이름
+
+
+def endpoint_label(url: str) -> str:
+    """📌 URL을 집계용 엔드포인트 이름으로 바꿉니다 (숫자 경로는 {id}, 이미지 파일은 {file}로 치환)."""
+    parts = urlsplit(url)
+    path = _FILE_SEGMENT.sub("/{file}", parts.path)
+    return parts.netloc + _NUMERIC_SEGMENT.sub("/{id}", path)
+
+
+# ---------------- 히스토그램 ----------------
+class Histogram:
+    """📌 고정 버킷 누적 히스토그램 (Prometheus histogram과 같은 의미)"""
+
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)  # 마지막 칸은 +Inf
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """📌 버킷 상한으로 근사한 분위수 (+Inf 버킷이면 마지막 경계)"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS + (LATENCY_BUCKETS[-1],), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return LATENCY_BUCKETS[-1]
+
+
+class EndpointStats:
+    __slots__ = ("latency", "statuses", "bytes", "retries", "cache", "flight")
+
+    def __init__(self):
+        self.latency = Histogram()
+        self.statuses: Dict[str, int] = {}
+        self.bytes = 0
+        self.retries = 0
+        self.cache: Dict[str, int] = {}   # hit / stale / miss
+        self.flight: Dict[str, int] = {}  # executed / coalesced (같은 요청 합치기, src.singleflight)
+
+
+class SectionStats:
+    __slots__ = ("requests", "errors", "cache_hits", "cache_misses", "seconds")
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.seconds = 0.0
+
+
+class PageRender:
+    """📌 페이지 한 번 렌더링 동안 발생한 요청을 섹션별로 모읍니다."""
+
+    def __init__(self, page: str, budget: int):
+        self.page = page
+        self.budget = budget
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+        self.sections: Dict[str, SectionStats] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def requests(self) -> int:
+        with self._lock:
+            return sum(section.requests for section in self.sections.values())
+
+    def section(self, name: Optional[str]) -> SectionStats:
+        with self._lock:
+            return self.sections.setdefault(name or "(페이지)", SectionStats())
+
+
+# ---------------- 페이지/섹션 귀속 ----------------
+# run_sync와 asyncio.to_thread가 컨텍스트를 복사하므로 비동기·스레드 요청도 같은 섹션에 귀속됩니다.
+_current_render: contextvars.ContextVar[Optional[PageRender]] = contextvars.ContextVar("moviemind_render", default=None)
+_current_section: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("moviemind_section", default=None)
+
+
+class MetricsRegistry:
+    """📌 프로세스 전역 계측 저장소 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.endpoints: Dict[str, EndpointStats] = {}
+        self.page_requests: Dict[Tuple[str, str], int] = {}
+        self.budget_exceeded: Dict[str, int] = {}
+        self.last_renders: Dict[str, PageRender] = {}
+        self._last_write = 0.0
+
+    def _endpoint(self, endpoint: str) -> EndpointStats:
+        stats = self.endpoints.get(endpoint)
+        if stats is None:
+            stats = self.endpoints[endpoint] = EndpointStats()
+        return stats
+
+    def record_request(self, url: str, status, seconds: float, size: int, retries: int) -> None:
+        """📌 외부 HTTP 요청 하나(재시도 포함)의 결과를 기록합니다. status는 응답 코드 또는 "error"."""
+        endpoint = endpoint_label(url)
+        render, section = _current_render.get(), _current_section.get()
+        with self._lock:
+            stats = self._endpoint(endpoint)
+            stats.latency.observe(seconds)
+            stats.statuses[str(status)] = stats.statuses.get(str(status), 0) + 1
+            stats.bytes += size
+            stats.retries += retries
+            if render is not None:
+                key = (render.page, section or "(페이지)")
+                self.page_requests[key] = self.page_requests.get(key, 0) + 1
+        if render is not None:
+            section_stats = render.section(section)
+            with render._lock:
+                section_stats.requests += 1
+                section_stats.errors += status == "error" or int(status) >= 400
+                section_stats.seconds += seconds
+
+    def record_cache(self, url: str, result: str, count: int = 1) -> None:
+        """📌 캐시 조회 결과(hit / stale / miss)를 기록합니다."""
+        endpoint = endpoint_label(url)
+        with self._lock:
+            cache = self._endpoint(endpoint).cache
+            cache[result] = cache.get(result, 0) + count
+        render = _current_render.get()
+        if render is not None:
+            section_stats = render.section(_current_section.get())
+            with render._lock:
+                if result == "miss":
+                    section_stats.cache_misses += count
+                else:
+                    section_stats.cache_hits += count
+
+    def record_flight(self, url: str, executed: bool) -> None:
+        """📌 네트워크 요청이 직접 실행(executed)됐는지, 진행 중인 같은 요청에 합쳐졌는지(coalesced) 기록합니다."""
+        result = "executed" if executed else "coalesced"
+        with self._lock:
+            flight = self._endpoint(endpoint_label(url)).flight
+            flight[result] = flight.get(result, 0) + 1
+
+    def finish_render(self, render: PageRender) -> None:
+        render.elapsed = time.perf_counter() - render.started
+        requests = render.requests
+        with self._lock:
+            self.last_renders[render.page] = render
+            if render.budget is not None and requests > render.budget:
+                self.budget_exceeded[render.page] = self.budget_exceeded.get(render.page, 0) + 1
+                exceeded = True
+            else:
+                exceeded = False
+        if exceeded:
+            busiest = sorted(render.sections.items(), key=lambda item: item[1].requests, reverse=True)[:3]
+            detail = ", ".join(f"{name}: {stats.requests}" for name, stats in busiest)
+            print(f"⚠️ 요청 예산 초과: '{render.page}' 렌더링에 외부 요청 {requests}회 (예산 {render.budget}회) — {detail}")
+
+    def snapshot(self) -> List[Dict]:
+        """📌 엔드포인트별 요약 (디버그 패널 표시용)"""
+        with self._lock:
+            rows = []
+            for endpoint, stats in sorted(self.endpoints.items()):
+                lookups = sum(stats.cache.values())
+                hits = lookups - stats.cache.get("miss", 0)
+                p50, p95 = stats.latency.quantile(0.5), stats.latency.quantile(0.95)
+                rows.append({
+                    "endpoint": endpoint,
+                    "requests": stats.latency.count,
+                    "p50_ms": p50 * 1000 if p50 is not None else None,
+                    "p95_ms": p95 * 1000 if p95 is not None else None,
+                    "statuses": ", ".join(f"{s}×{n}" for s, n in sorted(stats.statuses.items())),
+                    "retries": stats.retries,
+                    "kb": round(stats.bytes / 1024, 1),
+                    "cache_hit_rate": round(hits / lookups, 3) if lookups else None,
+                    "coalesced": stats.flight.get("coalesced", 0),
+                })
+            return rows
+
+    def render_prometheus(self) -> str:
+        """📌 Prometheus 텍스트 노출 형식으로 변환합니다."""
+        lines = [
+            "# HELP moviemind_http_request_duration_seconds Outbound HTTP request latency including retries.",
+            "# TYPE moviemind_http_request_duration_seconds histogram",
+        ]
+        with self._lock:
+            endpoints = sorted(self.endpoints.items())
+            for endpoint, stats in endpoints:
+                label = _escape(endpoint)
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, stats.latency.counts):
+                    cumulative += count
+                    lines.append(f'moviemind_http_request_duration_seconds_bucket{{endpoint="{label}",le="{bound}"}} {cumulative}')
+                lines.append(f'moviemind_http_request_duration_seconds_bucket{{endpoint="{label}",le="+Inf"}} {stats.latency.count}')
+                lines.append(f'moviemind_http_request_duration_seconds_sum{{endpoint="{label}"}} {stats.latency.total:.6f}')
+                lines.append(f'moviemind_http_request_duration_seconds_count{{endpoint="{label}"}} {stats.latency.count}')
+
+            lines += ["# HELP moviemind_http_responses_total Outbound HTTP responses by status.",
+                      "# TYPE moviemind_http_responses_total counter"]
+            for endpoint, stats in endpoints:
+                for status, count in sorted(stats.statuses.items()):
+                    lines.append(f'moviemind_http_responses_total{{endpoint="{_escape(endpoint)}",status="{status}"}} {count}')
+
+            lines += ["# HELP moviemind_http_response_bytes_total Outbound HTTP response body bytes.",
+                      "# TYPE moviemind_http_response_bytes_total counter"]
+            lines += [f'moviemind_http_response_bytes_total{{endpoint="{_escape(e)}"}} {s.bytes}' for e, s in endpoints]
+
+            lines += ["# HELP moviemind_http_retries_total Retried outbound HTTP attempts.",
+                      "# TYPE moviemind_http_retries_total counter"]
+            lines += [f'moviemind_http_retries_total{{endpoint="{_escape(e)}"}} {s.retries}' for e, s in endpoints]
+
+            lines += ["# HELP moviemind_cache_lookups_total Response cache lookups by result.",
+                      "# TYPE moviemind_cache_lookups_total counter"]
+            for endpoint, stats in endpoints:
+                for result, count in sorted(stats.cache.items()):
+                    lines.append(f'moviemind_cache_lookups_total{{endpoint="{_escape(endpoint)}",result="{result}"}} {count}')
+
+            lines += ["# HELP moviemind_singleflight_calls_total Cache-miss fetches executed or coalesced into an in-flight request.",
+                      "# TYPE moviemind_singleflight_calls_total counter"]
+            for endpoint, stats in endpoints:
+                for result, count in sorted(stats.flight.items()):
+                    lines.append(f'moviemind_singleflight_calls_total{{endpoint="{_escape(endpoint)}",result="{result}"}} {count}')
+
+            lines += ["# HELP moviemind_page_requests_total Outbound HTTP requests attributed to a page section.",
+                      "# TYPE moviemind_page_requests_total counter"]
+            for (page, section), count in sorted(self.page_requests.items()):
+                lines.append(f'moviemind_page_requests_total{{page="{_escape(page)}",section="{_escape(section)}"}} {count}')
+
+            lines += ["# HELP moviemind_page_budget_exceeded_total Page renders that exceeded their request budget.",
+                      "# TYPE moviemind_page_budget_exceeded_total counter"]
+            for page, count in sorted(self.budget_exceeded.items()):
+                lines.append(f'moviemind_page_budget_exceeded_total{{page="{_escape(page)}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str) -> None:
+        """📌 node_exporter textfile collector 등이 읽을 수 있도록 파일을 원자적으로 교체합니다."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.render_prometheus())
+        os.replace(tmp_path, path)
+
+    def maybe_write(self) -> None:
+        if not METRICS_FILE:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_write < METRICS_WRITE_INTERVAL:
+                return
+            self._last_write = now
+        try:
+            self.write_prometheus(METRICS_FILE)
+        except OSError as e:
+            print(f"계측 파일 기록 오류: {e}")
+
+    def reset(self) -> None:
+        with self._lock:
+            self.endpoints.clear()
+            self.page_requests.clear()
+            self.budget_exceeded.clear()
+            self.last_renders.clear()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+registry = MetricsRegistry()
+record_request = registry.record_request
+record_cache = registry.record_cache
+record_flight = registry.record_flight
+
+
+@contextmanager
+def page_scope(page: str, budget: Optional[int] = None):
+    """📌 이 블록 안의 외부 요청을 page에 귀속시키고, 끝나면 요청 예산을 확인합니다."""
+    if budget is None:
+        budget = PAGE_REQUEST_BUDGETS.get(page, DEFAULT_REQUEST_BUDGET)
+    render = PageRender(page, budget)
+    render_token = _current_render.set(render)
+    section_token = _current_section.set(None)
+    try:
+        yield render
+    finally:
+        _current_section.reset(section_token)
+        _current_render.reset(render_token)
+        registry.finish_render(render)
+        registry.maybe_write()
+
+
+@contextmanager
+def section_scope(section: str):
+    """📌 이 블록 안의 외부 요청을 현재 페이지의 section에 귀속시킵니다."""
+    token = _current_section.set(section)
+    try:
+        yield
+    finally:
+        _current_section.reset(token)
+
+
+# ---------------- 디버그 사이드바 ----------------
+def show_debug_panel(page: str) -> None:
+    """📌 MOVIEMIND_DEBUG=1이면 사이드바에 마지막 렌더링의 섹션별 요청과 엔드포인트별 통계를 표시합니다."""
+    if not DEBUG_PANEL:
+        return
+    import streamlit as st
+
+    render = registry.last_renders.get(page)
+    with st.sidebar.expander("🛠 요청 계측", expanded=False):
+        if render is not None:
+            st.write(f"**{page}** 렌더링 {render.elapsed * 1000:.0f}ms · 외부 요청 {render.requests}회 (예산 {render.budget}회)")
+            st.dataframe([
+                {"section": name, "requests": s.requests, "errors": s.errors, "cache_hits": s.cache_hits,
+                 "cache_misses": s.cache_misses, "request_ms": round(s.seconds * 1000, 1)}
+                for name, s in render.sections.items()
+            ])
+        st.dataframe(registry.snapshot())
@@ -0,0 +1,234 @@
+import threading
+import weakref
+from datetime import date
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# ---------------- 영화 레코드 ----------------
+# 화면에 그리는 필드만 보관합니다 (TMDb 원본 JSON의 나머지 필드는 버림).
+MOVIE_FIELDS = (
+    "id", "title", "original_title", "overview", "poster_path", "release_date",
+    "vote_average", "vote_count", "popularity", "genre_ids", "directors", "cast",
+)
+_SEQUENCE_FIELDS = ("genre_ids", "directors", "cast")
+
+
+class Movie:
+    """📌 변경할 수 없는 영화 레코드 (__slots__로 dict보다 훨씬 작음)
+
+    기존 코드가 dict처럼 쓰던 방식(movie.get("title"), movie["id"], {**movie})을 그대로 지원합니다.
+    값이 None인 필드는 get()에서 기본값을 돌려줍니다.
+    """
+
+    __slots__ = MOVIE_FIELDS + ("__weakref__",)
+
+    def __init__(self, **fields):
+        for name in MOVIE_FIELDS:
+            value = fields.get(name)
+            if name in _SEQUENCE_FIELDS and value is not None:
+                value = tuple(value)
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Movie 레코드는 변경할 수 없습니다. replace()로 새 레코드를 만드세요.")
+
+    def __delattr__(self, name):
+        raise AttributeError("Movie 레코드는 변경할 수 없습니다.")
+
+    # ---- dict 호환 ----
+    def get(self, key: str, default: Any = None) -> Any:
+        value = getattr(self, key, None) if key in MOVIE_FIELDS else None
+        return default if value is None else value
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in MOVIE_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in MOVIE_FIELDS and getattr(self, key) is not None
+
+    def keys(self) -> List[str]:
+        return [name for name in MOVIE_FIELDS if getattr(self, name) is not None]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.keys()}
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, name) for name in MOVIE_FIELDS)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Movie) and self._values() == other._values()
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    def __repr__(self) -> str:
+        return f"Movie(id={self.id!r}, title={self.title!r})"
+
+    def __reduce__(self):  # pickle/st.cache_data 지원
+        return (_movie_from_dict, (self.to_dict(),))
+
+    def replace(self, **changes) -> "Movie":
+        """📌 일부 필드만 바꾼 새 레코드 (공유 테이블에 등록됨)"""
+        return intern_movie({**self.to_dict(), **changes})
+
+
+def _movie_from_dict(data: Dict) -> Movie:
+    return intern_movie(data)
+
+
+def _same_as(existing: Movie, data: Dict) -> bool:
+    """📌 data의 값이 있는 필드가 모두 기존 레코드와 같은지 (새 레코드를 만들지 않고 비교)"""
+    for name in MOVIE_FIELDS:
+        value = data.get(name)
+        if value is None:
+            continue
+        current = getattr(existing, name)
+        if name in _SEQUENCE_FIELDS:
+            if current is None or tuple(value) != current:
+                return False
+        elif value != current:
+            return False
+    return True
+
+
+# ---------------- 프로세스 전역 공유 테이블 ----------------
+# 세션들은 같은 영화를 각자 복사하지 않고 이 테이블의 레코드를 함께 참조합니다.
+# 약한 참조라서 어느 세션도 쓰지 않는 레코드는 자동으로 사라집니다.
+_interned: "weakref.WeakValueDictionary[int, Movie]" = weakref.WeakValueDictionary()
+_intern_lock = threading.Lock()
+
+
+def intern_movie(data: Union[Dict, Movie]) -> Movie:
+    """📌 TMDb 영화 dict를 공유 레코드로 바꿉니다. 내용이 같은 레코드가 이미 있으면 그것을 반환합니다.
+
+    새 데이터에 없는 필드(예: 목록 응답에는 없는 감독/출연진)는 기존 레코드의 값을 이어받습니다.
+    """
+    if isinstance(data, Movie):
+        return data
+    movie_id = data.get("id")
+    if movie_id is None:
+        return Movie(**data)
+    with _intern_lock:
+        existing = _interned.get(movie_id)
+        if existing is not None:
+            if _same_as(existing, data):
+                return existing
+            merged = {name: data.get(name) for name in MOVIE_FIELDS}
+            for name in MOVIE_FIELDS:
+                if merged[name] is None:
+                    merged[name] = getattr(existing, name)
+            candidate = Movie(**merged)
+        else:
+            candidate = Movie(**data)
+        _interned[movie_id] = candidate
+        return candidate
+
+
+def to_movies(items: Optional[Iterable[Union[Dict, Movie]]]) -> List[Movie]:
+    """📌 영화 dict 목록을 공유 레코드 목록으로 바꿉니다 (None이면 빈 목록)."""
+    return [intern_movie(item) for item in items or ()]
+
+
+def interned_count() -> int:
+    return len(_interned)
+
+
+# ---------------- 열 단위 묶음 ----------------
+def _date_ordinal(value: Optional[str]) -> int:
+    try:
+        return date.fromisoformat(value[:10]).toordinal()
+    except (TypeError, ValueError):
+        return 0
+
+
+class MovieBatch:
+    """📌 영화 목록의 열 단위 표현 (ID·평점·인기도·개봉일을 NumPy 배열로 보관)
+
+    정렬·필터·상위 N개 선택을 파이썬 반복 없이 배열 연산으로 처리하고,
+    결과는 같은 공유 레코드를 가리키는 새 MovieBatch로 돌려줍니다.
+    (NumPy는 MovieBatch를 처음 만들 때 불러오므로, Movie만 쓰는 페이지는 NumPy를 불러오지 않습니다.)
+    """
+
+    __slots__ = ("movies", "ids", "vote_average", "popularity", "release_ordinal")
+
+    def __init__(self, movies: Sequence[Union[Dict, Movie]]):
+        import numpy as np
+        self.movies = tuple(to_movies(movies))
+        count = len(self.movies)
+        self.ids = np.fromiter((m.id or 0 for m in self.movies), dtype=np.int64, count=count)
+        self.vote_average = np.fromiter((m.vote_average or 0.0 for m in self.movies), dtype=np.float32, count=count)
+        self.popularity = np.fromiter((m.popularity or 0.0 for m in self.movies), dtype=np.float32, count=count)
+        self.release_ordinal = np.fromiter((_date_ordinal(m.release_date) for m in self.movies), dtype=np.int32, count=count)
+
+    @classmethod
+    def _from_parts(cls, movies: tuple, ids, vote_average, popularity, release_ordinal) -> "MovieBatch":
+        batch = cls.__new__(cls)
+        batch.movies = movies
+        batch.ids = ids
+        batch.vote_average = vote_average
+        batch.popularity = popularity
+        batch.release_ordinal = release_ordinal
+        return batch
+
+    @classmethod
+    def concat(cls, batches: Sequence["MovieBatch"]) -> "MovieBatch":
+        """📌 여러 묶음을 이어 붙입니다 (중복 ID는 그대로 두므로 필요하면 unique()를 호출)."""
+        import numpy as np
+        if not batches:
+            return cls(())
+        return cls._from_parts(
+            tuple(movie for batch in batches for movie in batch.movies),
+            *(np.concatenate([getattr(batch, name) for batch in batches])
+              for name in ("ids", "vote_average", "popularity", "release_ordinal")),
+        )
+
+    def take(self, indices: "np.ndarray") -> "MovieBatch":
+        return MovieBatch._from_parts(
+            tuple(self.movies[i] for i in indices.tolist()),
+            self.ids[indices], self.vote_average[indices], self.popularity[indices], self.release_ordinal[indices],
+        )
+
+    def __len__(self) -> int:
+        return len(self.movies)
+
+    def __iter__(self) -> Iterator[Movie]:
+        return iter(self.movies)
+
+    def __getitem__(self, index: int) -> Movie:
+        return self.movies[index]
+
+    def to_list(self) -> List[Movie]:
+        return list(self.movies)
+
+    def column(self, name: str) -> "np.ndarray":
+        return getattr(self, {"release_date": "release_ordinal"}.get(name, name))
+
+    def sort_by(self, name: str, descending: bool = True) -> "MovieBatch":
+        """📌 열 하나로 안정 정렬 (vote_average / popularity / release_date)"""
+        import numpy as np
+        values = self.column(name)
+        order = np.argsort(-values if descending else values, kind="stable")
+        return self.take(order)
+
+    def top(self, n: int, name: str = "popularity") -> "MovieBatch":
+        """📌 열 값이 큰 순서로 상위 n개 (argpartition 후 그 부분만 정렬)"""
+        import numpy as np
+        values = self.column(name).astype(np.float64)
+        if n >= len(values):
+            return self.sort_by(name)
+        part = np.argpartition(-values, n)[:n]
+        return self.take(part[np.argsort(-values[part], kind="stable")])
+
+    def exclude(self, movie_ids: Iterable[int]) -> "MovieBatch":
+        import numpy as np
+        return self.take(np.flatnonzero(~np.isin(self.ids, np.fromiter(movie_ids, dtype=np.int64))))
+
+    def unique(self) -> "MovieBatch":
+        """📌 ID가 같은 영화는 처음 나온 것만 남깁니다 (순서 유지)."""
+        import numpy as np
+        _, first = np.unique(self.ids, return_index=True)
+        return self.take(np.sort(first))
@@ -1,96 +1,96 @@
-import requests
-import streamlit as st
+import asyncio
 from typing import List, Dict
-from datetime import datetime
-
-# ---------------- TMDb API 설정 ----------------
-API_KEY = st.secrets["MOVIEDB_API_KEY"]
-BASE_URL = "https://api.themoviedb.org/3"
+from src import config, context_recs
+from src.aio import run_sync
+from src.cache import async_cached_get
+from src.config import BASE_URL
+from src.models import Movie, to_movies
 
 # ---------------- 트렌드 영화 가져오기 ----------------
-def get_trending_movies() -> List[Dict]:
+async def async_get_trending_movies() -> List[Movie]:
     """📌 주간 트렌딩 영화 목록을 가져옵니다."""
-    url = f"{BASE_URL}/trending/movie/week?api_key={API_KEY}&language=ko-KR"
-    response = requests.get(url)
-    return response.json().get("results", []) if response.status_code == 200 else []
+    url = f"{BASE_URL}/trending/movie/week"
+    data = await async_cached_get(url, {"api_key": config.tmdb_api_key(), "language": "ko-KR"})
+    return to_movies(data.get("results")) if data else []
+
+def get_trending_movies() -> List[Movie]:
+    return run_sync(async_get_trending_movies())
 
 # ---------------- 맞춤 추천 영화 가져오기 ----------------
-def get_personalized_recommendations(user_profile: Dict) -> List[Dict]:
+async def async_get_personalized_recommendations(user_profile: Dict) -> List[Movie]:
     """📌 사용자 프로필을 기반으로 맞춤 추천 영화를 가져옵니다."""
     preferred_genres = user_profile.get("preferred_genres", [])
     
     if not preferred_genres:
-        return get_trending_movies()  # 기본적으로 트렌딩 영화 추천
+        return await async_get_trending_movies()  # 기본적으로 트렌딩 영화 추천
+    
+    # 로컬 카탈로그가 있으면 네트워크 없이 특성 행렬로 순위 계산 (NumPy 엔진은 처음 쓸 때 불러옴)
+    from src.recommender import history_ids, recommend_for_profile
+    local_results = await asyncio.to_thread(recommend_for_profile, user_profile)
+    if local_results:
+        return local_results
     
     genre_ids = ",".join(map(str, preferred_genres))
-    url = f"{BASE_URL}/discover/movie?api_key={API_KEY}&with_genres={genre_ids}&language=ko-KR"
+    url = f"{BASE_URL}/discover/movie"
     
-    response = requests.get(url)
-    return response.json().get("results", []) if response.status_code == 200 else []
+    data = await async_cached_get(url, {"api_key": config.tmdb_api_key(), "with_genres": genre_ids, "language": "ko-KR"})
+    seen = set(history_ids(user_profile))  # 이미 본 영화·즐겨찾기는 제외
+    return [movie for movie in to_movies(data.get("results")) if movie.id not in seen] if data else []
+
+def get_personalized_recommendations(user_profile: Dict) -> List[Movie]:
+    return run_sync(async_get_personalized_recommendations(user_profile))
 
 # ---------------- 시간대 기반 추천 ----------------
-def get_time_based_recommendations():
-    """📌 현재 시간대에 따라 영화 추천"""
-    current_hour = datetime.now().hour
-    
-    if 18 <= current_hour <= 23:
-        genre_id = 18  # 드라마
-    elif 7 <= current_hour <= 9 or 17 <= current_hour <= 19:
-        genre_id = 35  # 코미디
-    elif 0 <= current_hour <= 3:
-        genre_id = 27  # 공포
-    else:
-        genre_id = None
-    
-    return fetch_movies_by_genre(genre_id) if genre_id else get_trending_movies()
+# 시간대·무드별 추천은 미리 계산해 둔 테이블에서 조회합니다 (src/context_recs.py).
+get_time_based_recommendations = context_recs.get_time_based_recommendations
 
 # ---------------- 장르 기반 추천 ----------------
-def fetch_movies_by_genre(genre_id: int):
+async def async_fetch_movies_by_genre(genre_id: int):
     """📌 특정 장르에 해당하는 영화 추천"""
-    url = f"{BASE_URL}/discover/movie?api_key={API_KEY}&with_genres={genre_id}&language=ko-KR"
-    response = requests.get(url)
-    return response.json().get("results", []) if response.status_code == 200 else []
+    url = f"{BASE_URL}/discover/movie"
+    data = await async_cached_get(url, {"api_key": config.tmdb_api_key(), "with_genres": genre_id, "language": "ko-KR"})
+    return to_movies(data.get("results")) if data else []
+
+def fetch_movies_by_genre(genre_id: int):
+    return run_sync(async_fetch_movies_by_genre(genre_id))
 
 # ---------------- 인기 영화 추천 ----------------
-def fetch_popular_movies():
+async def async_fetch_popular_movies():
     """📌 인기 영화 목록을 가져옵니다."""
-    url = f"{BASE_URL}/movie/popular?api_key={API_KEY}&language=ko-KR"
-    response = requests.get(url)
-    return response.json().get("results", []) if response.status_code == 200 else []
+    url = f"{BASE_URL}/movie/popular"
+    data = await async_cached_get(url, {"api_key": config.tmdb_api_key(), "language": "ko-KR"})
+    return to_movies(data.get("results")) if data else []
+
+def fetch_popular_movies():
+    return run_sync(async_fetch_popular_movies())
 
 # ---------------- 배우 기반 추천 ----------------
-def search_person(name: str):
+async def async_search_person(name: str):
     """📌 배우 이름으로 TMDb에서 검색"""
-    url = f"{BASE_URL}/search/person?api_key={API_KEY}&query={name}&language=ko-KR"
-    response = requests.get(url)
-    return response.json().get("results", []) if response.status_code == 200 else []
+    url = f"{BASE_URL}/search/person"
+    data = await async_cached_get(url, {"api_key": config.tmdb_api_key(), "query": name, "language": "ko-KR"})
+    return data.get("results", []) if data else []
 
-def fetch_movies_by_person(person_id: int):
+def search_person(name: str):
+    return run_sync(async_search_person(name))
+
+async def async_fetch_movies_by_person(person_id: int):
     """📌 특정 배우가 출연한 영화 목록 가져오기"""
-    url = f"{BASE_URL}/person/{person_id}/movie_credits?api_key={API_KEY}&language=ko-KR"
-    response = requests.get(url)
-    return response.json().get("cast", []) if response.status_code == 200 else []
+    url = f"{BASE_URL}/person/{person_id}/movie_credits"
+    data = await async_cached_get(url, {"api_key": config.tmdb_api_key(), "language": "ko-KR"})
+    return data.get("cast", []) if data else []
 
+def fetch_movies_by_person(person_id: int):
+    return run_sync(async_fetch_movies_by_person(person_id))
 
-### 무드(감정) 기반 영화 추천
-def get_mood_based_recommendations(mood: str) -> List[Dict]:
-    """
-    사용자의 감정(무드)에 따라 추천 영화 목록을 가져옵니다.
-    감정과 매핑된 장르 ID를 기반으로 영화를 필터링합니다.
-    """
-    url = f"{BASE_URL}/search/person?api_key={API_KEY}&query={mood}&language=ko-KR"
-    response = requests.get(url)
-    mood_to_genre = {
-        "행복한": [35, 10751],  # 코미디, 가족
-        "슬픈": [18, 10749],    # 드라마, 로맨스
-        "신나는": [28, 12],     # 액션, 모험
-        "로맨틱한": [10749, 35],# 로맨스, 코미디
-        "무서운": [27, 53],     # 공포, 스릴러
-        "미스터리한": [9648, 80],# 미스터리, 범죄
-        "판타지한": [14, 12],   # 판타지, 모험
-        "편안한": [99, 10770],   # 다큐멘터리, TV 영화
-        "추억을 떠올리는": [10752, 36], # 전쟁, 역사
-        "SF 같은": [878, 28]    # SF, 액션
-    }
-    return response.json().get("requests", []) if response.status_code == 200 else []
+async def async_fetch_person_credits(person_id: int):
+    """📌 특정 인물이 출연하거나 연출한 영화 목록 (async_fetch_movies_by_person과 같은 캐시 항목 사용)"""
+    url = f"{BASE_URL}/person/{person_id}/movie_credits"
+    data = await async_cached_get(url, {"api_key": config.tmdb_api_key(), "language": "ko-KR"})
+    if not data:
+        return []
+    return data.get("cast", []) + [m for m in data.get("crew", []) if m.get("job") == "Director"]
 
+
+### 무드(감정) 기반 영화 추천
+get_mood_based_recommendations = context_recs.get_mood_based_recommendations
@@ -0,0 +1,194 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.aio import gather_limited, run_sync
+from src.catalog import normalize_title
+from src.models import Movie, MovieBatch
+from src.movie_recommend import async_fetch_person_credits, async_search_person
+
+# ---------------- 인물 기반 추천 설정 ----------------
+MAX_PEOPLE = 10            # 한 번에 받는 최대 인물 수 (모두 동시에 조회)
+PAGE_SIZE = 5              # 한 번에 표시할 추천 수
+INDEX_TTL = 24 * 60 * 60   # 이름 → 인물, 인물 → 영화 색인 유지 시간(초) (TMDb 필모그래피 캐시와 같은 1일)
+INDEX_SIZE = 2048          # 색인에 보관할 최대 인물 수 (넘으면 오래 안 쓰인 인물부터 제외)
+OVERLAP_WEIGHT = 1.0       # 입력한 인물 한 명(가중치 1)이 참여한 영화에 더하는 점수
+POPULARITY_WEIGHT = 0.5    # 인기도(로그 정규화 0~1) 점수 — 1보다 작으므로 겹치는 인물 수가 먼저 순서를 정함
+
+
+# ---------------- 인물 → 영화 색인 ----------------
+class PersonIndex:
+    """📌 이름 → 인물, 인물 → 출연·연출 영화(MovieBatch) 색인 (프로세스 전체 공유, TTL + LRU)
+
+    영화 묶음이 공유 레코드를 붙잡고 있으므로, 같은 인물을 다시 찾으면 요청도 변환도 하지 않습니다.
+    """
+
+    def __init__(self, ttl: float = INDEX_TTL, max_people: int = INDEX_SIZE):
+        self.ttl = ttl
+        self.max_people = max_people
+        self._names: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self._films: "OrderedDict[int, Tuple[float, MovieBatch]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, table: OrderedDict, key):
+        with self._lock:
+            entry = table.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del table[key]
+                return None
+            table.move_to_end(key)
+            return entry[1]
+
+    def _put(self, table: OrderedDict, key, value) -> None:
+        with self._lock:
+            table[key] = (time.monotonic() + self.ttl, value)
+            table.move_to_end(key)
+            while len(table) > self.max_people:
+                table.popitem(last=False)
+
+    def person(self, name: str) -> Optional[Dict]:
+        return self._get(self._names, normalize_title(name))
+
+    def put_person(self, name: str, person: Dict) -> None:
+        self._put(self._names, normalize_title(name), person)
+
+    def films(self, person_id: int) -> Optional[MovieBatch]:
+        return self._get(self._films, person_id)
+
+    def put_films(self, person_id: int, films: MovieBatch) -> None:
+        self._put(self._films, person_id, films)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._names.clear()
+            self._films.clear()
+
+
+person_index = PersonIndex()
+
+
+# ---------------- 인물 조회 (동시) ----------------
+async def _resolve(name: str) -> Optional[Dict]:
+    """📌 이름으로 가장 유명한 인물 하나를 찾습니다 (찾지 못하면 None, 실패는 색인에 남기지 않음)."""
+    person = person_index.person(name)
+    if person is not None:
+        return person
+    results = await async_search_person(name)
+    if not results:
+        return None
+    best = max(results, key=lambda result: result.get("popularity") or 0.0)
+    person = {"id": best["id"], "name": best.get("name") or name}
+    person_index.put_person(name, person)
+    return person
+
+
+async def _filmography(person_id: int) -> MovieBatch:
+    films = person_index.films(person_id)
+    if films is None:
+        films = MovieBatch(await async_fetch_person_credits(person_id)).unique()
+        if len(films):
+            person_index.put_films(person_id, films)
+    return films
+
+
+async def _person_films(name: str) -> Tuple[Optional[Dict], Optional[MovieBatch]]:
+    # 인물마다 이름 검색 → 필모그래피 요청을 이어서 실행하고, 인물끼리는 동시에 진행합니다.
+    person = await _resolve(name)
+    if person is None:
+        return None, None
+    return person, await _filmography(person["id"])
+
+
+def parse_names(text: str) -> List[str]:
+    """📌 "봉준호, 송강호\n최우식" → 중복 없는 이름 목록 (최대 MAX_PEOPLE명)"""
+    names = (name.strip() for line in (text or "").splitlines() for name in line.split(","))
+    unique = OrderedDict((normalize_title(name), name) for name in names if normalize_title(name))
+    return list(unique.values())[:MAX_PEOPLE]
+
+
+# ---------------- 점수 계산 ----------------
+def rank_films(films: Sequence[MovieBatch], weights: Sequence[float]) -> Tuple[MovieBatch, np.ndarray, np.ndarray]:
+    """📌 여러 인물의 필모그래피를 합쳐 (가중 겹침 수 × OVERLAP_WEIGHT + 인기도 × POPULARITY_WEIGHT) 순으로 정렬합니다.
+
+    반환값은 (정렬된 영화, 점수, 참여 인물 수)입니다. 모든 계산은 합친 배열 한 번에 대한 NumPy 연산입니다.
+    """
+    merged = MovieBatch.concat(films)
+    if not len(merged):
+        return merged, np.zeros(0), np.zeros(0, dtype=np.int64)
+    person_weights = np.repeat(np.asarray(weights, dtype=np.float64), [len(batch) for batch in films])
+    movie_ids, first, inverse = np.unique(merged.ids, return_index=True, return_inverse=True)
+    overlap = np.bincount(inverse, weights=person_weights)
+    shared = np.bincount(inverse)
+    popularity = np.log1p(merged.popularity[first].astype(np.float64))
+    if popularity.max() > 0:
+        popularity /= popularity.max()
+    scores = OVERLAP_WEIGHT * overlap + POPULARITY_WEIGHT * popularity
+    order = np.argsort(-scores, kind="stable")
+    order = order[movie_ids[order] != 0]
+    return merged.take(first[order]), scores[order], shared[order]
+
+
+class PeopleRecommendations:
+    """📌 인물 여러 명으로 만든 추천 결과 (페이지 단위로 꺼내 씀)"""
+
+    def __init__(self, people: List[Dict], missing: List[str], films: List[MovieBatch], weights: List[float]):
+        self.people = people      # 찾은 인물 [{"id", "name", "query"}]
+        self.missing = missing    # 찾지 못한 이름
+        self._films = films
+        self.movies, self.scores, self.shared = rank_films(films, weights)
+
+    def __len__(self) -> int:
+        return len(self.movies)
+
+    @property
+    def page_count(self) -> int:
+        return -(-len(self.movies) // PAGE_SIZE)
+
+    def page(self, number: int, page_size: int = PAGE_SIZE) -> List[Movie]:
+        """📌 0부터 시작하는 number번째 페이지의 영화"""
+        return list(self.movies.movies[number * page_size:(number + 1) * page_size])
+
+    def pages(self, page_size: int = PAGE_SIZE) -> Iterator[List[Movie]]:
+        for start in range(0, len(self.movies), page_size):
+            yield list(self.movies.movies[start:start + page_size])
+
+    def credited(self, movies: Iterable[Movie]) -> Dict[int, List[str]]:
+        """📌 영화 ID → 그 영화에 참여한, 입력한 인물들의 이름"""
+        movie_ids = np.fromiter((movie.id or 0 for movie in movies), dtype=np.int64)
+        names = {movie_id: [] for movie_id in movie_ids.tolist()}
+        for person, films in zip(self.people, self._films):
+            for movie_id in movie_ids[np.isin(movie_ids, films.ids)].tolist():
+                names[movie_id].append(person["name"])
+        return names
+
+
+async def async_recommend_by_people(names: Sequence[str], weights: Optional[Sequence[float]] = None) -> PeopleRecommendations:
+    """📌 배우·감독 이름 여러 개로 추천 목록을 만듭니다.
+
+    모든 이름을 동시에 찾고, 찾은 인물의 필모그래피도 바로 이어서 가져오므로
+    처음 보는 인물이 10명이어도 대기 시간은 요청 20번이 아니라 왕복 두 번(검색 → 필모그래피) 정도입니다.
+    색인에 있는 인물은 요청을 보내지 않습니다. weights는 이름별 가중치(기본 1)입니다.
+    """
+    names = list(names)[:MAX_PEOPLE]
+    weights = list(weights or [1.0] * len(names))
+    results = await gather_limited(_person_films, names, MAX_PEOPLE)
+    people, missing, films, used_weights = [], [], [], []
+    for name, weight, (person, person_films) in zip(names, weights, results):
+        if person is None or person_films is None or not len(person_films):
+            missing.append(name)
+            continue
+        if any(found["id"] == person["id"] for found in people):
+            continue  # 다른 표기로 같은 인물을 두 번 입력한 경우
+        people.append({**person, "query": name})
+        films.append(person_films)
+        used_weights.append(weight)
+    return PeopleRecommendations(people, missing, films, used_weights)
+
+
+def recommend_by_people(names: Sequence[str], weights: Optional[Sequence[float]] = None) -> PeopleRecommendations:
+    return run_sync(async_recommend_by_people(names, weights))
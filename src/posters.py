@@ -0,0 +1,207 @@
+import asyncio
+import os
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+import httpx
+
+from src import http_client, metrics
+from src.aio import gather_limited, run_sync, submit
+from src.singleflight import SingleFlight
+
+# ---------------- 포스터 설정 ----------------
+IMAGE_BASE_URL = os.environ.get("MOVIEMIND_IMAGE_BASE_URL", "https://image.tmdb.org/t/p")
+POSTER_WIDTHS = (92, 154, 185, 342, 500, 780)   # TMDb가 제공하는 포스터 너비 (w92 … w780)
+PIXEL_RATIO = 1.0                                # 고해상도 화면용으로 올리면 한 단계 큰 이미지를 받습니다.
+CACHE_DIR = os.environ.get("MOVIEMIND_POSTER_DIR", os.path.join(".cache", "posters"))
+MAX_CACHE_BYTES = 256 * 1024 * 1024              # 디스크 포스터 캐시 상한 (256MB)
+DOWNLOAD_CONCURRENCY = 8
+PLACEHOLDER_COLOR = (0x28, 0x28, 0x28)           # .movie-card 배경색과 같은 색
+
+
+def size_for(width: int) -> str:
+    """📌 화면 표시 너비를 담을 수 있는 가장 작은 TMDb 크기 이름 (예: 250 → "w342")"""
+    needed = width * PIXEL_RATIO
+    for candidate in POSTER_WIDTHS:
+        if candidate >= needed:
+            return f"w{candidate}"
+    return f"w{POSTER_WIDTHS[-1]}"
+
+
+def poster_url(poster_path: str, width: int) -> str:
+    return f"{IMAGE_BASE_URL}/{size_for(width)}{poster_path}"
+
+
+# ---------------- 대체 이미지 ----------------
+@lru_cache(maxsize=16)
+def placeholder_png(width: int) -> bytes:
+    """📌 포스터가 없을 때 쓰는 2:3 비율 단색 PNG (외부 사이트 없이 로컬에서 생성)"""
+    height = width * 3 // 2
+    raw = (b"\x00" + bytes(PLACEHOLDER_COLOR) * width) * height
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)  # 8비트 RGB
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(raw, 9)) + chunk(b"IEND", b"")
+
+
+# ---------------- 디스크 LRU 캐시 ----------------
+class PosterCache:
+    """📌 포스터 바이트를 디스크에 저장하는 용량 제한 LRU 캐시
+
+    파일 수정 시각을 마지막 사용 시각으로 쓰므로, 재시작 후에도 LRU 순서가 유지되고
+    같은 디렉터리를 쓰는 여러 프로세스가 캐시를 공유할 수 있습니다.
+    """
+
+    def __init__(self, directory: str = CACHE_DIR, max_bytes: int = MAX_CACHE_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._index: "Optional[OrderedDict[str, int]]" = None  # 파일 이름 → 크기 (오래 쓰지 않은 순)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def _load_index(self) -> "OrderedDict[str, int]":
+        if self._index is None:
+            os.makedirs(self.directory, exist_ok=True)
+            entries = []
+            for entry in os.scandir(self.directory):
+                if entry.is_file() and not entry.name.endswith(".tmp"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.name, stat.st_size))
+            self._index = OrderedDict((name, size) for _, name, size in sorted(entries))
+            self._bytes = sum(self._index.values())
+        return self._index
+
+    @staticmethod
+    def filename(size: str, poster_path: str) -> str:
+        return f"{size}_{poster_path.strip('/').replace('/', '_')}"
+
+    def contains(self, name: str) -> bool:
+        with self._lock:
+            return name in self._load_index()
+
+    def get(self, name: str) -> Optional[bytes]:
+        with self._lock:
+            index = self._load_index()
+            if name not in index:
+                return None
+            index.move_to_end(name)
+        path = os.path.join(self.directory, name)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+            return data
+        except OSError:  # 다른 프로세스가 먼저 지운 경우
+            with self._lock:
+                self._bytes -= self._index.pop(name, 0)
+            return None
+
+    def put(self, name: str, data: bytes) -> None:
+        path = os.path.join(self.directory, name)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with self._lock:
+            index = self._load_index()
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                print(f"포스터 캐시 저장 오류: {e}")
+                return
+            self._bytes += len(data) - index.pop(name, 0)
+            index[name] = len(data)
+            while self._bytes > self.max_bytes and len(index) > 1:
+                oldest, size = index.popitem(last=False)
+                self._bytes -= size
+                try:
+                    os.remove(os.path.join(self.directory, oldest))
+                except OSError:
+                    pass
+
+
+poster_cache = PosterCache()
+_downloads = SingleFlight()
+
+
+# ---------------- 내려받기 ----------------
+async def _download(name: str, url: str) -> Optional[bytes]:
+    try:
+        response = await http_client.async_get(url)
+    except httpx.HTTPError as e:
+        print(f"포스터 요청 오류 ({url}): {e}")
+        return None
+    if response.status_code != 200 or not response.headers.get("content-type", "").startswith("image/"):
+        return None
+    data = response.content
+    await asyncio.to_thread(poster_cache.put, name, data)
+    return data
+
+
+async def _download_many(items: List[tuple]) -> List[Optional[bytes]]:
+    """📌 (파일 이름, URL) 목록을 동시에 내려받습니다. 같은 포스터의 동시 요청은 하나로 합칩니다."""
+    async def fetch(item):
+        name, url = item
+        return await _downloads.do_async(name, lambda: _download(name, url))
+
+    return await gather_limited(fetch, items, DOWNLOAD_CONCURRENCY)
+
+
+class _WithPlaceholder(dict):
+    """📌 없는 키를 조회하면 대체 이미지를 돌려주는 dict"""
+
+    def __init__(self, posters: Dict, placeholder: bytes):
+        super().__init__(posters)
+        self.placeholder = placeholder
+
+    def __missing__(self, key):
+        return self.placeholder
+
+
+def load_posters(poster_paths: Iterable[Optional[str]], width: int) -> Dict[Optional[str], bytes]:
+    """📌 여러 포스터를 표시 너비에 맞는 크기로 가져옵니다 (디스크 캐시 → 없으면 동시 다운로드).
+
+    반환값은 {poster_path: 이미지 바이트}이며, 없거나 받지 못한 포스터는 대체 이미지로 채웁니다.
+    """
+    size = size_for(width)
+    posters: Dict[Optional[str], bytes] = {}
+    missing = []
+    for poster_path in dict.fromkeys(poster_paths):
+        if not poster_path:
+            continue
+        name = PosterCache.filename(size, poster_path)
+        data = poster_cache.get(name)
+        if data is not None:
+            posters[poster_path] = data
+        else:
+            missing.append((poster_path, name))
+
+    endpoint = poster_url("/poster.jpg", width)  # 계측용 대표 URL (크기별로 집계)
+    if posters:
+        metrics.record_cache(endpoint, "hit", len(posters))
+    if missing:
+        metrics.record_cache(endpoint, "miss", len(missing))
+        results = run_sync(_download_many([(name, poster_url(path, width)) for path, name in missing]))
+        for (poster_path, _), data in zip(missing, results):
+            if data is not None:
+                posters[poster_path] = data
+
+    return _WithPlaceholder(posters, placeholder_png(width))
+
+
+def prefetch_posters(poster_paths: Iterable[Optional[str]], width: int) -> None:
+    """📌 다음에 보여줄 포스터를 백그라운드에서 디스크 캐시에 미리 받아 둡니다 (기다리지 않음, 요청은 호출한 페이지에 집계)."""
+    size = size_for(width)
+    items = []
+    for poster_path in dict.fromkeys(poster_paths):
+        if poster_path:
+            name = PosterCache.filename(size, poster_path)
+            if not poster_cache.contains(name):
+                items.append((name, poster_url(poster_path, width)))
+    if items:
+        submit(_download_many(items))
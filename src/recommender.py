@@ -0,0 +1,157 @@
+import os
+import threading
+import zlib
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from src.catalog import CATALOG_PATH, iter_movies
+from src.models import Movie, to_movies
+
+# ---------------- 추천 엔진 설정 ----------------
+# TMDb 영화 장르 ID (열 순서 고정)
+GENRE_IDS = [28, 12, 16, 35, 80, 99, 18, 10751, 14, 36, 27, 10402, 9648, 10749, 878, 10770, 53, 10752, 37]
+KEYWORD_BUCKETS = 64  # 키워드 ID를 해시해 넣을 열 수 (행렬 크기와 응답 시간의 균형)
+
+# 사용자 프로필 벡터의 수치형 특성 가중치 (장르 일치 점수 대비)
+POPULARITY_WEIGHT = 0.3
+RATING_WEIGHT = 0.3
+RECENCY_WEIGHT = 0.1
+KEYWORD_WEIGHT = 0.5
+HISTORY_WEIGHT = 0.5  # 즐겨찾기·시청한 영화의 장르/키워드 평균에 곱하는 가중치
+
+_GENRE_COLUMN = {genre_id: i for i, genre_id in enumerate(GENRE_IDS)}
+_KEYWORD_OFFSET = len(GENRE_IDS)
+_POPULARITY_COL = _KEYWORD_OFFSET + KEYWORD_BUCKETS
+_RATING_COL = _POPULARITY_COL + 1
+_YEAR_COL = _POPULARITY_COL + 2
+N_FEATURES = _YEAR_COL + 1
+
+
+def feature_bucket(value: int, buckets: int) -> int:
+    """📌 ID를 0 ~ buckets-1 중 하나로 해시합니다 (crc32라 프로세스·재시작과 무관하게 같은 값)."""
+    return zlib.crc32(str(value).encode()) % buckets
+
+
+def keyword_column(keyword_id: int) -> int:
+    return _KEYWORD_OFFSET + feature_bucket(keyword_id, KEYWORD_BUCKETS)
+
+
+def _release_year(release_date: str) -> float:
+    try:
+        return float(release_date[:4])
+    except (TypeError, ValueError):
+        return np.nan
+
+
+# ---------------- 특성 행렬 기반 추천 엔진 ----------------
+class RecommendationEngine:
+    """📌 영화 특성 행렬(장르·키워드·인기도·평점·개봉연도)과 사용자 프로필 벡터의 내적으로 순위를 매깁니다."""
+
+    def __init__(self, movies: List[Dict]):
+        self.ids = np.fromiter((m["id"] for m in movies), dtype=np.int64, count=len(movies))
+        self.features = self._build_features(movies)
+        # 특성 행렬을 만든 뒤에는 화면에 쓰는 필드만 담은 공유 레코드로 보관 (키워드·출연진 ID 목록은 버림)
+        self.movies = to_movies(movies)
+
+    @staticmethod
+    def _build_features(movies: List[Dict]) -> np.ndarray:
+        n = len(movies)
+        features = np.zeros((n, N_FEATURES), dtype=np.float32)
+        rows, cols = [], []
+        for row, movie in enumerate(movies):
+            for genre_id in movie.get("genre_ids", []):
+                col = _GENRE_COLUMN.get(genre_id)
+                if col is not None:
+                    rows.append(row)
+                    cols.append(col)
+            for keyword_id in movie.get("keyword_ids", []):
+                rows.append(row)
+                cols.append(keyword_column(keyword_id))
+        features[rows, cols] = 1.0
+
+        popularity = np.log1p(np.fromiter((m.get("popularity", 0) for m in movies), np.float32, n))
+        features[:, _POPULARITY_COL] = popularity / popularity.max() if n and popularity.max() > 0 else 0
+        features[:, _RATING_COL] = np.fromiter((m.get("vote_average", 0) for m in movies), np.float32, n) / 10
+
+        years = np.fromiter((_release_year(m.get("release_date")) for m in movies), np.float32, n)
+        if n and not np.all(np.isnan(years)):
+            low, high = np.nanmin(years), np.nanmax(years)
+            span = high - low if high > low else 1.0
+            features[:, _YEAR_COL] = np.nan_to_num((years - low) / span, nan=0.0)
+        return features
+
+    def __len__(self) -> int:
+        return len(self.movies)
+
+    def profile_vector(self, preferred_genres: Iterable[int], keyword_ids: Iterable[int] = (),
+                       history_ids: Iterable[int] = ()) -> np.ndarray:
+        """📌 사용자 선호 장르/키워드와 즐겨찾기·시청 기록(영화 ID)으로 프로필 벡터를 만듭니다.
+
+        기록에 있는 영화들의 장르·키워드 열 평균을 더하므로, 선호 장르가 같아도 기록이 다르면 순위가 달라집니다.
+        """
+        vector = np.zeros(N_FEATURES, dtype=np.float32)
+        for genre_id in preferred_genres:
+            col = _GENRE_COLUMN.get(genre_id)
+            if col is not None:
+                vector[col] = 1.0
+        for keyword_id in keyword_ids:
+            vector[keyword_column(keyword_id)] = KEYWORD_WEIGHT
+        history = np.isin(self.ids, list(history_ids))
+        if history.any():
+            vector[:_POPULARITY_COL] += HISTORY_WEIGHT * self.features[history, :_POPULARITY_COL].mean(axis=0)
+        vector[_POPULARITY_COL] = POPULARITY_WEIGHT
+        vector[_RATING_COL] = RATING_WEIGHT
+        vector[_YEAR_COL] = RECENCY_WEIGHT
+        return vector
+
+    def top_k(self, vector: np.ndarray, k: int = 20, exclude_ids: Iterable[int] = ()) -> List[Movie]:
+        """📌 전체 카탈로그에 대해 한 번의 행렬-벡터 곱과 argpartition으로 상위 k편을 고릅니다."""
+        if not self.movies or k <= 0:
+            return []
+        scores = self.features @ vector
+        exclude_ids = list(exclude_ids)
+        if exclude_ids:
+            scores[np.isin(self.ids, exclude_ids)] = -np.inf
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [self.movies[i] for i in top if np.isfinite(scores[i])]
+
+
+_engine: Optional[RecommendationEngine] = None
+_engine_mtime: Optional[float] = None
+_engine_lock = threading.Lock()
+
+
+def get_engine(path: str = CATALOG_PATH) -> Optional[RecommendationEngine]:
+    """📌 카탈로그로 만든 엔진을 반환합니다. 카탈로그 파일이 바뀌면 다시 만듭니다."""
+    global _engine, _engine_mtime
+    if not os.path.exists(path):
+        return None
+    mtime = os.path.getmtime(path)
+    with _engine_lock:
+        if _engine is None or mtime != _engine_mtime:
+            _engine = RecommendationEngine(list(iter_movies(path)))
+            _engine_mtime = mtime
+        return _engine
+
+
+def history_ids(user_profile: Dict) -> List[int]:
+    """📌 프로필의 즐겨찾기·시청 기록 영화 ID (세션 상태에서 load_user_preferences()가 채움)"""
+    return [*user_profile.get("favorite_movie_ids", []), *user_profile.get("watched_movie_ids", [])]
+
+
+def recommend_for_profile(user_profile: Dict, k: int = 20) -> List[Movie]:
+    """📌 사용자 프로필에 맞는 영화를 로컬 카탈로그에서 추천합니다 (카탈로그가 비어 있으면 빈 목록)."""
+    engine = get_engine()
+    if engine is None or not len(engine):
+        return []
+    history = history_ids(user_profile)
+    vector = engine.profile_vector(
+        user_profile.get("preferred_genres", []),
+        user_profile.get("preferred_keywords", []),
+        history,
+    )
+    # 이미 본 영화와 즐겨찾기한 영화는 다시 추천하지 않음
+    return engine.top_k(vector, k, exclude_ids=[*history, *user_profile.get("seen_movie_ids", [])])
@@ -0,0 +1,378 @@
+import asyncio
+import contextvars
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+from urllib.parse import urlsplit
+
+import httpx
+
+from src import metrics
+
+T = TypeVar("T")
+
+# ---------------- 장애 대응 설정 ----------------
+# 페이지 한 번 렌더링에서 목록 섹션을 기다리는 최대 시간(초). 넘으면 마지막으로 받은 스냅숏을 표시합니다.
+LATENCY_BUDGETS_ENABLED = os.environ.get("MOVIEMIND_LATENCY_BUDGETS", "1") != "0"
+DEFAULT_LATENCY_BUDGET = float(os.environ.get("MOVIEMIND_LATENCY_BUDGET", "3.0"))
+PAGE_LATENCY_BUDGETS: Dict[str, float] = {
+    "홈": 1.5,
+    "영화 검색": 2.5,
+    "추천 생성": 2.5,
+}
+
+BREAKER_FAILURES = 5           # 연속으로 이만큼 실패하면 호스트 회로를 엽니다
+BREAKER_COOLDOWN = 15.0        # 회로를 연 뒤 시험 요청 하나를 보내기까지 기다리는 시간(초)
+
+HEDGE_DEFAULT_DELAY = 0.5      # 지연 표본이 모이기 전, 중복 요청을 보내기까지 기다리는 시간(초)
+HEDGE_MIN_DELAY = 0.05
+HEDGE_MAX_DELAY = 2.0
+HEDGE_QUANTILE = 0.95          # 이 분위수보다 오래 걸리는 요청에만 중복 요청을 보냄
+HEDGE_MIN_SAMPLES = 20
+HEDGE_MAX_RATIO = 0.1          # 중복 요청은 전체 요청의 10%까지만 (느린 호스트에 부하를 더 얹지 않도록)
+HEDGE_BURST = 2
+
+SNAPSHOT_DIR = os.environ.get("MOVIEMIND_SNAPSHOT_DIR", os.path.join(".cache", "snapshots"))
+MAX_SNAPSHOTS = 5000           # 넘으면 오래된 스냅숏부터 지움
+# 마지막 성공 응답을 디스크에 남겨 둘 엔드포인트: 트렌딩, 인기, 장르/키워드 탐색, 상세(크레딧 포함)
+SNAPSHOT_PATTERNS = [
+    re.compile(r"/trending/"),
+    re.compile(r"/movie/popular$"),
+    re.compile(r"/discover/movie$"),
+    re.compile(r"/movie/\d+$"),
+]
+
+
+def snapshot_enabled(url: str) -> bool:
+    path = urlsplit(url).path
+    return any(pattern.search(path) for pattern in SNAPSHOT_PATTERNS)
+
+
+# ---------------- 회로 차단기 ----------------
+class CircuitOpenError(httpx.TransportError):
+    """📌 회로가 열린 호스트로 요청을 보내지 않고 바로 실패합니다 (기존 httpx 오류 처리로 잡힘)."""
+
+
+class CircuitBreaker:
+    """📌 호스트별 회로 차단기
+
+    연속 실패가 BREAKER_FAILURES번이면 회로를 열어 요청을 바로 거절하고,
+    BREAKER_COOLDOWN초마다 시험 요청 하나만 통과시켜 성공하면 다시 닫습니다.
+    """
+
+    def __init__(self, host: str, failures: int = BREAKER_FAILURES, cooldown: float = BREAKER_COOLDOWN):
+        self.host = host
+        self.threshold = failures
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened = 0         # 회로가 열린 횟수
+        self.rejected = 0       # 회로가 열려 거절한 요청 수
+        self._retry_at: Optional[float] = None  # 열려 있으면 다음 시험 요청을 허용할 시각
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._retry_at is None:
+                return "closed"
+            return "half_open" if time.monotonic() >= self._retry_at else "open"
+
+    def available(self) -> bool:
+        """📌 지금 요청을 보내면 통과될지 (시험 요청 기회를 쓰지 않고 확인만 함)"""
+        with self._lock:
+            return self._retry_at is None or time.monotonic() >= self._retry_at
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._retry_at is None:
+                return True
+            now = time.monotonic()
+            if now >= self._retry_at:
+                self._retry_at = now + self.cooldown  # 시험 요청은 한 번에 하나만
+                return True
+            self.rejected += 1
+            return False
+
+    def record(self, ok: bool) -> None:
+        with self._lock:
+            if ok:
+                recovered = self._retry_at is not None
+                self.failures, self._retry_at = 0, None
+            else:
+                recovered = False
+                self.failures += 1
+                if self._retry_at is not None:
+                    self._retry_at = time.monotonic() + self.cooldown
+                    return
+                if self.failures < self.threshold:
+                    return
+                self._retry_at = time.monotonic() + self.cooldown
+                self.opened += 1
+        if ok and recovered:
+            print(f"✅ 회로 복구: {self.host}")
+        elif not ok:
+            print(f"⚠️ 회로 열림: {self.host} (연속 실패 {self.threshold}회, {self.cooldown:.0f}초 동안 요청 차단)")
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def breaker_for(host: str) -> CircuitBreaker:
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = _breakers[host] = CircuitBreaker(host)
+        return breaker
+
+
+# ---------------- 헤지(중복) 요청 ----------------
+class _HostLatency:
+    """📌 호스트별 최근 요청 지연 표본과 중복 요청 한도"""
+
+    __slots__ = ("samples", "requests", "hedges", "hedge_wins", "_lock")
+
+    def __init__(self):
+        self.samples: deque = deque(maxlen=256)
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self.samples.append(seconds)
+            self.requests += 1
+            if self.requests >= 1000:  # 한도는 최근 요청 기준으로 계산
+                self.requests //= 2
+                self.hedges //= 2
+
+    def hedge_delay(self) -> float:
+        with self._lock:
+            if len(self.samples) < HEDGE_MIN_SAMPLES:
+                return HEDGE_DEFAULT_DELAY
+            ordered = sorted(self.samples)
+        delay = ordered[min(len(ordered) - 1, int(len(ordered) * HEDGE_QUANTILE))]
+        return min(max(delay, HEDGE_MIN_DELAY), HEDGE_MAX_DELAY)
+
+    def take_hedge(self) -> bool:
+        with self._lock:
+            if self.hedges >= self.requests * HEDGE_MAX_RATIO + HEDGE_BURST:
+                return False
+            self.hedges += 1
+            return True
+
+
+_latencies: Dict[str, _HostLatency] = {}
+_latencies_lock = threading.Lock()
+
+
+def _latency_for(host: str) -> _HostLatency:
+    with _latencies_lock:
+        latency = _latencies.get(host)
+        if latency is None:
+            latency = _latencies[host] = _HostLatency()
+        return latency
+
+
+async def hedged(host: str, call: Callable[[], Awaitable[T]]) -> T:
+    """📌 call()이 이 호스트 지연의 p95보다 오래 걸리면 같은 요청을 하나 더 보내고, 먼저 성공한 응답을 씁니다.
+
+    GET 요청에만 사용합니다. 남은 요청은 취소합니다.
+    """
+    latency = _latency_for(host)
+    started = time.perf_counter()
+    primary = asyncio.ensure_future(call())
+    tasks = {primary}
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=latency.hedge_delay())
+        if not done and latency.take_hedge():
+            tasks.add(asyncio.ensure_future(call()))
+        while True:
+            done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            failed = None
+            for task in done:
+                if task.exception() is None:
+                    if task is not primary:
+                        latency.hedge_wins += 1
+                    return task.result()
+                failed = task
+            if not tasks:
+                raise failed.exception()
+    finally:
+        for task in tasks:
+            task.cancel()
+        latency.observe(time.perf_counter() - started)
+
+
+# ---------------- 페이지 지연 예산 ----------------
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("moviemind_deadline", default=None)
+
+
+@contextmanager
+def latency_budget(page: str, seconds: Optional[float] = None):
+    """📌 이 블록(페이지 렌더링) 안의 목록 요청이 기다릴 수 있는 시간을 정합니다."""
+    if seconds is None:
+        seconds = PAGE_LATENCY_BUDGETS.get(page, DEFAULT_LATENCY_BUDGET)
+    token = _deadline.set(time.monotonic() + seconds if LATENCY_BUDGETS_ENABLED else None)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """📌 현재 페이지의 남은 지연 예산(초). 예산이 없으면 None."""
+    deadline = _deadline.get()
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+class StaleMark:
+    """📌 섹션을 그리는 동안 스냅숏으로 대신한 응답이 있었는지 (가장 오래된 저장 시각)"""
+
+    __slots__ = ("saved_at",)
+
+    def __init__(self):
+        self.saved_at: Optional[float] = None
+
+    def note(self, saved_at: float) -> None:
+        if self.saved_at is None or saved_at < self.saved_at:
+            self.saved_at = saved_at
+
+
+_stale_mark: contextvars.ContextVar[Optional[StaleMark]] = contextvars.ContextVar("moviemind_stale", default=None)
+
+
+@contextmanager
+def stale_scope():
+    """📌 이 블록에서 스냅숏으로 대신한 응답이 있으면 반환한 StaleMark에 표시됩니다."""
+    mark = StaleMark()
+    token = _stale_mark.set(mark)
+    try:
+        yield mark
+    finally:
+        _stale_mark.reset(token)
+
+
+# ---------------- 마지막 성공 응답 스냅숏 ----------------
+class SnapshotStore:
+    """📌 캐시 키별 마지막 성공 응답을 디스크(JSON)에 보관합니다.
+
+    프로세스를 다시 시작해도 남으므로, 새 워커가 느린 업스트림을 만나도 첫 화면을 바로 그릴 수 있습니다.
+    """
+
+    def __init__(self, directory: str = SNAPSHOT_DIR, max_files: int = MAX_SNAPSHOTS):
+        self.directory = directory
+        self.max_files = max_files
+        self.served = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(key.encode()).hexdigest() + ".json")
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """📌 (응답, 저장 시각) 또는 None"""
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            print(f"스냅숏 읽기 오류: {e}")
+            return None
+        if snapshot.get("key") != key:
+            return None
+        return snapshot["data"], snapshot["saved_at"]
+
+    def put(self, key: str, data: Any) -> None:
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "saved_at": time.time(), "data": data}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"스냅숏 저장 오류: {e}")
+            return
+        with self._lock:
+            self._writes += 1
+            prune = self._writes % 100 == 0
+        if prune:
+            self._prune()
+
+    def _prune(self) -> None:
+        try:
+            entries = sorted(
+                (entry.stat().st_mtime, entry.path)
+                for entry in os.scandir(self.directory) if entry.name.endswith(".json")
+            )
+            for _, path in entries[:max(0, len(entries) - self.max_files)]:
+                os.remove(path)
+        except OSError as e:
+            print(f"스냅숏 정리 오류: {e}")
+
+
+snapshots = SnapshotStore()
+
+
+def _serve_snapshot(url: str, snapshot: Tuple[Any, float]) -> Any:
+    data, saved_at = snapshot
+    metrics.record_cache(url, "snapshot")
+    with snapshots._lock:
+        snapshots.served += 1
+    mark = _stale_mark.get()
+    if mark is not None:
+        mark.note(saved_at)
+    return data
+
+
+def _consume_result(task: "asyncio.Future") -> None:
+    if not task.cancelled():
+        task.exception()
+
+
+async def fetch_within_budget(key: str, url: str, load: Callable[[], Awaitable[Optional[Any]]]) -> Optional[Any]:
+    """📌 load()를 페이지의 남은 지연 예산만큼만 기다립니다.
+
+    예산을 넘기거나, 요청이 실패하거나, 호스트 회로가 열려 있으면 마지막 성공 스냅숏을 대신 반환합니다.
+    예산을 넘긴 요청은 취소하지 않고 끝까지 받아 캐시와 스냅숏을 갱신합니다 (다음 렌더링에서 사용).
+    스냅숏이 없으면 평소처럼 응답을 기다립니다.
+    """
+    if not breaker_for(urlsplit(url).netloc).available():
+        snapshot = await asyncio.to_thread(snapshots.get, key)
+        if snapshot is not None:
+            return _serve_snapshot(url, snapshot)
+        return await load()
+
+    task = asyncio.ensure_future(load())
+    budget = remaining()
+    if budget is not None:
+        done, _ = await asyncio.wait({task}, timeout=budget)
+        if not done:
+            snapshot = await asyncio.to_thread(snapshots.get, key)
+            if snapshot is not None and not task.done():
+                task.add_done_callback(_consume_result)
+                return _serve_snapshot(url, snapshot)
+    data = await task
+    if data is None:
+        snapshot = await asyncio.to_thread(snapshots.get, key)
+        if snapshot is not None:
+            return _serve_snapshot(url, snapshot)
+    return data
+
+
+def stats() -> Dict[str, Any]:
+    """📌 회로 상태, 헤지 요청, 스냅숏 사용 횟수 (벤치마크·디버그용)"""
+    with _breakers_lock:
+        breakers = {host: {"state": b.state, "opened": b.opened, "rejected": b.rejected} for host, b in _breakers.items()}
+    with _latencies_lock:
+        hedges = {host: {"requests": l.requests, "hedges": l.hedges, "wins": l.hedge_wins} for host, l in _latencies.items()}
+    return {"breakers": breakers, "hedges": hedges, "snapshots_served": snapshots.served}
@@ -0,0 +1,227 @@
+import asyncio
+import bisect
+import threading
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future, TimeoutError as FutureTimeout
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.aio import get_loop
+from src.catalog import normalize_title
+from src.data_fetcher import async_search_movie
+from src.models import Movie, to_movies
+from src.movie_recommend import fetch_popular_movies, get_trending_movies
+
+# ---------------- 검색어 자동 완성 설정 ----------------
+NODE_TOP = 20              # 접두사(노드)마다 미리 골라 두는 인기순 상위 영화 수
+MAX_DEPTH = 24             # 트라이 최대 깊이(자모 수). 더 긴 검색어는 이 깊이의 후보를 걸러서 사용
+MAX_MOVIES = 3000          # 색인에 보관할 최대 영화 수 (넘으면 오래 안 쓰인 영화부터 제외하고 다시 구성)
+MIN_LOCAL_RESULTS = 5      # 로컬 후보가 이보다 적을 때만 TMDb 검색을 보냄
+MIN_API_CHARS = 2          # 이보다 짧은 검색어(정규화 후 글자 수)는 TMDb 검색을 보내지 않음
+DEBOUNCE_SECONDS = 0.25    # 마지막 입력 후 이 시간 동안 새 입력이 없을 때만 TMDb 검색을 보냄
+API_WAIT = 1.0             # 화면을 그리기 전에 TMDb 검색 결과를 기다리는 최대 시간(초)
+
+# ---------------- 한글 자모 분해 ----------------
+# 입력 중인 글자("기ㅅ", "기새")도 완성된 제목("기생충")과 접두사로 일치하도록
+# 음절을 초성·중성·종성으로, 겹받침·겹모음은 입력 순서대로 나눕니다.
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+              "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+_COMPOUND = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+}
+
+
+def _build_jamo_table() -> Dict[int, str]:
+    table = {ord(jamo): parts for jamo, parts in _COMPOUND.items()}
+    for code in range(0xAC00, 0xD7A4):
+        offset = code - 0xAC00
+        jamo = _CHOSEONG[offset // 588] + _JUNGSEONG[offset % 588 // 28] + _JONGSEONG[offset % 28]
+        table[code] = jamo.translate(table)
+    return table
+
+
+_JAMO_TABLE = _build_jamo_table()
+
+
+def to_jamo(text: str) -> str:
+    """📌 "기생충" → "ㄱㅣㅅㅐㅇㅊㅜㅇ" (한글 외 글자는 그대로)"""
+    return text.translate(_JAMO_TABLE)
+
+
+def search_key(text: str) -> str:
+    """📌 검색어/제목을 트라이 키로 바꿉니다 (소문자, 공백·구두점 제거, 자모 분해)."""
+    return to_jamo(normalize_title(text))
+
+
+def title_keys(movie: Movie) -> List[str]:
+    """📌 영화 하나의 트라이 키: 제목·원제 전체와, 제목의 각 단어부터 시작하는 뒷부분"""
+    keys = []
+    for title in (movie.get("title", ""), movie.get("original_title", "")):
+        words = title.split()
+        for i in range(len(words)):
+            keys.append(search_key(" ".join(words[i:])))
+    return [key for key in dict.fromkeys(keys) if key]
+
+
+# ---------------- 접두사 트라이 ----------------
+class _Node:
+    __slots__ = ("children", "top")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.top: List[Tuple[float, int]] = []  # (-인기도, 영화 ID) 오름차순 = 인기순
+
+
+class TitleTrie:
+    """📌 영화 제목 접두사 트라이 (트렌딩·인기 영화와 한 번 본 검색 결과로 채움)
+
+    각 노드는 그 접두사로 시작하는 인기순 상위 NODE_TOP편을 삽입할 때 미리 골라 두므로,
+    조회는 검색어 길이만큼 노드를 따라가는 것으로 끝납니다.
+    """
+
+    def __init__(self):
+        self._root = _Node()
+        self._movies: "OrderedDict[int, Movie]" = OrderedDict()  # 최근에 추가/조회된 순서
+        self._keys: Dict[int, List[str]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._movies)
+
+    @staticmethod
+    def _offer(node: _Node, entry: Tuple[float, int]) -> None:
+        top = node.top
+        if len(top) >= NODE_TOP and entry >= top[-1]:
+            return
+        if any(movie_id == entry[1] for _, movie_id in top):
+            return
+        bisect.insort(top, entry)
+        if len(top) > NODE_TOP:
+            top.pop()
+
+    def _insert(self, movie: Movie) -> None:
+        keys = title_keys(movie)
+        self._keys[movie.id] = keys
+        entry = (-(movie.get("popularity", 0.0)), movie.id)
+        for key in keys:
+            node = self._root
+            for char in key[:MAX_DEPTH]:
+                node = node.children.setdefault(char, _Node())
+                self._offer(node, entry)
+
+    def _rebuild(self) -> None:
+        while len(self._movies) > MAX_MOVIES * 3 // 4:
+            self._movies.popitem(last=False)
+        self._root, self._keys = _Node(), {}
+        for movie in self._movies.values():
+            self._insert(movie)
+
+    def add(self, movies: Iterable) -> int:
+        """📌 영화들을 색인에 추가합니다 (이미 있는 영화는 최근 사용으로만 표시). 새로 추가한 수를 반환합니다."""
+        added = 0
+        with self._lock:
+            for movie in to_movies(movies):
+                if movie.id is None:
+                    continue
+                if movie.id in self._movies:
+                    self._movies.move_to_end(movie.id)
+                    continue
+                self._movies[movie.id] = movie
+                self._insert(movie)
+                added += 1
+            if len(self._movies) > MAX_MOVIES:
+                self._rebuild()
+        return added
+
+    def suggest(self, query: str, limit: int = NODE_TOP) -> List[Movie]:
+        """📌 검색어로 시작하는 제목(또는 제목 속 단어)의 영화를 인기순으로 반환합니다."""
+        key = search_key(query)
+        if not key:
+            return []
+        with self._lock:
+            node = self._root
+            for char in key[:MAX_DEPTH]:
+                node = node.children.get(char)
+                if node is None:
+                    return []
+            movie_ids = [movie_id for _, movie_id in node.top]
+            if len(key) > MAX_DEPTH:  # 트라이보다 긴 검색어는 전체 키로 다시 확인
+                movie_ids = [i for i in movie_ids if any(k.startswith(key) for k in self._keys.get(i, ()))]
+            return [self._movies[movie_id] for movie_id in movie_ids[:limit]]
+
+
+title_trie = TitleTrie()
+
+
+# ---------------- 색인 채우기 ----------------
+_seed_started = False
+_seed_lock = threading.Lock()
+
+
+def _seed() -> None:
+    try:
+        title_trie.add(get_trending_movies() + fetch_popular_movies())
+    except Exception as e:
+        print(f"검색 색인 준비 오류: {e}")
+
+
+def start_seeding() -> None:
+    """📌 프로세스당 한 번, 트렌딩·인기 영화 제목으로 색인을 채웁니다 (백그라운드)."""
+    global _seed_started
+    with _seed_lock:
+        if _seed_started:
+            return
+        _seed_started = True
+    threading.Thread(target=_seed, name="moviemind-search-seed", daemon=True).start()
+
+
+# ---------------- 입력 중 검색 ----------------
+async def _debounced_search(query: str) -> List[Movie]:
+    """📌 잠시 기다렸다가 TMDb 검색 (그 사이 새 입력으로 취소되면 요청을 보내지 않음)"""
+    await asyncio.sleep(DEBOUNCE_SECONDS)
+    results = await async_search_movie(query)
+    title_trie.add(results)  # 기다리던 화면이 포기했더라도 다음 입력부터는 로컬에서 찾음
+    return results
+
+
+class IncrementalSearch:
+    """📌 세션별 입력 중 검색: 로컬 트라이를 먼저 쓰고, 후보가 적을 때만 TMDb 검색을 보냅니다.
+
+    새 검색어가 들어오면 아직 끝나지 않은 이전 검색어의 TMDb 요청은 취소합니다.
+    """
+
+    def __init__(self, trie: TitleTrie = title_trie):
+        self.trie = trie
+        self._query: Optional[str] = None
+        self._future: Optional[Future] = None
+
+    def cancel(self) -> None:
+        if self._future is not None and not self._future.done():
+            self._future.cancel()
+        self._query, self._future = None, None
+
+    def _remote(self, query: str) -> Future:
+        if self._query != query or self._future is None or self._future.cancelled():
+            self.cancel()
+            self._query = query
+            self._future = asyncio.run_coroutine_threadsafe(_debounced_search(query), get_loop())
+        return self._future
+
+    def lookup(self, query: str, limit: int = NODE_TOP) -> List[Movie]:
+        start_seeding()
+        local = self.trie.suggest(query, limit)
+        if len(local) >= MIN_LOCAL_RESULTS or len(normalize_title(query)) < MIN_API_CHARS:
+            self.cancel()
+            return local
+        try:
+            remote = self._remote(query).result(API_WAIT)
+        except (FutureTimeout, CancelledError):
+            return local  # 응답이 늦으면 로컬 후보만 먼저 표시 (결과는 도착하는 대로 색인에 추가됨)
+        except Exception as e:
+            print(f"입력 중 검색 오류: {e}")
+            return local
+        seen = {movie.id for movie in local}
+        return (local + [movie for movie in remote if movie.id not in seen])[:limit]
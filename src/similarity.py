@@ -0,0 +1,276 @@
+import argparse
+import json
+import os
+import shutil
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.catalog import CATALOG_PATH, get_movies, iter_movies
+from src.recommender import GENRE_IDS, KEYWORD_BUCKETS, feature_bucket, keyword_column
+
+# ---------------- 유사 영화 색인 설정 ----------------
+INDEX_DIR = os.environ.get("MOVIEMIND_SIMILARITY_DIR", os.path.join("data", "similarity"))
+TOP_K = 100            # 영화마다 저장하는 이웃 수
+BLOCK_SIZE = 1024      # 한 번에 곱하는 행 수 (점수 행렬 메모리 = BLOCK_SIZE × 영화 수)
+PAGE_SIZE = 20         # TMDb /similar 응답과 같은 페이지 크기
+CAST_BUCKETS = 64
+KEEP_VERSIONS = 2      # 읽는 중인 프로세스를 위해 남겨 둘 이전 버전 수
+
+# 특성 묶음별 가중치 (정규화 전)
+GENRE_WEIGHT = 1.0
+KEYWORD_WEIGHT = 1.5
+CAST_WEIGHT = 1.0
+
+# 장르·키워드 열은 추천 엔진(src.recommender)과 같은 배치이고, 그 뒤에 출연진 열을 붙입니다.
+_GENRE_COLUMN = {genre_id: i for i, genre_id in enumerate(GENRE_IDS)}
+_CAST_OFFSET = len(GENRE_IDS) + KEYWORD_BUCKETS
+N_FEATURES = _CAST_OFFSET + CAST_BUCKETS
+
+
+def build_features(movies: List[Dict]) -> np.ndarray:
+    """📌 장르/키워드/출연진 특성 벡터를 만들고 행 단위로 L2 정규화합니다."""
+    features = np.zeros((len(movies), N_FEATURES), dtype=np.float32)
+    for row, movie in enumerate(movies):
+        for genre_id in movie.get("genre_ids", []):
+            col = _GENRE_COLUMN.get(genre_id)
+            if col is not None:
+                features[row, col] = GENRE_WEIGHT
+        for keyword_id in movie.get("keyword_ids", []):
+            features[row, keyword_column(keyword_id)] = KEYWORD_WEIGHT
+        for person_id in movie.get("cast_ids", []):
+            features[row, _CAST_OFFSET + feature_bucket(person_id, CAST_BUCKETS)] = CAST_WEIGHT
+    norms = np.linalg.norm(features, axis=1, keepdims=True)
+    np.divide(features, norms, out=features, where=norms > 0)
+    return features
+
+
+def _select_top_k(scores: np.ndarray, candidate_ids: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """📌 블록 점수 행렬의 각 행에서 상위 k개를 점수 내림차순으로 고릅니다 (부족하면 -1로 채움)."""
+    rows, cols = scores.shape
+    out_ids = np.full((rows, k), -1, dtype=np.int32)
+    out_scores = np.zeros((rows, k), dtype=np.float16)
+    kk = min(k, cols)
+    if kk == 0:
+        return out_ids, out_scores
+    top = np.argpartition(-scores, kk - 1, axis=1)[:, :kk]
+    top_scores = np.take_along_axis(scores, top, axis=1)
+    order = np.argsort(-top_scores, axis=1, kind="stable")
+    top = np.take_along_axis(top, order, axis=1)
+    top_scores = np.take_along_axis(top_scores, order, axis=1)
+    valid = np.isfinite(top_scores) & (top_scores > 0)
+    out_ids[:, :kk] = np.where(valid, candidate_ids[top], -1)
+    out_scores[:, :kk] = np.where(valid, top_scores, 0)
+    return out_ids, out_scores
+
+
+# ---------------- 색인 파일 관리 ----------------
+def _current_path(index_dir: str) -> str:
+    return os.path.join(index_dir, "CURRENT")
+
+
+def _current_version_dir(index_dir: str) -> Optional[str]:
+    try:
+        with open(_current_path(index_dir), encoding="utf-8") as f:
+            version = f.read().strip()
+    except FileNotFoundError:
+        return None
+    path = os.path.join(index_dir, version)
+    return path if os.path.isdir(path) else None
+
+
+def _new_version_dir(index_dir: str) -> Tuple[str, str]:
+    version = f"v{time.time_ns()}"
+    path = os.path.join(index_dir, version)
+    os.makedirs(path)
+    return version, path
+
+
+def _publish(index_dir: str, version: str) -> None:
+    """📌 CURRENT 포인터를 원자적으로 교체하고 오래된 버전을 정리합니다."""
+    tmp = _current_path(index_dir) + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(version)
+    os.replace(tmp, _current_path(index_dir))
+    versions = sorted(d for d in os.listdir(index_dir) if d.startswith("v") and d != version)
+    for old in versions[:-KEEP_VERSIONS] if KEEP_VERSIONS else versions:
+        shutil.rmtree(os.path.join(index_dir, old), ignore_errors=True)
+
+
+def _open_output(path: str, n: int, k: int):
+    ids = np.lib.format.open_memmap(os.path.join(path, "neighbors.npy"), mode="w+", dtype=np.int32, shape=(n, k))
+    scores = np.lib.format.open_memmap(os.path.join(path, "scores.npy"), mode="w+", dtype=np.float16, shape=(n, k))
+    return ids, scores
+
+
+# ---------------- 색인 생성 ----------------
+def build_index(k: int = TOP_K, catalog_path: str = CATALOG_PATH, index_dir: str = INDEX_DIR) -> int:
+    """📌 카탈로그 전체에 대해 코사인 유사도 상위 k 이웃 표를 블록 단위 행렬곱으로 만듭니다."""
+    movies = list(iter_movies(catalog_path))
+    movie_ids = np.array([m["id"] for m in movies], dtype=np.int32)
+    features = build_features(movies)
+    n = len(movies)
+
+    os.makedirs(index_dir, exist_ok=True)
+    version, path = _new_version_dir(index_dir)
+    np.save(os.path.join(path, "ids.npy"), movie_ids)
+    out_ids, out_scores = _open_output(path, n, k)
+    for start in range(0, n, BLOCK_SIZE):
+        end = min(start + BLOCK_SIZE, n)
+        scores = features[start:end] @ features.T
+        scores[np.arange(end - start), np.arange(start, end)] = -np.inf  # 자기 자신 제외
+        out_ids[start:end], out_scores[start:end] = _select_top_k(scores, movie_ids, k)
+    out_ids.flush()
+    out_scores.flush()
+    _write_meta(path, n, k)
+    _publish(index_dir, version)
+    similarity_index.invalidate()
+    return n
+
+
+def update_index(catalog_path: str = CATALOG_PATH, index_dir: str = INDEX_DIR) -> int:
+    """📌 새로 적재된 영화만 계산해 기존 색인에 합칩니다. 추가된 영화 수를 반환합니다.
+
+    새 영화는 전체 카탈로그와 비교하고, 기존 영화는 새 영화만 후보로 더해 상위 k를 다시 고릅니다.
+    기존 영화의 장르/키워드/출연진이 바뀐 경우에는 build_index로 전체를 다시 만들어야 합니다.
+    """
+    current = _current_version_dir(index_dir)
+    if current is None:
+        return build_index(catalog_path=catalog_path, index_dir=index_dir)
+
+    old_ids = np.load(os.path.join(current, "ids.npy"))
+    old_neighbors = np.load(os.path.join(current, "neighbors.npy"), mmap_mode="r")
+    old_scores = np.load(os.path.join(current, "scores.npy"), mmap_mode="r")
+    k = old_neighbors.shape[1]
+
+    movies = list(iter_movies(catalog_path))
+    movie_ids = np.array([m["id"] for m in movies], dtype=np.int32)
+    is_new = ~np.isin(movie_ids, old_ids)
+    if not is_new.any():
+        return 0
+    features = build_features(movies)
+    new_rows = np.flatnonzero(is_new)
+    new_ids = movie_ids[new_rows]
+    new_features = features[new_rows]
+    old_row_of = np.searchsorted(old_ids, movie_ids)
+
+    version, path = _new_version_dir(index_dir)
+    np.save(os.path.join(path, "ids.npy"), movie_ids)
+    out_ids, out_scores = _open_output(path, len(movies), k)
+    for start in range(0, len(movies), BLOCK_SIZE):
+        end = min(start + BLOCK_SIZE, len(movies))
+        block_new = is_new[start:end]
+        rows = np.arange(start, end)
+
+        # 새 영화: 전체 카탈로그와 비교
+        if block_new.any():
+            new_block_rows = rows[block_new]
+            scores = features[new_block_rows] @ features.T
+            scores[np.arange(len(new_block_rows)), new_block_rows] = -np.inf
+            out_ids[new_block_rows], out_scores[new_block_rows] = _select_top_k(scores, movie_ids, k)
+
+        # 기존 영화: 저장된 이웃 + 새 영화 후보 중 상위 k
+        if (~block_new).any():
+            old_block_rows = rows[~block_new]
+            prev = old_row_of[old_block_rows]
+            candidate_scores = np.concatenate(
+                [
+                    np.where(old_neighbors[prev] >= 0, old_scores[prev].astype(np.float32), -np.inf),
+                    features[old_block_rows] @ new_features.T,
+                ],
+                axis=1,
+            )
+            candidate_ids = np.concatenate(
+                [old_neighbors[prev], np.broadcast_to(new_ids, (len(old_block_rows), len(new_ids)))], axis=1
+            )
+            top_ids, top_scores = _select_top_k(candidate_scores, np.arange(candidate_ids.shape[1]), k)
+            valid = top_ids >= 0
+            picked = np.take_along_axis(candidate_ids, np.where(valid, top_ids, 0), axis=1)
+            out_ids[old_block_rows] = np.where(valid, picked, -1)
+            out_scores[old_block_rows] = top_scores
+    out_ids.flush()
+    out_scores.flush()
+    _write_meta(path, len(movies), k)
+    _publish(index_dir, version)
+    similarity_index.invalidate()
+    return int(is_new.sum())
+
+
+def _write_meta(path: str, n: int, k: int) -> None:
+    with open(os.path.join(path, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump({"movies": n, "k": k, "built_at": time.time()}, f)
+
+
+# ---------------- 색인 조회 ----------------
+class SimilarityIndex:
+    """📌 메모리 맵으로 연 이웃 표에서 영화별 이웃을 복사 없이 잘라 읽습니다."""
+
+    def __init__(self, index_dir: str = INDEX_DIR):
+        self.index_dir = index_dir
+        self._lock = threading.Lock()
+        self._version: Optional[str] = None
+        self._ids = self._neighbors = self._scores = None
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._version = None
+
+    def _ensure_loaded(self) -> bool:
+        path = _current_version_dir(self.index_dir)
+        if path is None:
+            return False
+        with self._lock:
+            if self._version != path:
+                self._ids = np.load(os.path.join(path, "ids.npy"), mmap_mode="r")
+                self._neighbors = np.load(os.path.join(path, "neighbors.npy"), mmap_mode="r")
+                self._scores = np.load(os.path.join(path, "scores.npy"), mmap_mode="r")
+                self._version = path
+        return True
+
+    def neighbors(self, movie_id: int, page: int = 1, page_size: int = PAGE_SIZE) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """📌 (이웃 ID, 점수) 페이지를 반환합니다. 색인에 없는 영화면 None."""
+        if not self._ensure_loaded():
+            return None
+        ids, neighbors, scores = self._ids, self._neighbors, self._scores
+        row = int(np.searchsorted(ids, movie_id))
+        if row >= len(ids) or ids[row] != movie_id:
+            return None
+        start = (max(page, 1) - 1) * page_size
+        page_ids = neighbors[row, start:start + page_size]
+        valid = int(np.count_nonzero(page_ids >= 0))
+        return page_ids[:valid], scores[row, start:start + valid]
+
+
+similarity_index = SimilarityIndex()
+
+
+def similar_movies(movie_id: int, page: int = 1) -> Optional[List[Dict]]:
+    """📌 유사 영화 목록을 로컬 색인에서 가져옵니다. 색인에 없는 영화면 None."""
+    result = similarity_index.neighbors(int(movie_id), page)
+    if result is None:
+        return None
+    page_ids, _ = result
+    return get_movies(page_ids.tolist())
+
+
+# ---------------- 명령줄 도구 ----------------
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="MovieMind 유사 영화 색인 생성")
+    parser.add_argument("--full", action="store_true", help="기존 색인을 무시하고 전체를 다시 생성")
+    parser.add_argument("--k", type=int, default=TOP_K, help="전체 생성 시 영화마다 저장할 이웃 수")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    if args.full:
+        count = build_index(k=args.k)
+        print(f"유사 영화 색인 생성 완료: {count}편")
+    else:
+        count = update_index()
+        print(f"유사 영화 색인 갱신 완료: {count}편 추가")
+    print(f"소요 시간: {time.perf_counter() - started:.1f}초")
+
+
+if __name__ == "__main__":
+    main()
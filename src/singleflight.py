@@ -0,0 +1,98 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+# ---------------- 동일 요청 합치기 (single-flight) ----------------
+class _Call:
+    __slots__ = ("done", "async_done", "result", "error")
+
+    def __init__(self, async_done: "asyncio.Event" = None):
+        self.done = threading.Event()
+        self.async_done = async_done  # 비동기 호출이 주도할 때만 사용
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """📌 같은 키의 작업이 이미 실행 중이면 새로 실행하지 않고 그 결과를 함께 기다립니다.
+
+    프로세스 전역 객체로 두면 모든 Streamlit 세션(스레드)의 동일 요청이 하나로 합쳐집니다.
+    on_call(key, executed)을 주면 호출마다 실행했는지(True) 합쳐졌는지(False)를 알려 줍니다 (계측용).
+    """
+
+    def __init__(self, on_call: Optional[Callable[[str, bool], None]] = None):
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self._on_call = on_call
+        self.executed = 0   # 실제로 실행된 호출 수
+        self.coalesced = 0  # 실행 중인 호출에 합쳐진 호출 수
+
+    def _join(self, key: str, new_call: Callable[[], _Call]) -> Tuple[_Call, bool]:
+        """📌 진행 중인 호출에 합류하거나 새 호출을 등록하고 (호출, 직접 실행 여부)를 반환합니다."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                call = self._calls[key] = new_call()
+                self.executed += 1
+                leader = True
+        if self._on_call is not None:
+            self._on_call(key, leader)
+        return call, leader
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        call, leader = self._join(key, _Call)
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """📌 do()의 비동기 버전. 동기 호출과 같은 키 공간을 공유합니다."""
+        call, leader = self._join(key, lambda: _Call(asyncio.Event()))
+        if not leader:
+            if call.async_done is not None:
+                await call.async_done.wait()
+            else:
+                # 동기 호출이 실행 중이면 루프를 막지 않도록 스레드에서 기다립니다.
+                await asyncio.to_thread(call.done.wait)
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        # 공유 작업은 별도 태스크에서 실행하고 shield로 기다립니다.
+        # 먼저 호출한 쪽이 취소되어도(예: 입력 중 검색에서 새 입력) 함께 기다리는 호출은 결과를 받습니다.
+        task = asyncio.ensure_future(self._run_async(key, call, fn))
+        return await asyncio.shield(task)
+
+    async def _run_async(self, key: str, call: _Call, fn: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            call.result = await fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+            call.async_done.set()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"executed": self.executed, "coalesced": self.coalesced, "in_flight": len(self._calls)}
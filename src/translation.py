@@ -0,0 +1,168 @@
+import contextvars
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List
+
+from src import http_client, metrics
+
+# ---------------- 번역 설정 ----------------
+TRANSLATE_URL = os.environ.get("MOVIEMIND_TRANSLATE_URL", "https://translate.googleapis.com/translate_a/single")
+CACHE_PATH = os.environ.get("MOVIEMIND_TRANSLATION_DB", os.path.join(".cache", "translations.sqlite3"))
+BATCH_CHAR_LIMIT = 1500        # 한 번의 요청에 담을 최대 글자 수 (GET URL 길이 제한)
+MAX_CONCURRENT_BATCHES = 4     # 동시에 보내는 번역 요청 수
+
+
+# ---------------- 영구 번역 캐시 ----------------
+class TranslationStore:
+    """📌 (원문, 대상 언어) → 번역문을 SQLite에 저장하고 메모리에도 보관합니다."""
+
+    def __init__(self, path: str = CACHE_PATH):
+        self.path = path
+        self._memory: Dict[tuple, str] = {}
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                " text TEXT NOT NULL, target_lang TEXT NOT NULL, translated TEXT NOT NULL,"
+                " PRIMARY KEY (text, target_lang))"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get_many(self, texts: List[str], target_lang: str) -> Dict[str, str]:
+        """📌 캐시에 있는 번역만 반환합니다."""
+        found = {}
+        missing = []
+        with self._lock:
+            for text in texts:
+                key = (text, target_lang)
+                if key in self._memory:
+                    found[text] = self._memory[key]
+                else:
+                    missing.append(text)
+            if missing:
+                try:
+                    conn = self._connect()
+                    for start in range(0, len(missing), 500):
+                        chunk = missing[start:start + 500]
+                        placeholders = ",".join("?" * len(chunk))
+                        rows = conn.execute(
+                            f"SELECT text, translated FROM translations"
+                            f" WHERE target_lang = ? AND text IN ({placeholders})",
+                            [target_lang, *chunk],
+                        ).fetchall()
+                        for text, translated in rows:
+                            self._memory[(text, target_lang)] = translated
+                            found[text] = translated
+                except sqlite3.Error as e:
+                    print(f"번역 캐시 조회 오류: {e}")
+        return found
+
+    def put_many(self, pairs: Dict[str, str], target_lang: str) -> None:
+        if not pairs:
+            return
+        with self._lock:
+            for text, translated in pairs.items():
+                self._memory[(text, target_lang)] = translated
+            try:
+                conn = self._connect()
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO translations (text, target_lang, translated) VALUES (?, ?, ?)",
+                        [(text, target_lang, translated) for text, translated in pairs.items()],
+                    )
+            except sqlite3.Error as e:
+                print(f"번역 캐시 저장 오류: {e}")
+
+
+translation_store = TranslationStore()
+
+
+# ---------------- 번역 요청 ----------------
+def _request_translation(text: str, target_lang: str) -> str:
+    """📌 Google Translate API를 직접 호출합니다. 실패 시 예외를 그대로 올립니다."""
+    params = {
+        "client": "gtx",
+        "sl": "auto",  # 원본 언어 자동 감지
+        "tl": target_lang,
+        "dt": "t",
+        "q": text,
+    }
+    response = http_client.get(TRANSLATE_URL, params=params)
+    response.raise_for_status()
+    # 문장 단위로 나뉜 조각을 이어 붙이면 줄바꿈이 그대로 유지됩니다.
+    return "".join(segment[0] for segment in response.json()[0] if segment and segment[0])
+
+
+def _translate_batch(texts: List[str], target_lang: str) -> Dict[str, str]:
+    """📌 여러 문자열을 줄바꿈으로 묶어 한 번에 번역합니다.
+
+    줄 수가 맞지 않으면 해당 묶음만 한 건씩 다시 번역합니다.
+    """
+    try:
+        lines = _request_translation("\n".join(texts), target_lang).rstrip("\n").split("\n")
+        if len(lines) == len(texts):
+            return {text: line.strip() or text for text, line in zip(texts, lines)}
+        if len(texts) > 1:
+            results = {}
+            for text in texts:
+                results.update(_translate_batch([text], target_lang))
+            return results
+    except Exception as e:
+        print(f"번역 오류: {e}")
+    return {}
+
+
+def _make_batches(texts: List[str]) -> List[List[str]]:
+    batches, current, size = [], [], 0
+    for text in texts:
+        if current and size + len(text) + 1 > BATCH_CHAR_LIMIT:
+            batches.append(current)
+            current, size = [], 0
+        current.append(text)
+        size += len(text) + 1
+    if current:
+        batches.append(current)
+    return batches
+
+
+def translate_many(texts: Iterable[str], target_lang: str = "ko", cached_only: bool = False) -> List[str]:
+    """📌 여러 문자열을 번역합니다. 중복 제거 → 캐시 조회 → 남은 것만 묶음 번역.
+
+    번역에 실패한 문자열은 원문을 그대로 반환하며 캐시에 저장하지 않습니다.
+    cached_only=True면 캐시에 없는 문자열을 번역 요청 없이 원문 그대로 반환합니다.
+    """
+    texts = list(texts)
+    unique = list(dict.fromkeys(" ".join(t.split()) for t in texts if t and t.strip()))
+    translated = translation_store.get_many(unique, target_lang)
+
+    missing = [text for text in unique if text not in translated]
+    if translated:
+        metrics.record_cache(TRANSLATE_URL, "hit", len(translated))
+    if missing and not cached_only:
+        metrics.record_cache(TRANSLATE_URL, "miss", len(missing))
+        batches = _make_batches(missing)
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_BATCHES, len(batches))) as pool:
+            # 작업 스레드에서도 같은 페이지/섹션으로 계측되도록 컨텍스트를 복사해 실행합니다.
+            context = contextvars.copy_context()
+            translate = lambda batch: context.copy().run(_translate_batch, batch, target_lang)
+            for result in pool.map(translate, batches):
+                translation_store.put_many(result, target_lang)
+                translated.update(result)
+
+    return [translated.get(" ".join(t.split()), t) if t else t for t in texts]
+
+
+def translate_text(text: str, target_lang: str = "ko") -> str:
+    """📌 텍스트 하나를 번역합니다 (번역 실패 시 원본 반환)."""
+    return translate_many([text], target_lang)[0]
@@ -1,7 +1,29 @@
 import streamlit as st
 from src.movie_recommend import get_trending_movies, get_personalized_recommendations
 from src.data_fetcher import search_movie, fetch_movies_by_genre
-from src.auth import load_user_preferences
+from src.auth import load_user_preferences, show_history_buttons
+from src.posters import load_posters, prefetch_posters
+from src.search_trie import IncrementalSearch, title_trie
+
+try:
+    from st_keyup import st_keyup  # streamlit-keyup (requirements.txt): 입력할 때마다 값을 전달
+except ImportError:  # 설치되지 않은 환경에서는 기본 입력창 (Enter를 누르거나 포커스를 옮길 때 갱신)
+    st_keyup = None
+
+RESULT_LIMIT = 5      # 한 번에 표시할 검색/추천 결과 수
+POSTER_WIDTH = 150    # 결과 목록 포스터 표시 너비(px)
+KEYUP_DEBOUNCE_MS = 150  # 브라우저에서 입력을 모아 보내는 간격(ms)
+
+
+def show_movie_list(movies):
+    """📌 결과 목록을 포스터와 함께 표시하고, 다음 결과의 포스터를 미리 받아 둡니다."""
+    shown = movies[:RESULT_LIMIT]
+    posters = load_posters([movie.get("poster_path") for movie in shown], POSTER_WIDTH)
+    prefetch_posters([movie.get("poster_path") for movie in movies[RESULT_LIMIT:RESULT_LIMIT * 2]], POSTER_WIDTH)
+    for movie in shown:
+        st.write(f"🎥 {movie['title']} ({movie.get('release_date', 'Unknown')[:4]})")
+        st.image(posters[movie.get("poster_path")], width=POSTER_WIDTH)
+        show_history_buttons(movie["id"], f"list_{movie['id']}")
 
 # ---------------- 영화 스타일 설정 ----------------
 def show_profile_setup():
@@ -22,19 +44,31 @@ def show_profile_setup():
         st.success("선호 장르가 저장되었습니다!")
 
 # ---------------- 영화 검색 ----------------
+def _search_input(label):
+    if st_keyup is not None:
+        return st_keyup(label, debounce=KEYUP_DEBOUNCE_MS, key="search_query")
+    return st.text_input(label, key="search_query")
+
 def show_movie_search():
-    """ 영화 검색 기능 """
+    """ 영화 검색 기능 (입력하는 동안 제목 색인에서 바로 찾고, "검색"을 누르면 전체 검색) """
     st.title("🔍 영화 검색")
-    search_query = st.text_input("영화 제목을 입력하세요")
+    search_query = _search_input("영화 제목을 입력하세요")
     
     if st.button("검색") and search_query:
         results = search_movie(search_query)
+        title_trie.add(results)
         if results:
-            for movie in results[:5]:
-                st.write(f"🎥 {movie['title']} ({movie.get('release_date', 'Unknown')[:4]})")
-                st.image(f"https://image.tmdb.org/t/p/w500{movie.get('poster_path', '')}", width=150)
+            show_movie_list(results)
         else:
             st.warning("검색된 영화가 없습니다.")
+    elif search_query:
+        if "incremental_search" not in st.session_state:
+            st.session_state["incremental_search"] = IncrementalSearch()
+        results = st.session_state["incremental_search"].lookup(search_query)
+        if results:
+            show_movie_list(results)
+        else:
+            st.info("일치하는 영화가 없습니다. \"검색\"을 눌러 전체 검색을 해보세요.")
 
 # ---------------- 즐겨찾기 ----------------
 def show_favorite_movies():
@@ -46,15 +80,50 @@ def show_favorite_movies():
 def show_generated_recommendations():
     """ 맞춤 추천 영화 생성 """
     st.title("🎞️ 맞춤 영화 추천")
-    user_profile = st.session_state.get("user_profile", load_user_preferences())
+    user_profile = load_user_preferences()
     
     if user_profile:
         movies = get_personalized_recommendations(user_profile)
         if movies:
-            for movie in movies[:5]:
-                st.write(f"🎥 {movie['title']} ({movie.get('release_date', 'Unknown')[:4]})")
-                st.image(f"https://image.tmdb.org/t/p/w500{movie.get('poster_path', '')}", width=150)
+            show_movie_list(movies)
         else:
             st.warning("추천할 영화가 없습니다.")
     else:
-        st.warning("사용자 프로필이 설정되지 않았습니다. 영화 스타일을 먼저 설정해주세요.")
\ No newline at end of file
+        st.warning("사용자 프로필이 설정되지 않았습니다. 영화 스타일을 먼저 설정해주세요.")
+    show_people_recommendations()
+
+# ---------------- 배우·감독 기반 추천 ----------------
+def _next_people_page():
+    st.session_state["people_pages"] += 1
+
+def show_people_recommendations():
+    """ 좋아하는 배우·감독 여러 명이 참여한 영화 추천 ("더 보기"를 누를 때마다 한 페이지씩 표시) """
+    # 이름 조회와 NumPy 순위 계산 모듈은 이 기능을 처음 쓸 때 불러옵니다.
+    from src.person_recs import MAX_PEOPLE, parse_names, recommend_by_people
+
+    st.subheader("👥 좋아하는 배우·감독으로 추천")
+    text = st.text_area(f"배우·감독 이름 (쉼표나 줄바꿈으로 구분, 최대 {MAX_PEOPLE}명)", key="people_query")
+    if st.button("인물로 추천") and text.strip():
+        with st.spinner("필모그래피를 모으는 중..."):
+            st.session_state["people_recs"] = recommend_by_people(parse_names(text))
+        st.session_state["people_pages"] = 1
+
+    result = st.session_state.get("people_recs")
+    if result is None:
+        return
+    if result.missing:
+        st.info(f"찾지 못한 이름: {', '.join(result.missing)}")
+    if not len(result):
+        st.warning("추천할 영화가 없습니다.")
+        return
+
+    pages = st.session_state["people_pages"]
+    shown = [movie for number in range(pages) for movie in result.page(number)]
+    credited = result.credited(shown)
+    posters = load_posters([movie.get("poster_path") for movie in shown], POSTER_WIDTH)
+    prefetch_posters([movie.get("poster_path") for movie in result.page(pages)], POSTER_WIDTH)
+    for movie in shown:
+        st.write(f"🎥 {movie['title']} ({movie.get('release_date', 'Unknown')[:4]}) · 👥 {', '.join(credited[movie.id])}")
+        st.image(posters[movie.get("poster_path")], width=POSTER_WIDTH)
+    if pages < result.page_count:
+        st.button("더 보기", on_click=_next_people_page)
\ No newline at end of file
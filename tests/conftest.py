@@ -0,0 +1,7 @@
+import os
+import sys
+
+# src 모듈을 "from src.x import y"로 불러오도록 저장소 루트를 경로에 추가합니다.
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
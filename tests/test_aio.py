@@ -0,0 +1,34 @@
+import asyncio
+import contextvars
+from concurrent.futures import Future
+
+from src import aio, data_fetcher, metrics
+
+page = contextvars.ContextVar("page", default=None)
+
+
+def test_submit_uses_context_captured_at_submit_time():
+    gate = Future()
+
+    async def read_later():
+        await asyncio.wrap_future(gate)
+        return page.get()
+
+    token = page.set("홈")
+    future = aio.submit(read_later())
+    page.reset(token)  # 코루틴이 실행되기 전에 호출한 쪽의 값이 바뀜
+    gate.set_result(None)
+    assert future.result(2) == "홈"
+
+
+def test_prefetch_movies_is_attributed_to_calling_section(monkeypatch):
+    seen = Future()
+
+    async def hydrate(movie_ids):
+        seen.set_result((movie_ids, metrics._current_section.get()))
+        return {}
+
+    monkeypatch.setattr(data_fetcher, "async_hydrate_movies", hydrate)
+    with metrics.section_scope("🎬 카드 상세 정보"):
+        data_fetcher.prefetch_movies([1, None, 2])
+    assert seen.result(2) == ([1, 2], "🎬 카드 상세 정보")
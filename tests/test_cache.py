@@ -0,0 +1,90 @@
+import asyncio
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from src import cache, cache_backend
+from src.aio import run_sync
+from src.cache_backend import MemoryBackend
+from src.singleflight import SingleFlight
+
+URL = "https://api.test/3/search/movie"   # 스냅숏 대상이 아닌 엔드포인트
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, data):
+        self._data = data
+        self.content = b"x" * 16
+
+    def json(self):
+        return self._data
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """📌 async_get을 대신하는 가짜 업스트림 (호출 수를 세고 gate가 열릴 때까지 응답을 미룸)"""
+    state = {"calls": 0, "gate": None}
+
+    async def async_get(url, params=None):
+        state["calls"] += 1
+        if state["gate"] is not None:
+            await asyncio.wrap_future(state["gate"])
+        return FakeResponse({"value": "new", "query": (params or {}).get("query")})
+
+    monkeypatch.setattr(cache.http_client, "async_get", async_get)
+    monkeypatch.setattr(cache, "response_cache", MemoryBackend())
+    monkeypatch.setattr(cache, "request_flight", SingleFlight())
+    return state
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "시간 안에 조건을 만족하지 않음"
+        time.sleep(0.01)
+
+
+def test_cache_key_ignores_api_key_and_param_order():
+    a = cache.make_cache_key(URL, {"query": "기생충", "api_key": "secret", "page": 1})
+    b = cache.make_cache_key(URL + "?page=1", {"api_key": "other", "query": " 기생충 "})
+    assert a == b
+    assert "secret" not in a
+
+
+def test_miss_then_hit(upstream):
+    params = {"query": "괴물"}
+    assert run_sync(cache.async_cached_get(URL, params)) == {"value": "new", "query": "괴물"}
+    assert run_sync(cache.async_cached_get(URL, params)) == {"value": "new", "query": "괴물"}
+    assert upstream["calls"] == 1
+
+
+def test_stale_value_is_served_and_revalidated_once(upstream, monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cache_backend, "time", clock)
+    key = cache.make_cache_key(URL, {"query": "괴물"})
+    cache.response_cache.set(key, {"value": "old"}, 16, ttl=60)
+    clock.now += 61  # TTL이 지나 stale 구간
+
+    gate = upstream["gate"] = Future()
+    results = [run_sync(cache.async_cached_get(URL, {"query": "괴물"})) for _ in range(5)]
+    assert results == [{"value": "old"}] * 5
+
+    gate.set_result(None)
+    _wait_for(lambda: cache.request_flight.stats()["in_flight"] == 0)
+    assert cache.response_cache.get(key) == ({"value": "new", "query": "괴물"}, False)
+    assert upstream["calls"] == 1    # stale 조회 다섯 번이 갱신 요청 하나로 합쳐짐
+    assert cache.request_flight.stats() == {"executed": 1, "coalesced": 4, "in_flight": 0}
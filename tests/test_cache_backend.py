@@ -0,0 +1,164 @@
+import asyncio
+import threading
+
+import pytest
+
+from bench import fake_redis
+from src import cache, cache_backend
+from src.cache_backend import MemoryBackend, RedisBackend, SqliteBackend
+
+
+class FakeClock:
+    """📌 time 모듈 대신 쓰는 시계 (monotonic/time 모두 같은 값을 돌려주고 advance()로만 움직임)"""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache_backend, "time", fake)
+    return fake
+
+
+@pytest.fixture(scope="module")
+def redis_url():
+    # 로컬 RESP 서버(bench.fake_redis)를 Redis 대신 사용
+    server = fake_redis.serve(0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"redis://127.0.0.1:{server.server_address[1]}/0"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def backend(request, tmp_path, clock):
+    if request.param == "memory":
+        return MemoryBackend(max_bytes=1024 * 1024)
+    if request.param == "sqlite":
+        return SqliteBackend(str(tmp_path / "responses.sqlite3"), max_bytes=1024 * 1024)
+    backend = RedisBackend(request.getfixturevalue("redis_url"))
+    backend.clear()
+    return backend
+
+
+def test_fresh_then_stale_then_expired(backend, clock):
+    backend.set("key", {"value": 1}, 16, ttl=10)
+    assert backend.get("key") == ({"value": 1}, False)
+
+    clock.advance(10)  # TTL이 지나면 TTL * STALE_FACTOR 동안은 stale 값
+    assert backend.get("key") == ({"value": 1}, True)
+
+    clock.advance(10 * cache_backend.STALE_FACTOR)
+    assert backend.get("key") == (None, False)
+    assert backend.stats()["hits"] == 1
+    assert backend.stats()["stale_hits"] == 1
+    assert backend.stats()["misses"] == 1
+
+
+def test_set_replaces_value_and_resets_ttl(backend, clock):
+    backend.set("key", "old", 8, ttl=10)
+    clock.advance(15)
+    backend.set("key", "new", 8, ttl=10)
+    assert backend.get("key") == ("new", False)
+
+
+def test_delete_and_clear(backend):
+    backend.set("a", 1, 8, ttl=10)
+    backend.set("b", 2, 8, ttl=10)
+    backend.delete("a")
+    assert backend.get("a") == (None, False)
+    assert backend.get("b") == (2, False)
+    backend.clear()
+    assert backend.get("b") == (None, False)
+    assert backend.stats().get("entries", 0) == 0  # redis는 항목 수를 세지 않음
+
+
+def test_invalidate_drops_entry_for_url_and_params(backend, monkeypatch):
+    monkeypatch.setattr(cache, "response_cache", backend)
+    url = "https://api.test/3/movie/550"
+    key = cache.make_cache_key(url, {"language": "ko-KR", "api_key": "a"})
+    backend.set(key, {"id": 550}, 16, ttl=60)
+    backend.set(cache.make_cache_key(url, {"language": "en-US"}), {"id": 550}, 16, ttl=60)
+
+    cache.invalidate(url, {"api_key": "b", "language": "ko-KR"})  # API 키는 캐시 키에 포함되지 않음
+    assert backend.get(key) == (None, False)
+    assert backend.get(cache.make_cache_key(url, {"language": "en-US"})) == ({"id": 550}, False)
+
+
+def test_async_methods_match_sync(backend):
+    async def roundtrip():
+        await backend.aset("key", [1, 2, 3], 24, 10)
+        return await backend.aget("key")
+
+    assert asyncio.run(roundtrip()) == ([1, 2, 3], False)
+
+
+def test_memory_evicts_least_recently_used(clock):
+    backend = MemoryBackend(max_bytes=300)
+    backend.set("a", "a", 100, ttl=60)
+    backend.set("b", "b", 100, ttl=60)
+    backend.set("c", "c", 100, ttl=60)
+    backend.get("a")  # a를 최근 사용으로 올림 → 다음 제거 대상은 b
+    backend.set("d", "d", 100, ttl=60)
+
+    assert backend.get("b") == (None, False)
+    assert [backend.get(key)[0] for key in "acd"] == ["a", "c", "d"]
+    assert backend.stats()["bytes"] == 300
+
+
+def test_memory_skips_values_larger_than_limit(clock):
+    backend = MemoryBackend(max_bytes=100)
+    backend.set("big", "x", 101, ttl=60)
+    assert backend.get("big") == (None, False)
+
+
+def test_sqlite_evicts_least_recently_used(tmp_path, clock):
+    backend = SqliteBackend(str(tmp_path / "responses.sqlite3"), max_bytes=250)
+    value = "x" * 100
+    backend.set("a", value, 0, ttl=3600)
+    clock.advance(1)
+    backend.set("b", value, 0, ttl=3600)
+    clock.advance(cache_backend.TOUCH_INTERVAL)
+    backend.get("a")  # 마지막 사용 시각 갱신 → 다음 제거 대상은 b
+    backend.set("c", value, 0, ttl=3600)
+
+    backend._evict(backend._connect(), clock.now)  # 정리는 64번 쓸 때마다 한 번이므로 직접 실행
+    assert backend.get("b") == (None, False)
+    assert backend.get("a")[0] == value
+    assert backend.get("c")[0] == value
+
+
+def test_sqlite_entries_survive_reopen(tmp_path, clock):
+    path = str(tmp_path / "responses.sqlite3")
+    SqliteBackend(path).set("key", {"shared": True}, 0, ttl=60)
+    assert SqliteBackend(path).get("key") == ({"shared": True}, False)
+
+
+@pytest.mark.parametrize("value, compressed", [
+    ({"title": "기생충", "ids": [1, 2, 3]}, b"-"),
+    ({"results": [{"id": i, "title": f"영화 {i}"} for i in range(200)]}, b"z"),
+])
+def test_encode_roundtrip_uses_msgpack_and_compresses_large_values(value, compressed):
+    data = cache_backend.encode(value)
+    assert data[:1] == (b"m" if cache_backend.msgpack is not None else b"j")
+    assert data[1:2] == compressed
+    assert cache_backend.decode(data) == value
+
+
+def test_decode_reads_json_values_written_without_msgpack(monkeypatch):
+    monkeypatch.setattr(cache_backend, "msgpack", None)
+    data = cache_backend.encode({"title": "괴물"})
+    monkeypatch.undo()
+    assert data[:1] == b"j"
+    assert cache_backend.decode(data) == {"title": "괴물"}
@@ -0,0 +1,47 @@
+import json
+import os
+import subprocess
+import sys
+
+from src.catalog import TitleIndex, ingest_records, normalize_title
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _ingest_in_other_process(path, records):
+    # 다른 워커 프로세스에서 적재한 것처럼 별도 인터프리터로 적재
+    script = "import json, sys; from src.catalog import ingest_records; ingest_records(json.load(sys.stdin), sys.argv[1])"
+    subprocess.run([sys.executable, "-c", script, path], input=json.dumps(records), text=True,
+                   cwd=REPO_ROOT, check=True)
+
+
+def test_normalize_title():
+    assert normalize_title("스파이더맨: 노 웨이 홈") == "스파이더맨노웨이홈"
+    assert normalize_title("The Matrix!") == "thematrix"
+
+
+def test_search_matches_korean_and_original_titles_by_popularity(tmp_path):
+    path = str(tmp_path / "catalog.sqlite3")
+    ingest_records([
+        {"id": 1, "title": "기생충", "original_title": "Parasite", "popularity": 10},
+        {"id": 2, "title": "괴물", "original_title": "The Host", "popularity": 30},
+        {"id": 3, "title": "살인의 추억", "original_title": "Memories of Murder", "popularity": 20},
+    ], path)
+    index = TitleIndex(path)
+
+    assert [movie.id for movie in index.search("기생")] == [1]
+    assert [movie.id for movie in index.search("parasite")] == [1]
+    assert [movie.id for movie in index.search("the")] == [2]
+    assert [movie.id for movie in index.search("e")] == [2, 3, 1]
+
+
+def test_index_rebuilds_when_catalog_changes_in_another_process(tmp_path):
+    path = str(tmp_path / "catalog.sqlite3")
+    ingest_records([{"id": 1, "title": "기생충", "original_title": "Parasite"}], path)
+    index = TitleIndex(path)
+    assert len(index) == 1
+    assert index.search("올드보이") == []
+
+    _ingest_in_other_process(path, [{"id": 2, "title": "올드보이", "original_title": "Oldboy"}])
+    assert len(index) == 2
+    assert [movie.id for movie in index.search("올드보이")] == [2]
@@ -0,0 +1,97 @@
+import time
+
+import pytest
+
+from src import config, context_recs, resilience
+from src.aio import run_sync
+from src.cache import make_cache_key
+from src.context_recs import TRENDING, ContextRecommendations
+from src.models import to_movies
+from src.resilience import SnapshotStore
+
+
+@pytest.fixture(autouse=True)
+def snapshots(monkeypatch, tmp_path):
+    monkeypatch.setattr(config, "tmdb_api_key", lambda: "test-key")
+    store = SnapshotStore(str(tmp_path))
+    monkeypatch.setattr(resilience, "snapshots", store)
+    return store
+
+
+def _loader(responses):
+    async def load(bucket):
+        return responses.get(bucket)
+    return load
+
+
+def test_failed_refresh_is_not_marked_ready(monkeypatch):
+    monkeypatch.setattr(context_recs, "_load_bucket", _loader({}))
+    recs = ContextRecommendations()
+
+    assert recs.refresh() is False
+    assert not recs._ready.is_set()
+    assert recs.refreshed_at == 0.0
+    assert recs.lookup(TRENDING) == []  # 스냅숏도 없으므로 빈 목록
+
+
+def test_refresh_succeeds_once_any_bucket_loads(monkeypatch):
+    movies = to_movies([{"id": 1, "title": "기생충"}])
+    monkeypatch.setattr(context_recs, "_load_bucket", _loader({}))
+    recs = ContextRecommendations()
+    recs.refresh()
+
+    monkeypatch.setattr(context_recs, "_load_bucket", _loader({TRENDING: movies}))
+    assert recs.refresh() is True
+    assert recs._ready.is_set()
+    assert recs.refreshed_at > 0
+    assert recs.lookup(TRENDING) == movies
+
+
+def test_failed_buckets_keep_previous_lists(monkeypatch):
+    old, new = to_movies([{"id": 1}]), to_movies([{"id": 2}])
+    monkeypatch.setattr(context_recs, "_load_bucket", _loader({TRENDING: old, "18": old}))
+    recs = ContextRecommendations()
+    recs.refresh()
+
+    monkeypatch.setattr(context_recs, "_load_bucket", _loader({TRENDING: new}))
+    recs.refresh()
+    assert recs.lookup(TRENDING) == new
+    assert recs.lookup("18") == old
+
+
+def test_new_city_is_queued_for_the_scheduler(monkeypatch):
+    fetched = []
+
+    async def fetch_weather(city):
+        fetched.append(city)
+        return "rain"
+
+    monkeypatch.setattr(context_recs, "_fetch_weather", fetch_weather)
+    recs = ContextRecommendations()
+    monkeypatch.setattr(recs, "start", lambda: None)
+
+    assert recs.weather_condition("Seoul") is None  # 렌더링 중에는 조회하지 않음
+    assert fetched == []
+    assert recs._wake.is_set()
+
+    now = time.monotonic()
+    assert recs._due_cities(now) == ["Seoul"]
+    run_sync(recs._refresh_weather(recs._due_cities(now)))  # 스케줄러 한 번
+    assert fetched == ["Seoul"]
+    assert recs.weather_condition("Seoul") == "rain"
+    assert recs._due_cities(now) == []
+
+
+def test_lookup_before_first_refresh_serves_snapshot_without_waiting(monkeypatch, snapshots):
+    started = []
+    recs = ContextRecommendations()
+    monkeypatch.setattr(recs, "start", lambda: started.append(True))
+    snapshots.put(make_cache_key(*context_recs._bucket_request(TRENDING)), {"results": [{"id": 1, "title": "기생충"}]})
+
+    assert recs.lookup(TRENDING) == to_movies([{"id": 1, "title": "기생충"}])
+    assert recs.lookup("18") == []  # 스냅숏이 없는 버킷
+    assert started  # 스케줄러는 시작만 하고 기다리지 않음
+
+    monkeypatch.setattr(context_recs, "_load_bucket", _loader({TRENDING: to_movies([{"id": 2}])}))
+    recs.refresh()
+    assert recs.lookup(TRENDING) == to_movies([{"id": 2}])
@@ -0,0 +1,27 @@
+import os
+import subprocess
+import sys
+
+from src import http_client
+from src.config import BASE_URL
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_timeouts_follow_tmdb_paths():
+    assert http_client.timeout_for(f"{BASE_URL}/search/movie") == (3.05, 5)
+    assert http_client.timeout_for(f"{BASE_URL}/movie/550") == (3.05, 10)
+    assert http_client.timeout_for("https://example.test/") == http_client.DEFAULT_TIMEOUT
+
+
+def test_tmdb_rules_use_configured_base_url():
+    # config.BASE_URL은 모듈을 불러올 때 정해지므로 새 프로세스에서 확인
+    script = (
+        "from src import http_client\n"
+        "print(http_client.timeout_for('http://127.0.0.1:8799/3/search/movie'))\n"
+        "print(sorted(http_client.RATE_LIMITS))\n"
+    )
+    env = dict(os.environ, MOVIEMIND_TMDB_BASE_URL="http://127.0.0.1:8799/3", PYTHONPATH=ROOT)
+    output = subprocess.run([sys.executable, "-c", script], env=env, cwd=ROOT,
+                            capture_output=True, text=True, check=True).stdout.splitlines()
+    assert output == ["(3.05, 5)", "['127.0.0.1:8799']"]
@@ -0,0 +1,23 @@
+from src.metrics import MetricsRegistry, endpoint_label
+
+
+def test_endpoint_label_replaces_ids_and_files():
+    assert endpoint_label("https://api.themoviedb.org/3/movie/550/credits?language=ko-KR") == \
+        "api.themoviedb.org/3/movie/{id}/credits"
+    assert endpoint_label("https://image.tmdb.org/t/p/w500/abc.jpg") == "image.tmdb.org/t/p/w500/{file}"
+
+
+def test_coalesced_calls_are_exported():
+    registry = MetricsRegistry()
+    url = "https://api.themoviedb.org/3/movie/550?language=ko-KR"
+    registry.record_cache(url, "miss", count=3)
+    registry.record_flight(url, executed=True)
+    registry.record_flight(url, executed=False)
+    registry.record_flight(url, executed=False)
+
+    row, = registry.snapshot()
+    assert row["coalesced"] == 2
+    assert row["cache_hit_rate"] == 0.0
+    text = registry.render_prometheus()
+    assert 'moviemind_singleflight_calls_total{endpoint="api.themoviedb.org/3/movie/{id}",result="coalesced"} 2' in text
+    assert 'moviemind_singleflight_calls_total{endpoint="api.themoviedb.org/3/movie/{id}",result="executed"} 1' in text
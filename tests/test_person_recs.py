@@ -0,0 +1,56 @@
+from src.models import MovieBatch
+from src.person_recs import PeopleRecommendations, parse_names, rank_films
+
+# 영화 ID → 인기도 (같은 ID는 모든 필모그래피에서 같은 레코드)
+POPULARITY = {1: 90.0, 2: 5.0, 3: 40.0, 4: 20.0, 5: 0.0}
+
+
+def _films(*movie_ids):
+    return MovieBatch([{"id": movie_id, "title": f"영화 {movie_id}", "popularity": POPULARITY[movie_id]}
+                       for movie_id in movie_ids])
+
+
+def test_shared_films_rank_above_popular_solo_films():
+    movies, scores, shared = rank_films([_films(1, 2, 3), _films(2, 3, 4)], [1.0, 1.0])
+
+    # 2·3은 두 사람 모두 참여 → 인기도와 무관하게 앞, 그 안에서는 인기도 순
+    assert movies.ids.tolist() == [3, 2, 1, 4]
+    assert shared.tolist() == [2, 2, 1, 1]
+    assert list(scores) == sorted(scores, reverse=True)
+
+
+def test_weights_change_the_order():
+    movies, _, shared = rank_films([_films(1, 2, 3), _films(2, 3, 4)], [1.0, 3.0])
+
+    # 가중치 3인 두 번째 인물의 단독 출연작(4)이 첫 번째 인물의 단독 출연작(1)보다 앞
+    assert movies.ids.tolist() == [3, 2, 4, 1]
+    assert shared.tolist() == [2, 2, 1, 1]
+
+
+def test_duplicates_within_one_filmography_count_once_per_listing():
+    movies, _, shared = rank_films([_films(3, 3), _films(1)], [1.0, 1.0])
+    assert movies.ids.tolist() == [3, 1]
+    assert shared.tolist() == [2, 1]
+
+
+def test_empty_and_missing_ids():
+    movies, scores, shared = rank_films([], [])
+    assert len(movies) == 0 and len(scores) == 0 and len(shared) == 0
+
+    movies, _, _ = rank_films([MovieBatch([{"title": "ID 없음"}]), _films(5)], [1.0, 1.0])
+    assert movies.ids.tolist() == [5]
+
+
+def test_pages_and_credited_names():
+    people = [{"id": 10, "name": "봉준호"}, {"id": 20, "name": "송강호"}]
+    recs = PeopleRecommendations(people, ["없는 사람"], [_films(1, 2, 3), _films(2, 3, 4)], [1.0, 1.0])
+
+    assert len(recs) == 4 and recs.page_count == 1
+    assert [movie.id for movie in recs.page(0, page_size=3)] == [3, 2, 1]
+    assert [[movie.id for movie in page] for page in recs.pages(page_size=3)] == [[3, 2, 1], [4]]
+    assert recs.credited(recs.page(0)) == {3: ["봉준호", "송강호"], 2: ["봉준호", "송강호"], 1: ["봉준호"], 4: ["송강호"]}
+
+
+def test_parse_names():
+    assert parse_names("봉준호, 송강호\n최우식,,봉준호") == ["봉준호", "송강호", "최우식"]
+    assert parse_names(",".join(f"배우{i}" for i in range(15))) == [f"배우{i}" for i in range(10)]
@@ -0,0 +1,29 @@
+from src import recommender
+from src.recommender import RecommendationEngine, recommend_for_profile
+
+# 모두 드라마(18)지만 키워드가 두 갈래로 나뉜 카탈로그
+MOVIES = [
+    {"id": movie_id, "title": f"영화 {movie_id}", "genre_ids": [18],
+     "keyword_ids": [100] if movie_id <= 10 else [200], "popularity": 10.0, "vote_average": 7.0}
+    for movie_id in range(1, 21)
+]
+
+
+def _ids(movies):
+    return [movie.id for movie in movies]
+
+
+def test_same_genre_profiles_diverge_by_history(monkeypatch):
+    monkeypatch.setattr(recommender, "get_engine", lambda: RecommendationEngine(MOVIES))
+    first = recommend_for_profile({"preferred_genres": [18], "favorite_movie_ids": [1]}, k=5)
+    second = recommend_for_profile({"preferred_genres": [18], "watched_movie_ids": [11]}, k=5)
+
+    assert set(_ids(first)) <= set(range(2, 11))    # 즐겨찾기한 영화와 같은 키워드, 자기 자신은 제외
+    assert set(_ids(second)) <= set(range(12, 21))
+    assert 1 not in _ids(first) and 11 not in _ids(second)
+
+
+def test_history_outside_catalog_keeps_genre_ranking(monkeypatch):
+    engine = RecommendationEngine(MOVIES)
+    plain = engine.profile_vector([18])
+    assert (engine.profile_vector([18], history_ids=[999]) == plain).all()
@@ -0,0 +1,87 @@
+import pytest
+
+from src import resilience
+from src.resilience import CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(resilience, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker("api.test", failures=3, cooldown=10.0)
+
+
+def _fail(breaker, times):
+    for _ in range(times):
+        assert breaker.allow()
+        breaker.record(False)
+
+
+def test_stays_closed_below_threshold_and_success_resets(breaker):
+    _fail(breaker, 2)
+    breaker.record(True)
+    _fail(breaker, 2)
+    assert breaker.state == "closed"
+    assert breaker.failures == 2
+    assert breaker.opened == 0
+
+
+def test_opens_after_consecutive_failures(breaker):
+    _fail(breaker, 3)
+
+    assert breaker.state == "open"
+    assert breaker.opened == 1
+    assert not breaker.available()
+    assert not breaker.allow()
+    assert not breaker.allow()
+    assert breaker.rejected == 2
+
+
+def test_half_open_lets_one_trial_through_and_closes_on_success(breaker, clock):
+    _fail(breaker, 3)
+    clock.now += 10.0
+
+    assert breaker.state == "half_open"
+    assert breaker.available()
+    assert breaker.allow()          # 시험 요청
+    assert not breaker.allow()      # 시험 요청이 끝날 때까지 나머지는 거절
+    assert breaker.state == "open"
+
+    breaker.record(True)
+    assert breaker.state == "closed"
+    assert breaker.failures == 0
+    assert breaker.allow()
+
+
+def test_failed_trial_reopens_for_another_cooldown(breaker, clock):
+    _fail(breaker, 3)
+    clock.now += 10.0
+    assert breaker.allow()
+    breaker.record(False)
+
+    assert breaker.state == "open"
+    assert breaker.opened == 1      # 다시 열린 것은 새로 연 횟수로 세지 않음
+    clock.now += 9.0
+    assert not breaker.allow()
+    clock.now += 1.0
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+
+
+def test_breaker_for_returns_one_breaker_per_host(monkeypatch):
+    monkeypatch.setattr(resilience, "_breakers", {})  # 전역 회로 목록에 테스트 호스트를 남기지 않음
+    assert resilience.breaker_for("a.test") is resilience.breaker_for("a.test")
+    assert resilience.breaker_for("a.test") is not resilience.breaker_for("b.test")
@@ -0,0 +1,66 @@
+from src import search_trie
+from src.search_trie import TitleTrie, search_key, to_jamo
+
+
+def _trie(*movies):
+    trie = TitleTrie()
+    trie.add([{"id": movie_id, "title": title, "original_title": original, "popularity": popularity}
+              for movie_id, title, original, popularity in movies])
+    return trie
+
+
+def _ids(movies):
+    return [movie.id for movie in movies]
+
+
+def test_to_jamo_splits_syllables_and_compounds():
+    assert to_jamo("기생충") == "ㄱㅣㅅㅐㅇㅊㅜㅇ"
+    assert to_jamo("닭") == "ㄷㅏㄹㄱ"      # 겹받침
+    assert to_jamo("괴물") == "ㄱㅗㅣㅁㅜㄹ"  # 겹모음
+    assert to_jamo("ㄳ") == "ㄱㅅ"
+    assert search_key("Spider-Man: 노 웨이 홈") == "spiderman" + to_jamo("노웨이홈")
+
+
+def test_partially_typed_syllables_match_prefix():
+    trie = _trie((1, "기생충", "Parasite", 50.0), (2, "기억의 밤", "Forgotten", 10.0), (3, "괴물", "The Host", 30.0))
+
+    assert _ids(trie.suggest("기")) == [1, 2]
+    assert _ids(trie.suggest("깃")) == [1]      # "기" + 받침 ㅅ을 입력하는 중
+    assert _ids(trie.suggest("기새")) == [1]    # "생"의 받침을 아직 입력하지 않음
+    assert _ids(trie.suggest("고")) == [3]      # "괴"의 첫 모음까지만 입력
+    assert _ids(trie.suggest("PARA")) == [1]
+    assert trie.suggest("기생충 2") == []
+    assert trie.suggest("  ") == []
+
+
+def test_words_inside_title_are_prefixes():
+    trie = _trie((1, "스파이더맨: 노 웨이 홈", "Spider-Man: No Way Home", 80.0))
+
+    assert _ids(trie.suggest("노 웨")) == [1]
+    assert _ids(trie.suggest("웨이홈")) == [1]
+    assert _ids(trie.suggest("way home")) == [1]
+    assert trie.suggest("이홈") == []  # 단어 중간부터는 일치하지 않음
+
+
+def test_results_are_by_popularity_and_capped(monkeypatch):
+    monkeypatch.setattr(search_trie, "NODE_TOP", 3)
+    trie = _trie(*[(i, f"가나 {i}", "", float(i)) for i in range(1, 6)])
+
+    assert _ids(trie.suggest("가")) == [5, 4, 3]
+    assert _ids(trie.suggest("가나", limit=2)) == [5, 4]
+
+
+def test_queries_longer_than_depth_are_filtered_by_full_key(monkeypatch):
+    monkeypatch.setattr(search_trie, "MAX_DEPTH", 4)
+    trie = _trie((1, "기생충", "", 50.0), (2, "기생수", "", 40.0))
+
+    assert _ids(trie.suggest("기생")) == [1, 2]
+    assert _ids(trie.suggest("기생충")) == [1]
+    assert _ids(trie.suggest("기생수")) == [2]
+
+
+def test_add_counts_only_new_movies():
+    trie = TitleTrie()
+    assert trie.add([{"id": 1, "title": "기생충"}, {"title": "ID 없음"}]) == 1
+    assert trie.add([{"id": 1, "title": "기생충"}, {"id": 2, "title": "괴물"}]) == 1
+    assert len(trie) == 2
@@ -0,0 +1,76 @@
+import os
+import random
+
+import numpy as np
+import pytest
+
+from src import recommender, similarity
+from src.catalog import ingest_records
+
+
+def _movies(ids, seed):
+    rng = random.Random(seed)
+    return [{
+        "id": movie_id,
+        "title": f"영화 {movie_id}",
+        "genre_ids": rng.sample(recommender.GENRE_IDS, 2),
+        "keyword_ids": rng.sample(range(1, 400), 4),
+        "cast_ids": rng.sample(range(1, 200), 3),
+    } for movie_id in ids]
+
+
+def _table(index_dir):
+    path = similarity._current_version_dir(index_dir)
+    return (np.load(os.path.join(path, "ids.npy")), np.load(os.path.join(path, "neighbors.npy")),
+            np.load(os.path.join(path, "scores.npy")).astype(np.float32))
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    path = str(tmp_path / "catalog.sqlite3")
+    ingest_records(_movies(range(1, 61), seed=1), path)
+    return path
+
+
+def test_keyword_columns_match_recommender():
+    movie = {"genre_ids": [], "keyword_ids": [12345], "cast_ids": []}
+    features = similarity.build_features([movie])
+    assert np.flatnonzero(features[0]).tolist() == [recommender.keyword_column(12345)]
+
+
+def test_update_index_matches_full_rebuild(tmp_path, catalog):
+    incremental, full = str(tmp_path / "incremental"), str(tmp_path / "full")
+    similarity.build_index(k=8, catalog_path=catalog, index_dir=incremental)
+    ingest_records(_movies(range(61, 81), seed=2), catalog)
+
+    assert similarity.update_index(catalog_path=catalog, index_dir=incremental) == 20
+    similarity.build_index(k=8, catalog_path=catalog, index_dir=full)
+
+    ids, neighbors, scores = _table(incremental)
+    full_ids, _, full_scores = _table(full)
+    assert ids.tolist() == full_ids.tolist() == list(range(1, 81))
+    # 점수가 같은 이웃은 순서가 달라질 수 있으므로 행마다 상위 k 점수를 비교
+    np.testing.assert_allclose(scores, full_scores, atol=2e-3)
+    assert not (neighbors == ids[:, None]).any()  # 자기 자신은 이웃이 아님
+    assert np.isin(neighbors[:60], np.arange(61, 81)).any()  # 기존 영화도 새 영화를 이웃으로 얻음
+
+
+def test_update_index_without_new_movies_keeps_version(tmp_path, catalog):
+    index_dir = str(tmp_path / "index")
+    similarity.build_index(k=8, catalog_path=catalog, index_dir=index_dir)
+    before = similarity._current_version_dir(index_dir)
+
+    assert similarity.update_index(catalog_path=catalog, index_dir=index_dir) == 0
+    assert similarity._current_version_dir(index_dir) == before
+
+
+def test_similarity_index_reads_published_version(tmp_path, catalog):
+    index_dir = str(tmp_path / "index")
+    similarity.build_index(k=8, catalog_path=catalog, index_dir=index_dir)
+    index = similarity.SimilarityIndex(index_dir)
+
+    page_ids, page_scores = index.neighbors(1, page=1, page_size=5)
+    assert len(page_ids) == 5
+    assert 1 not in page_ids.tolist()
+    assert list(page_scores) == sorted(page_scores, reverse=True)
+    assert index.neighbors(999) is None
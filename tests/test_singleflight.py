@@ -0,0 +1,110 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def work():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "result"
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("key", work)))
+    leader.start()
+    started.wait(5)
+    followers = [threading.Thread(target=lambda: results.append(flight.do("key", work))) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in [leader] + followers:
+        thread.join(5)
+
+    assert results == ["result"] * 4
+    assert len(calls) == 1
+    assert flight.stats() == {"executed": 1, "coalesced": 3, "in_flight": 0}
+
+
+def test_error_is_propagated_to_followers_and_not_cached():
+    flight = SingleFlight()
+
+    async def scenario():
+        gate = asyncio.Event()
+
+        async def failing():
+            await gate.wait()
+            raise ValueError("boom")
+
+        tasks = [asyncio.ensure_future(flight.do_async("key", failing)) for _ in range(3)]
+        await asyncio.sleep(0)
+        gate.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(result, ValueError) for result in results)
+
+        async def ok():
+            return 42
+
+        assert await flight.do_async("key", ok) == 42
+
+    asyncio.run(scenario())
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_cancelling_the_leader_does_not_cancel_followers():
+    flight = SingleFlight()
+
+    async def scenario():
+        gate = asyncio.Event()
+        executed = []
+
+        async def slow():
+            executed.append(1)
+            await gate.wait()
+            return "shared"
+
+        leader = asyncio.ensure_future(flight.do_async("key", slow))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do_async("key", slow))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        gate.set()
+
+        assert await follower == "shared"
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert executed == [1]
+
+    asyncio.run(scenario())
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_on_call_reports_executed_and_coalesced():
+    seen = []
+    flight = SingleFlight(on_call=lambda key, executed: seen.append((key, executed)))
+
+    async def scenario():
+        gate = asyncio.Event()
+
+        async def work():
+            await gate.wait()
+            return "result"
+
+        tasks = [asyncio.ensure_future(flight.do_async("key", work)) for _ in range(3)]
+        await asyncio.sleep(0)
+        gate.set()
+        return await asyncio.gather(*tasks)
+
+    assert asyncio.run(scenario()) == ["result"] * 3
+    assert seen == [("key", True), ("key", False), ("key", False)]